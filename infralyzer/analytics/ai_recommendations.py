@@ -15,6 +15,8 @@ class AIRecommendationAnalytics:
     Supports all endpoints for View 6: AI-Powered Cost Recommendations.
     """
     
+    __slots__ = ("engine", "config")
+    
     def __init__(self, engine: DuckDBEngine):
         """Initialize AI Recommendation Analytics with DuckDB engine."""
         self.engine = engine
@@ -150,11 +152,15 @@ class AIRecommendationAnalytics:
             print(f"Error detecting anomalies: {e}")
             return {"anomalies": [], "root_causes": [], "predictions": []}
     
-    def get_optimization_insights(self) -> Dict[str, Any]:
+    def get_optimization_insights(self, limit: Optional[int] = None) -> Dict[str, Any]:
         """
         AI-generated cost optimization recommendations.
         Endpoint: GET /api/v1/finops/ai/optimization-insights
         
+        Args:
+            limit: Maximum number of service insights to list, highest average spend first (None lists all);
+                   recommendations, benchmarks and pattern analysis always cover every service
+        
         Returns:
             AI insights with pattern recognition and industry benchmarks
         """
@@ -201,7 +207,7 @@ class AIRecommendationAnalytics:
         """
         
         try:
-            result = self.engine.query(sql)
+            result = self.engine.query(patterns_sql)
             insights = []
             
             for row in result.iter_rows(named=True):
@@ -231,7 +237,7 @@ class AIRecommendationAnalytics:
             pattern_summary = self._analyze_spending_patterns(insights)
             
             return {
-                "insights": insights,
+                "insights": insights[:limit],
                 "recommendations": self._generate_ai_recommendations(insights),
                 "benchmarks": benchmarks,
                 "pattern_analysis": pattern_summary
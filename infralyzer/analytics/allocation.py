@@ -2,6 +2,7 @@
 Cost Allocation Analytics - View 3: Cost Allocation & Tagging Management
 """
 import polars as pl
+import itertools
 import json
 from typing import Dict, Any, Optional, List
 from datetime import datetime
@@ -9,12 +10,50 @@ from datetime import datetime
 from ..engine.duckdb_engine import DuckDBEngine
 
 
+# Process-wide sequence that keeps rule IDs unique when several are created within one second
+_RULE_ID_COUNTER = itertools.count(1)
+
+
+def resource_tagging_sql(source: str) -> str:
+    """
+    This month's costed resource rows with their tagging status.
+    
+    Shared with FinOpsEngine's fused health-check query so its compliance score
+    always matches get_tagging_compliance.
+    
+    Args:
+        source: Table or CTE name holding CUR rows
+        
+    Returns:
+        SELECT statement to use as a CTE body
+    """
+    return f"""
+            SELECT 
+                line_item_resource_id,
+                product_servicecode,
+                line_item_unblended_cost,
+                CASE 
+                    WHEN resource_tags IS NULL OR resource_tags = '' THEN 'untagged'
+                    WHEN resource_tags LIKE '%Environment%' AND resource_tags LIKE '%Team%' THEN 'fully_tagged'
+                    WHEN resource_tags LIKE '%Environment%' OR resource_tags LIKE '%Team%' THEN 'partially_tagged'
+                    ELSE 'custom_tagged'
+                END as tagging_status,
+                resource_tags
+            FROM {source}
+            WHERE line_item_unblended_cost > 0
+                AND line_item_resource_id IS NOT NULL
+                AND DATE_TRUNC('month', line_item_usage_start_date) = DATE_TRUNC('month', CURRENT_DATE)
+    """
+
+
 class AllocationAnalytics:
     """
     Improve cost visibility through proper allocation and tagging governance.
     Supports all endpoints for View 3: Cost Allocation & Tagging Management.
     """
     
+    __slots__ = ("engine", "config")
+    
     def __init__(self, engine: DuckDBEngine):
         """Initialize Allocation Analytics with DuckDB engine."""
         self.engine = engine
@@ -130,23 +169,7 @@ class AllocationAnalytics:
             Tagging compliance metrics and untagged resources
         """
         sql = f"""
-        WITH resource_tagging AS (
-            SELECT 
-                line_item_resource_id,
-                product_servicecode,
-                line_item_unblended_cost,
-                CASE 
-                    WHEN resource_tags IS NULL OR resource_tags = '' THEN 'untagged'
-                    WHEN resource_tags LIKE '%Environment%' AND resource_tags LIKE '%Team%' THEN 'fully_tagged'
-                    WHEN resource_tags LIKE '%Environment%' OR resource_tags LIKE '%Team%' THEN 'partially_tagged'
-                    ELSE 'custom_tagged'
-                END as tagging_status,
-                resource_tags
-            FROM {self.config.table_name}
-            WHERE line_item_unblended_cost > 0
-                AND line_item_resource_id IS NOT NULL
-                AND DATE_TRUNC('month', line_item_usage_start_date) = DATE_TRUNC('month', CURRENT_DATE)
-        ),
+        WITH resource_tagging AS ({resource_tagging_sql(self.config.table_name)}),
         tagging_summary AS (
             SELECT 
                 tagging_status,
@@ -365,8 +388,9 @@ class AllocationAnalytics:
         created_rules = []
         total_affected_resources = 0
         
+        created_stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         for rule in rules:
-            rule_id = f"tag_rule_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            rule_id = f"tag_rule_{created_stamp}_{next(_RULE_ID_COUNTER)}"
             
             # Estimate affected resources based on rule criteria
             estimated_resources = self._estimate_rule_impact(rule)
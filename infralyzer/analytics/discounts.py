@@ -15,16 +15,22 @@ class DiscountAnalytics:
     Supports all endpoints for View 4: Private Discount Tracking & Negotiation.
     """
     
+    __slots__ = ("engine", "config")
+    
     def __init__(self, engine: DuckDBEngine):
         """Initialize Discount Analytics with DuckDB engine."""
         self.engine = engine
         self.config = engine.config
     
-    def get_current_agreements(self) -> Dict[str, Any]:
+    def get_current_agreements(self, limit: Optional[int] = None) -> Dict[str, Any]:
         """
         Track Reserved Instances, Savings Plans, EDP discounts.
         Endpoint: GET /api/v1/finops/discounts/current-agreements
         
+        Args:
+            limit: Maximum number of agreements to list, largest monthly cost first (None lists all);
+                   utilization, renewals and summary always cover every agreement
+        
         Returns:
             Current discount agreements with utilization and renewal info
         """
@@ -111,7 +117,7 @@ class DiscountAnalytics:
             renewals = self._generate_renewal_timeline(agreements)
             
             return {
-                "agreements": agreements,
+                "agreements": agreements[:limit],
                 "utilization": [utilization_summary],
                 "renewals": renewals,
                 "summary": {
@@ -18,6 +18,8 @@ class KPISummaryAnalytics:
     aggregated from all specialized KPI views for complete cost optimization insights.
     """
     
+    __slots__ = ("engine", "config")
+    
     def __init__(self, engine: DuckDBEngine):
         """
         Initialize KPI Summary Analytics with DuckDB engine.
@@ -65,12 +67,9 @@ class KPISummaryAnalytics:
             # Apply filters to the query
             filtered_sql = self._apply_filters(kpi_sql, billing_period, payer_account_id, linked_account_id, tags_filter)
             
-            # Execute the KPI query in the same connection with views
-            kpi_result = conn.execute(filtered_sql).fetchdf()
-            
-            # Convert to polars for consistency
-            import polars as pl
-            kpi_result_pl = pl.from_pandas(kpi_result)
+            # Execute the KPI query in the same connection with views, exporting
+            # straight to Polars (Arrow) rather than converting through pandas
+            kpi_result_pl = conn.execute(filtered_sql).pl()
             
             # Close the connection
             conn.close()
@@ -15,6 +15,8 @@ class MCPIntegrationAnalytics:
     Supports all endpoints for View 5: MCP Server Integration.
     """
     
+    __slots__ = ("engine", "config")
+    
     def __init__(self, engine: DuckDBEngine):
         """Initialize MCP Integration Analytics with DuckDB engine."""
         self.engine = engine
@@ -7,6 +7,41 @@ from datetime import datetime
 
 from ..engine.duckdb_engine import DuckDBEngine
 
+# Idle/underutilized resources considered per call, highest potential savings first
+IDLE_RESOURCES_MAX_ROWS = 50
+
+
+def resource_utilization_sql(source: str) -> str:
+    """
+    Per-resource cost and average utilization of this month's EC2, RDS and ELB usage.
+    
+    Shared with FinOpsEngine's fused health-check query so its idle count always
+    matches get_idle_resources.
+    
+    Args:
+        source: Table or CTE name holding CUR rows
+        
+    Returns:
+        SELECT statement to use as a CTE body
+    """
+    return f"""
+            SELECT 
+                line_item_resource_id as resource_id,
+                product_servicecode as service,
+                product_instance_type as instance_type,
+                SUM(line_item_unblended_cost) as monthly_cost,
+                COUNT(*) as usage_records,
+                AVG(CASE 
+                    WHEN line_item_usage_amount > 0 THEN line_item_usage_amount 
+                    ELSE 0 
+                END) as avg_utilization
+            FROM {source}
+            WHERE line_item_unblended_cost > 0
+                AND product_servicecode IN ('AmazonEC2', 'AmazonRDS', 'ElasticLoadBalancing')
+                AND DATE_TRUNC('month', line_item_usage_start_date) = DATE_TRUNC('month', CURRENT_DATE)
+            GROUP BY 1, 2, 3
+    """
+
 
 class OptimizationAnalytics:
     """
@@ -14,40 +49,28 @@ class OptimizationAnalytics:
     Supports all endpoints for View 2: Cost Optimization Intelligence.
     """
     
+    __slots__ = ("engine", "config")
+    
     def __init__(self, engine: DuckDBEngine):
         """Initialize Optimization Analytics with DuckDB engine."""
         self.engine = engine
         self.config = engine.config
     
-    def get_idle_resources(self, utilization_threshold: float = 5.0) -> Dict[str, Any]:
+    def get_idle_resources(self, utilization_threshold: float = 5.0, limit: Optional[int] = None) -> Dict[str, Any]:
         """
         Detect idle resources based on utilization patterns.
         Endpoint: GET /api/v1/finops/optimization/idle-resources
         
         Args:
             utilization_threshold: Utilization percentage threshold for idle detection
+            limit: Maximum number of resources to list, highest potential savings first
+                   (None lists all); totals and risk levels always cover every resource considered
             
         Returns:
             Idle resources with potential savings and risk assessment
         """
         sql = f"""
-        WITH resource_utilization AS (
-            SELECT 
-                line_item_resource_id as resource_id,
-                product_servicecode as service,
-                product_instance_type as instance_type,
-                SUM(line_item_unblended_cost) as monthly_cost,
-                COUNT(*) as usage_records,
-                AVG(CASE 
-                    WHEN line_item_usage_amount > 0 THEN line_item_usage_amount 
-                    ELSE 0 
-                END) as avg_utilization
-            FROM {self.config.table_name}
-            WHERE line_item_unblended_cost > 0
-                AND product_servicecode IN ('AmazonEC2', 'AmazonRDS', 'ElasticLoadBalancing')
-                AND DATE_TRUNC('month', line_item_usage_start_date) = DATE_TRUNC('month', CURRENT_DATE)
-            GROUP BY 1, 2, 3
-        )
+        WITH resource_utilization AS ({resource_utilization_sql(self.config.table_name)})
         SELECT 
             resource_id,
             service,
@@ -67,7 +90,7 @@ class OptimizationAnalytics:
         FROM resource_utilization
         WHERE avg_utilization < {utilization_threshold * 2}  -- Only show idle/underutilized
         ORDER BY potential_savings DESC
-        LIMIT 50
+        LIMIT {IDLE_RESOURCES_MAX_ROWS}
         """
         
         try:
@@ -93,7 +116,7 @@ class OptimizationAnalytics:
             risk_levels = self._calculate_risk_distribution(idle_resources)
             
             return {
-                "idle_resources": idle_resources,
+                "idle_resources": idle_resources[:limit],
                 "total_potential_savings": round(total_potential_savings, 2),
                 "risk_levels": risk_levels
             }
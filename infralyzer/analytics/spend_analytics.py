@@ -2,18 +2,26 @@
 Spend Analytics - View 1: Actual Spend Analysis and Trend Analysis
 """
 import polars as pl
+import itertools
+import os
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 
 from ..engine.duckdb_engine import DuckDBEngine
 
 
+# Process-wide sequence so export names never collide within the same second
+_EXPORT_COUNTER = itertools.count(1)
+
+
 class SpendAnalytics:
     """
     Real-time spend visibility and trend analysis for financial planning.
     Supports all endpoints for View 1: Actual Spend Analytics.
     """
     
+    __slots__ = ("engine", "config")
+    
     def __init__(self, engine: DuckDBEngine):
         """Initialize Spend Analytics with DuckDB engine."""
         self.engine = engine
@@ -322,11 +330,13 @@ class SpendAnalytics:
         
         try:
             result = self.engine.query(sql)
+            now = datetime.now()
+            export_name = f"spend_data_{now.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}_{next(_EXPORT_COUNTER)}"
             
             return {
-                "export_url": f"/exports/spend_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{format}",
+                "export_url": f"/exports/{export_name}.{format}",
                 "format": format,
-                "expires_at": (datetime.now() + timedelta(hours=24)).isoformat(),
+                "expires_at": (now + timedelta(hours=24)).isoformat(),
                 "record_count": result.shape[0],
                 "file_size_mb": round(result.estimated_size("mb"), 2) if hasattr(result, 'estimated_size') else 0
             }
@@ -2,9 +2,13 @@
 Shared AWS Authentication utilities for Infralyzer
 """
 import boto3
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from datetime import datetime, timezone
 
+# Number of distinct (service, credentials) boto3 clients kept alive for reuse
+BOTO3_CLIENT_CACHE_SIZE = 32
+
 
 def check_credential_expiration(expiration: Optional[str] = None):
     """Check if temporary credentials are expired or expiring soon."""
@@ -55,35 +59,15 @@ def get_boto3_client(service_name: str,
                      role_arn: Optional[str] = None,
                      external_id: Optional[str] = None):
     """Create boto3 client with enhanced authentication support."""
-    from botocore.exceptions import ClientError
-    
     # Method 1: Use AWS profile if specified
     if aws_profile:
         session = boto3.Session(profile_name=aws_profile)
         return session.client(service_name, region_name=aws_region)
     
-    # Method 2: Use role assumption if role_arn specified
+    # Method 2: Use role assumption if role_arn specified (credentials auto-refresh before expiry)
     if role_arn:
-        sts_client = boto3.client('sts')
-        assume_role_kwargs = {
-            'RoleArn': role_arn,
-            'RoleSessionName': 'infralyzer-session'
-        }
-        if external_id:
-            assume_role_kwargs['ExternalId'] = external_id
-            
-        try:
-            response = sts_client.assume_role(**assume_role_kwargs)
-            credentials = response['Credentials']
-            return boto3.client(
-                service_name,
-                region_name=aws_region,
-                aws_access_key_id=credentials['AccessKeyId'],
-                aws_secret_access_key=credentials['SecretAccessKey'],
-                aws_session_token=credentials['SessionToken']
-            )
-        except ClientError as e:
-            raise ValueError(f"Failed to assume role {role_arn}: {e}")
+        session = get_refreshable_session(role_arn, external_id=external_id, aws_region=aws_region)
+        return session.client(service_name, region_name=aws_region)
     
     # Method 3: Use explicit credentials (including session token)
     client_kwargs = {}
@@ -100,6 +84,96 @@ def get_boto3_client(service_name: str,
     return boto3.client(service_name, **client_kwargs)
 
 
+def get_refreshable_session(role_arn: str,
+                            external_id: Optional[str] = None,
+                            aws_region: Optional[str] = None) -> boto3.Session:
+    """
+    Get a boto3 session for an assumed role whose credentials refresh themselves.
+    
+    botocore re-assumes the role shortly before the temporary credentials
+    expire, so long-running engines never hit ExpiredToken mid-query.
+    Sessions are cached per role, external ID and region.
+    
+    Args:
+        role_arn: ARN of the role to assume
+        external_id: Optional external ID for the assume-role call
+        aws_region: Optional region for the session
+        
+    Returns:
+        boto3.Session backed by RefreshableCredentials
+        
+    Raises:
+        ValueError: If the initial role assumption fails
+    """
+    return _cached_refreshable_session(role_arn, external_id, aws_region)
+
+
+@lru_cache(maxsize=BOTO3_CLIENT_CACHE_SIZE)
+def _cached_refreshable_session(role_arn: str,
+                                external_id: Optional[str],
+                                aws_region: Optional[str]) -> boto3.Session:
+    """Assume the role once and wrap the credentials so botocore refreshes them."""
+    from botocore.credentials import RefreshableCredentials
+    from botocore.exceptions import ClientError
+    from botocore.session import get_session
+    
+    sts_client = boto3.client('sts')
+    assume_role_kwargs = {
+        'RoleArn': role_arn,
+        'RoleSessionName': 'infralyzer-session'
+    }
+    if external_id:
+        assume_role_kwargs['ExternalId'] = external_id
+    
+    def _refresh() -> Dict[str, str]:
+        credentials = sts_client.assume_role(**assume_role_kwargs)['Credentials']
+        return {
+            'access_key': credentials['AccessKeyId'],
+            'secret_key': credentials['SecretAccessKey'],
+            'token': credentials['SessionToken'],
+            'expiry_time': credentials['Expiration'].isoformat(),
+        }
+    
+    try:
+        refreshable_credentials = RefreshableCredentials.create_from_metadata(
+            metadata=_refresh(),
+            refresh_using=_refresh,
+            method='sts-assume-role'
+        )
+    except ClientError as e:
+        raise ValueError(f"Failed to assume role {role_arn}: {e}")
+    
+    botocore_session = get_session()
+    botocore_session._credentials = refreshable_credentials
+    if aws_region:
+        botocore_session.set_config_variable('region', aws_region)
+    return boto3.Session(botocore_session=botocore_session)
+
+
+@lru_cache(maxsize=BOTO3_CLIENT_CACHE_SIZE)
+def _cached_boto3_client(service_name: str, creds: frozenset):
+    """Build a boto3 client once per service and credentials set."""
+    return get_boto3_client(service_name, **dict(creds))
+
+
+def get_cached_boto3_client(service_name: str, **creds):
+    """
+    Get a boto3 client, reusing a previously built one for the same credentials.
+    
+    boto3 clients are thread-safe, so callers that ask for the same service
+    with the same credentials share one client instead of paying for a new
+    session, endpoint resolution and connection pool on every call.
+    
+    Args:
+        service_name: AWS service name (e.g. 's3')
+        **creds: Keyword arguments accepted by get_boto3_client
+        
+    Returns:
+        boto3 client
+    """
+    return _cached_boto3_client(service_name, frozenset(creds.items()))
+
+
 def get_storage_options(aws_region: Optional[str] = None,
                        aws_access_key_id: Optional[str] = None,
                        aws_secret_access_key: Optional[str] = None,
@@ -121,23 +195,14 @@ def get_storage_options(aws_region: Optional[str] = None,
     if aws_session_token:
         options['aws_session_token'] = aws_session_token
         
-    # For role assumption, get temporary credentials
+    # For role assumption, get temporary credentials (refreshed by the shared session when near expiry)
     if role_arn and not aws_access_key_id:
         try:
-            import boto3
-            sts_client = boto3.client('sts')
-            assume_role_kwargs = {
-                'RoleArn': role_arn,
-                'RoleSessionName': 'infralyzer-data-session'
-            }
-            if external_id:
-                assume_role_kwargs['ExternalId'] = external_id
-                
-            response = sts_client.assume_role(**assume_role_kwargs)
-            credentials = response['Credentials']
-            options['aws_access_key_id'] = credentials['AccessKeyId']
-            options['aws_secret_access_key'] = credentials['SecretAccessKey']
-            options['aws_session_token'] = credentials['SessionToken']
+            session = get_refreshable_session(role_arn, external_id=external_id, aws_region=aws_region)
+            credentials = session.get_credentials().get_frozen_credentials()
+            options['aws_access_key_id'] = credentials.access_key
+            options['aws_secret_access_key'] = credentials.secret_key
+            options['aws_session_token'] = credentials.token
         except Exception as e:
             print(f"Warning: Failed to get role credentials for data access: {e}")
             print("    Falling back to default credential chain...")
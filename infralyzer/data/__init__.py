@@ -6,10 +6,12 @@ from .s3_data_manager import S3DataManager
 from .local_data_manager import LocalDataManager
 from .data_downloader import DataDownloader
 from .aws_pricing_manager import AWSPricingManager
+from .data_partitioner import DataPartitioner
 
 __all__ = [
     "S3DataManager",
     "LocalDataManager", 
     "DataDownloader",
-    "AWSPricingManager"
+    "AWSPricingManager",
+    "DataPartitioner"
 ]
\ No newline at end of file
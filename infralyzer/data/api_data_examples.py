@@ -8,6 +8,9 @@ from pathlib import Path
 from ..engine.data_config import DataConfig
 from ..finops_engine import FinOpsEngine
 
+# Rows per parquet row group for exported tables (balances parallel scans and metadata size)
+EXPORT_PARQUET_ROW_GROUP_SIZE = 128_000
+
 
 class ApiDataExamples:
     """Examples and utilities for working with API data sources."""
@@ -392,9 +395,16 @@ class ApiDataExamples:
                 df = self.engine.query(f"SELECT * FROM {table_name}")
                 
                 if not df.is_empty():
-                    # Export as parquet (most efficient)
+                    # Export as parquet (most efficient); zstd with column statistics
+                    # keeps files small and lets readers skip row groups on predicates
                     parquet_file = output_dir / f"{table_name}.parquet"
-                    df.write_parquet(parquet_file)
+                    df.write_parquet(
+                        parquet_file,
+                        compression="zstd",
+                        compression_level=3,
+                        statistics=True,
+                        row_group_size=EXPORT_PARQUET_ROW_GROUP_SIZE
+                    )
                     
                     # Also export as CSV for broader compatibility
                     csv_file = output_dir / f"{table_name}.csv"
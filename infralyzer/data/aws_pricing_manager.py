@@ -4,16 +4,100 @@ Covers: On-Demand, Reserved Instances, Spot Instances, and Savings Plans
 Includes instance metadata and bulk pricing operations for frontend applications
 """
 import json
-from typing import List, Dict, Any, Optional, Literal
+from typing import List, Dict, Any, Optional, Literal, Union
 from datetime import datetime, timedelta
 import polars as pl
 import concurrent.futures
 import threading
 
+# Price List API returns every product as a JSON string; use orjson when available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from ..engine.data_config import DataConfig
 from ..auth import get_boto3_client
 
 
+# Explicit schemas so DataFrame construction skips dtype inference
+PRICING_MATRIX_SCHEMA = {
+    'region': pl.Utf8,
+    'instance_type': pl.Utf8,
+    'vcpu': pl.Utf8,
+    'memory': pl.Utf8,
+    'storage': pl.Utf8,
+    'network_performance': pl.Utf8,
+    'ondemand_hourly': pl.Float64,
+    'ondemand_monthly': pl.Float64,
+    'spot_hourly': pl.Float64,
+    'spot_savings_pct': pl.Float64,
+    'reserved_1yr_hourly': pl.Float64,
+    'reserved_1yr_savings_pct': pl.Float64,
+    'savings_plan_hourly': pl.Float64,
+    'savings_plan_savings_pct': pl.Float64
+}
+
+SPOT_PRICE_HISTORY_SCHEMA = {
+    'timestamp': pl.Utf8,
+    'availability_zone': pl.Utf8,
+    'instance_type': pl.Utf8,
+    'product_description': pl.Utf8,
+    'spot_price': pl.Float64
+}
+
+# Region code -> Pricing API location name
+_REGION_DISPLAY_NAMES = {
+    'us-east-1': 'US East (N. Virginia)',
+    'us-east-2': 'US East (Ohio)',
+    'us-west-1': 'US West (N. California)',
+    'us-west-2': 'US West (Oregon)',
+    'eu-west-1': 'Europe (Ireland)',
+    'eu-west-2': 'Europe (London)',
+    'eu-west-3': 'Europe (Paris)',
+    'eu-central-1': 'Europe (Frankfurt)',
+    'eu-north-1': 'Europe (Stockholm)',
+    'eu-south-1': 'Europe (Milan)',
+    'ap-northeast-1': 'Asia Pacific (Tokyo)',
+    'ap-northeast-2': 'Asia Pacific (Seoul)',
+    'ap-northeast-3': 'Asia Pacific (Osaka)',
+    'ap-southeast-1': 'Asia Pacific (Singapore)',
+    'ap-southeast-2': 'Asia Pacific (Sydney)',
+    'ap-south-1': 'Asia Pacific (Mumbai)',
+    'ap-east-1': 'Asia Pacific (Hong Kong)',
+    'ca-central-1': 'Canada (Central)',
+    'sa-east-1': 'South America (Sao Paulo)',
+    'me-south-1': 'Middle East (Bahrain)',
+    'af-south-1': 'Africa (Cape Town)'
+}
+
+# Usage type prefix -> region code (e.g. "APN1-DedicatedUsage:c6i.large")
+_REGION_CODE_MAP = {
+    'APN1': 'ap-northeast-1',
+    'USE1': 'us-east-1',
+    'USW2': 'us-west-2',
+    'EUW1': 'eu-west-1',
+    'NYC1': 'us-east-1',
+}
+
+SAVINGS_PLAN_RATE_SCHEMA = {
+    'usage_type': pl.Utf8,
+    'rate': pl.Utf8,
+    'offering_id': pl.Utf8,
+    'service_code': pl.Utf8,
+    'operation': pl.Utf8,
+    'properties': pl.List(pl.Struct({'name': pl.Utf8, 'value': pl.Utf8}))
+}
+
+
+def _offering_property(name: str) -> pl.Expr:
+    """Expression extracting one named value from the offering-rate properties column."""
+    return pl.col('properties').list.eval(
+        pl.element().filter(pl.element().struct.field('name') == name).struct.field('value')
+    ).list.first()
+
+
 class AWSPricingManager:
     """Unified AWS pricing manager for all pricing models."""
     
@@ -23,6 +107,9 @@ class AWSPricingManager:
         # AWS Pricing API is only available in us-east-1
         self._pricing_region = 'us-east-1'
         self._instance_metadata_cache = {}
+        self._savings_plan_rates_cache = None  # (fetched_at, DataFrame)
+        self._savings_plan_rates_max_age = timedelta(days=1)
+        self._savings_plan_rates_max_pages = 10
         self._cache_lock = threading.Lock()
         
     def _get_boto3_client(self, service_name: str):
@@ -35,30 +122,7 @@ class AWSPricingManager:
     
     def _get_region_display_name(self, region_code: str) -> str:
         """Convert region code to display name used by Pricing API."""
-        region_mappings = {
-            'us-east-1': 'US East (N. Virginia)',
-            'us-east-2': 'US East (Ohio)',
-            'us-west-1': 'US West (N. California)',
-            'us-west-2': 'US West (Oregon)',
-            'eu-west-1': 'Europe (Ireland)',
-            'eu-west-2': 'Europe (London)',
-            'eu-west-3': 'Europe (Paris)',
-            'eu-central-1': 'Europe (Frankfurt)',
-            'eu-north-1': 'Europe (Stockholm)',
-            'eu-south-1': 'Europe (Milan)',
-            'ap-northeast-1': 'Asia Pacific (Tokyo)',
-            'ap-northeast-2': 'Asia Pacific (Seoul)',
-            'ap-northeast-3': 'Asia Pacific (Osaka)',
-            'ap-southeast-1': 'Asia Pacific (Singapore)',
-            'ap-southeast-2': 'Asia Pacific (Sydney)',
-            'ap-south-1': 'Asia Pacific (Mumbai)',
-            'ap-east-1': 'Asia Pacific (Hong Kong)',
-            'ca-central-1': 'Canada (Central)',
-            'sa-east-1': 'South America (Sao Paulo)',
-            'me-south-1': 'Middle East (Bahrain)',
-            'af-south-1': 'Africa (Cape Town)'
-        }
-        return region_mappings.get(region_code, region_code)
+        return _REGION_DISPLAY_NAMES.get(region_code, region_code)
     
     # =============================================================================
     # INSTANCE METADATA
@@ -94,7 +158,7 @@ class AWSPricingManager:
             response = pricing_client.get_products(ServiceCode='AmazonEC2', Filters=filters, MaxResults=1)
             
             if response['PriceList']:
-                product_data = json.loads(response['PriceList'][0])
+                product_data = _json_loads(response['PriceList'][0])
                 attributes = product_data.get('product', {}).get('attributes', {})
                 
                 metadata = {
@@ -204,17 +268,10 @@ class AWSPricingManager:
                     'error': str(e)
                 }
         
-        # Use ThreadPoolExecutor for parallel processing
-        results = []
+        # Use ThreadPoolExecutor for parallel processing; map consumes instance_types
+        # directly instead of building a future -> instance lookup table
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_instance = {
-                executor.submit(get_instance_pricing, instance_type): instance_type 
-                for instance_type in instance_types
-            }
-            
-            for future in concurrent.futures.as_completed(future_to_instance):
-                result = future.result()
-                results.append(result)
+            results = list(executor.map(get_instance_pricing, instance_types))
         
         # Sort results by instance type for consistent ordering
         results.sort(key=lambda x: x['instance_type'])
@@ -241,10 +298,13 @@ class AWSPricingManager:
         
         print(f"Building pricing matrix for {len(instance_types)} instances across {len(regions)} regions...")
         
-        matrix_data = []
+        # One timestamp for the whole matrix, stored as a Datetime column
+        generated_at = datetime.now()
+        region_frames = []
         
         for region in regions:
             bulk_pricing = self.get_bulk_pricing_comparison(instance_types, region)
+            matrix_data = []
             
             for item in bulk_pricing:
                 if item['status'] == 'success' and item['pricing']:
@@ -265,12 +325,20 @@ class AWSPricingManager:
                         'reserved_1yr_hourly': pricing.get('reserved_1yr', {}).get('hourly_price'),
                         'reserved_1yr_savings_pct': pricing.get('reserved_1yr', {}).get('savings_vs_ondemand_pct'),
                         'savings_plan_hourly': pricing.get('savings_plan', {}).get('hourly_price'),
-                        'savings_plan_savings_pct': pricing.get('savings_plan', {}).get('savings_vs_ondemand_pct'),
-                        'timestamp': datetime.now().isoformat()
+                        'savings_plan_savings_pct': pricing.get('savings_plan', {}).get('savings_vs_ondemand_pct')
                     }
                     matrix_data.append(row)
+            
+            if matrix_data:
+                region_frames.append(pl.DataFrame(matrix_data, schema=PRICING_MATRIX_SCHEMA).lazy())
         
-        return pl.DataFrame(matrix_data)
+        if not region_frames:
+            return pl.DataFrame()
+        
+        # Concatenate per-region frames without rechunking into one contiguous buffer
+        return pl.concat(region_frames, how='vertical_relaxed', rechunk=False).with_columns(
+            pl.lit(generated_at).alias('timestamp')
+        ).collect()
     
     # =============================================================================
     # ON-DEMAND PRICING
@@ -308,7 +376,7 @@ class AWSPricingManager:
             response = pricing_client.get_products(ServiceCode='AmazonEC2', Filters=filters)
             
             for price_item in response['PriceList']:
-                price_data = json.loads(price_item)
+                price_data = _json_loads(price_item)
                 terms = price_data.get('terms', {}).get('OnDemand', {})
                 
                 for term_data in terms.values():
@@ -367,7 +435,7 @@ class AWSPricingManager:
             response = pricing_client.get_products(ServiceCode='AmazonEC2', Filters=filters)
             
             for price_item in response['PriceList']:
-                price_data = json.loads(price_item)
+                price_data = _json_loads(price_item)
                 terms = price_data.get('terms', {}).get('Reserved', {})
                 
                 for term_data in terms.values():
@@ -471,17 +539,20 @@ class AWSPricingManager:
                 MaxResults=1000
             )
             
+            # Bind hot callables as locals for the row loop (up to 1000 entries)
             history_data = []
+            append_row = history_data.append
+            to_float = float
             for entry in response['SpotPriceHistory']:
-                history_data.append({
+                append_row({
                     'timestamp': entry['Timestamp'].isoformat(),
                     'availability_zone': entry['AvailabilityZone'],
                     'instance_type': entry['InstanceType'],
                     'product_description': entry['ProductDescription'],
-                    'spot_price': float(entry['SpotPrice'])
+                    'spot_price': to_float(entry['SpotPrice'])
                 })
             
-            return pl.DataFrame(history_data)
+            return pl.DataFrame(history_data, schema=SPOT_PRICE_HISTORY_SCHEMA)
             
         except Exception as e:
             print(f"Error getting spot price history: {e}")
@@ -491,6 +562,117 @@ class AWSPricingManager:
     # SAVINGS PLANS
     # =============================================================================
     
+    def _get_savings_plan_rates_df(self, columns: Optional[List[str]] = None,
+                                   filters: Optional[pl.Expr] = None,
+                                   lazy: bool = False) -> Union[pl.DataFrame, pl.LazyFrame]:
+        """
+        Get parsed EC2 savings plan offering rates, optionally projected and filtered.
+        
+        Args:
+            columns: Columns to keep (all columns if None)
+            filters: Polars predicate applied before projection
+            lazy: Return a LazyFrame so callers can chain further operations
+                  before a single collect
+        
+        Returns:
+            Frame with usage_type, rate, offering_id, service_code, operation, properties,
+            instance_type, region, product_description and tenancy columns
+        """
+        rates_df = self._load_savings_plan_rates()
+        if not lazy and (rates_df.is_empty() or (columns is None and filters is None)):
+            return rates_df
+        
+        rates_lf = rates_df.lazy()
+        if filters is not None:
+            rates_lf = rates_lf.filter(filters)
+        if columns:
+            rates_lf = rates_lf.select(columns)
+        return rates_lf if lazy else rates_lf.collect()
+    
+    def _load_savings_plan_rates(self) -> pl.DataFrame:
+        """
+        Fetch EC2 savings plan offering rates and parse region/instance type.
+        Results are cached in memory for up to a day.
+        
+        Returns:
+            DataFrame with usage_type, rate, offering_id, service_code, operation, properties,
+            instance_type, region, product_description and tenancy columns
+        """
+        # Check cache first
+        with self._cache_lock:
+            if self._savings_plan_rates_cache is not None:
+                fetched_at, cached_df = self._savings_plan_rates_cache
+                if datetime.now() - fetched_at < self._savings_plan_rates_max_age:
+                    return cached_df
+        
+        savings_plans_client = self._get_boto3_client('savingsplans')
+        
+        # Build one small lazy frame per page so raw API records can be released as we go
+        page_frames = []
+        total_rows = 0
+        request_params = {'serviceCodes': ['AmazonEC2']}
+        
+        for _ in range(self._savings_plan_rates_max_pages):
+            response = savings_plans_client.describe_savings_plans_offering_rates(**request_params)
+            rates = response.get('searchResults', [])
+            
+            if rates:
+                total_rows += len(rates)
+                # Offering properties (region, instanceType, tenancy, ...) are kept as a native
+                # list-of-struct column so they can be filtered in Polars without JSON round-trips
+                page_frames.append(pl.LazyFrame({
+                    'usage_type': [rate.get('usageType', '') for rate in rates],
+                    'rate': [rate.get('rate', '0') for rate in rates],
+                    'offering_id': [rate.get('savingsPlanOffering', {}).get('offeringId', '') for rate in rates],
+                    'service_code': [rate.get('serviceCode', '') for rate in rates],
+                    'operation': [rate.get('operation', '') for rate in rates],
+                    'properties': [rate.get('properties', []) for rate in rates]
+                }, schema=SAVINGS_PLAN_RATE_SCHEMA))
+            
+            next_token = response.get('nextToken')
+            if not next_token:
+                break
+            request_params['nextToken'] = next_token
+        
+        if not page_frames:
+            # Typed empty frame so lookups and aggregations still resolve their columns
+            return pl.DataFrame(schema={
+                **SAVINGS_PLAN_RATE_SCHEMA,
+                'rate': pl.Float64,
+                'instance_type': pl.Utf8,
+                'region_code': pl.Utf8,
+                'region': pl.Utf8,
+                'product_description': pl.Utf8,
+                'tenancy': pl.Utf8
+            })
+        
+        print(f"Loaded {total_rows} savings plan offering rates")
+        
+        # Region and instance type come from the offering properties when present, falling
+        # back to parsing usage types like "BoxUsage:c5d.2xlarge" or
+        # "APN1-DedicatedUsage:c6i.large": instance type follows the first ':', region code
+        # is the '-'-separated prefix (unknown or missing prefixes default to us-east-1).
+        # The concat and parsing run as a single lazy plan, collected once.
+        rates_df = pl.concat(page_frames, rechunk=False).with_columns([
+            pl.col('usage_type').str.split(':').list.get(1, null_on_oob=True).alias('instance_type'),
+            pl.col('usage_type').str.extract(r'^([^:-]*)-', 1).alias('region_code'),
+            pl.col('rate').cast(pl.Float64, strict=False),
+            _offering_property('productDescription').alias('product_description'),
+            _offering_property('tenancy').alias('tenancy')
+        ]).with_columns([
+            pl.coalesce(
+                _offering_property('region'),
+                pl.col('region_code').replace_strict(_REGION_CODE_MAP, default='us-east-1')
+            ).alias('region'),
+            pl.coalesce(_offering_property('instanceType'), pl.col('instance_type')).alias('instance_type')
+        ]).collect()
+        
+        # Cache the result
+        with self._cache_lock:
+            self._savings_plan_rates_cache = (datetime.now(), rates_df)
+        
+        return rates_df
+    
     def get_savings_plan_rate(self, instance_type: str, region: str) -> Optional[float]:
         """
         Get savings plan offering rate for specific instance.
@@ -504,49 +686,77 @@ class AWSPricingManager:
             Hourly rate in USD from available offerings, or None if not found
         """
         try:
-            savings_plans_client = self._get_boto3_client('savingsplans')
+            matches = self._get_savings_plan_rates_df(
+                columns=['rate'],
+                filters=(pl.col('instance_type') == instance_type) & (pl.col('region') == region)
+            )
+            if matches.is_empty():
+                return None
             
-            response = savings_plans_client.describe_savings_plans_offering_rates(
-                serviceCodes=['AmazonEC2']
+            return matches.item(0, 'rate')
+            
+        except Exception as e:
+            print(f"Error getting savings plan rate: {e}")
+            return None
+    
+    def get_best_savings_plan_opportunities(self, instance_types: List[str],
+                                            regions: List[str]) -> pl.DataFrame:
+        """
+        Get the lowest savings plan rate for each region and instance type pair.
+        
+        Args:
+            instance_types: List of EC2 instance types
+            regions: List of AWS region codes
+        
+        Returns:
+            DataFrame with region, instance_type, savings_plan_rate, offering_id and
+            projected monthly/annual cost, sorted by savings_plan_rate
+        """
+        try:
+            rates_lf = self._get_savings_plan_rates_df(
+                columns=['region', 'instance_type', 'rate', 'offering_id'],
+                filters=pl.col('region').is_in(regions) & pl.col('instance_type').is_in(instance_types),
+                lazy=True
             )
             
-            rates = response.get('searchResults', [])
+            return rates_lf.group_by(['region', 'instance_type']).agg([
+                pl.col('rate').min().alias('savings_plan_rate'),
+                pl.col('offering_id').sort_by('rate').first()
+            ]).with_columns([
+                (pl.col('savings_plan_rate') * 24 * 30).alias('potential_monthly_cost'),
+                (pl.col('savings_plan_rate') * 24 * 365).alias('potential_annual_cost')
+            ]).sort('savings_plan_rate').collect()
             
-            for rate in rates:
-                usage_type = rate.get('usageType', '')
-                parsed_region = ''
-                parsed_instance_type = ''
-                
-                # Parse usage type like "BoxUsage:c5d.2xlarge" or "APN1-DedicatedUsage:c6i.large"
-                if ':' in usage_type:
-                    parts = usage_type.split(':')
-                    if len(parts) >= 2:
-                        parsed_instance_type = parts[1]
-                    
-                    # Extract region from prefix
-                    prefix = parts[0]
-                    if '-' in prefix:
-                        region_code = prefix.split('-')[0]
-                        region_map = {
-                            'APN1': 'ap-northeast-1',
-                            'USE1': 'us-east-1', 
-                            'USW2': 'us-west-2',
-                            'EUW1': 'eu-west-1',
-                            'NYC1': 'us-east-1',
-                        }
-                        parsed_region = region_map.get(region_code, 'us-east-1')
-                    else:
-                        parsed_region = 'us-east-1'
-                
-                # Check for match
-                if parsed_instance_type == instance_type and parsed_region == region:
-                    return float(rate.get('rate', '0'))
+        except Exception as e:
+            print(f"Error getting savings plan opportunities: {e}")
+            return pl.DataFrame()
+    
+    def get_savings_plan_rates_joinable(self) -> pl.DataFrame:
+        """
+        Get savings plan offering rates in the CUR-joinable aws_savings_plans_rates layout.
+        Join to CUR on instance_type -> product_instance_type and region -> product_region.
+        
+        Returns:
+            DataFrame with savings_plan_offering_id, service_code, usage_type, operation,
+            instance_type, region and rate columns
+        """
+        joinable_columns = ['offering_id', 'service_code', 'usage_type', 'operation',
+                            'instance_type', 'region', 'rate']
+        
+        try:
+            rates_df = self._get_savings_plan_rates_df()
+            if rates_df.is_empty():
+                return rates_df.select(joinable_columns).rename({'offering_id': 'savings_plan_offering_id'})
             
-            return None
+            return rates_df.lazy().select(joinable_columns).rename({
+                'offering_id': 'savings_plan_offering_id'
+            }).filter(
+                pl.col('instance_type').is_not_null()
+            ).collect()
             
         except Exception as e:
-            print(f"Error getting savings plan rate: {e}")
-            return None
+            print(f"Error getting joinable savings plan rates: {e}")
+            return pl.DataFrame()
     
     # =============================================================================
     # COMPARISON FUNCTIONS
@@ -0,0 +1,805 @@
+"""
+Data Partitioner - Run query library SQL files and persist results as parquet
+"""
+import hashlib
+import io
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Union, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import polars as pl
+from boto3.s3.transfer import TransferConfig
+
+from ..engine.data_config import DataConfig
+from ..engine.base_engine import QueryEngineFactory, QueryResultFormat
+from ..auth import get_boto3_client
+from ..logging_config import get_logger
+
+# Result cache keys are computed for every SQL file on each run; use xxhash when available
+try:
+    import xxhash
+
+    def _digest(data: bytes) -> str:
+        return xxhash.xxh3_64_hexdigest(data)
+except ImportError:
+    def _digest(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+# Parquet data page size limit (1 MB keeps pages small enough for selective reads)
+PARQUET_DATA_PAGE_SIZE = 1024 * 1024
+
+# Bytes read from the top of a SQL file when only its header comments are needed
+SQL_HEADER_BYTES = 2048
+
+# Default partition columns per query library category and table
+_PARTITION_STRATEGIES = MappingProxyType({
+    "analytics": MappingProxyType({
+        "amazon_athena": ["line_item_usage_account_id"],
+    }),
+    "compute": MappingProxyType({
+        "lambda": ["region", "usage_category"],
+    }),
+})
+
+# Date-like columns used to order rows inside partitions when no sort is given
+_DEFAULT_SORT_COLUMNS = (
+    "billing_period",
+    "usage_date",
+    "day_line_item_usage_start_date",
+    "line_item_usage_start_date",
+)
+
+# Header comments carrying query metadata, e.g. "-- Partitioning: billing_period"
+_META_RE = re.compile(r'^--\s*(Description|Partitioning|Output):\s*(.*)$', re.MULTILINE)
+
+# Concurrent S3 uploads when publishing a partitioned table
+S3_UPLOAD_MAX_WORKERS = 16
+
+# Seconds a computed source dataset fingerprint is reused across SQL file runs
+SOURCE_FINGERPRINT_TTL_SECONDS = 60
+
+# Concurrent object fetches when the query library lives on S3
+S3_LIBRARY_FETCH_MAX_WORKERS = 32
+
+# Extra partitions queued beyond the busy upload workers when streaming to S3
+PARTITION_UPLOAD_QUEUE_DEPTH = 4
+
+# Hive directory value for null partition keys (matches Polars' partitioned writer)
+HIVE_DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+# Multipart threshold/part size and per-object part concurrency for S3 uploads
+S3_MULTIPART_CHUNK_SIZE = 16 * 1024 * 1024
+S3_MULTIPART_MAX_CONCURRENCY = 16
+
+
+class DataPartitioner:
+    """Executes CUR query library SQL files and writes analytics tables to parquet."""
+
+    def __init__(self,
+                 config: DataConfig,
+                 engine_name: str = "duckdb",
+                 query_library_path: str = "cur2_query_library",
+                 output_path: str = "./analytics_output",
+                 compression: str = "zstd",
+                 compression_level: Optional[int] = 3,
+                 row_group_size: int = 512_000,
+                 target_bucket: Optional[str] = None,
+                 target_prefix: str = ""):
+        """
+        Initialize data partitioner with configuration.
+
+        Args:
+            config: DataConfig object describing the source CUR data
+            engine_name: Query engine used to execute SQL files ('duckdb', 'polars', 'athena')
+            query_library_path: Directory or s3://bucket/prefix URI containing the SQL query library
+            output_path: Local directory where parquet results are written
+            compression: Parquet compression codec
+            compression_level: Compression level for the codec (None uses the codec default)
+            row_group_size: Maximum rows per parquet row group
+            target_bucket: Optional S3 bucket that partitioned tables are uploaded to
+            target_prefix: Key prefix for uploaded tables in the target bucket
+        """
+        self.config = config
+        self.source_client = QueryEngineFactory.create_engine(engine_name, config)
+        self.query_library_uri = query_library_path if query_library_path.startswith("s3://") else None
+        self.query_library_path = Path(query_library_path)
+        self.output_path = Path(output_path)
+        self.compression = compression
+        self.compression_level = compression_level
+        self.row_group_size = row_group_size
+        self.target_bucket = target_bucket
+        self.target_prefix = target_prefix.strip('/')
+        self._sql_file_cache: Optional[Dict[str, List[str]]] = None
+        self._query_plan_cache: Dict[str, Tuple[str, Dict[str, str], Optional[List[str]]]] = {}
+        self._source_fingerprint: Optional[tuple] = None
+        self._source_fingerprint_lock = threading.Lock()
+        self._transfer_config = TransferConfig(
+            multipart_threshold=S3_MULTIPART_CHUNK_SIZE,
+            multipart_chunksize=S3_MULTIPART_CHUNK_SIZE,
+            max_concurrency=S3_MULTIPART_MAX_CONCURRENCY,
+            use_threads=True
+        )
+        self.logger = get_logger(f"infralyzer.{self.__class__.__name__}")
+
+    def _get_boto3_client(self, service_name: str):
+        """Get boto3 client using the configuration credentials"""
+        creds = self.config.get_aws_credentials()
+        return get_boto3_client(service_name, **creds)
+
+    def discover_sql_files(self) -> Dict[str, List[str]]:
+        """
+        Discover SQL files in the query library grouped by category folder.
+
+        The library is walked once and the result cached; call refresh_sql_files()
+        after adding or removing queries.
+
+        Returns:
+            Dictionary mapping category name to SQL file paths relative to the library
+        """
+        if self._sql_file_cache is not None:
+            return self._sql_file_cache
+
+        if self.query_library_uri:
+            self._sql_file_cache = self._discover_s3_sql_files()
+            return self._sql_file_cache
+
+        sql_files: Dict[str, List[str]] = {}
+
+        if not self.query_library_path.is_dir():
+            self.logger.warning("Query library not found: %s", self.query_library_path)
+            return sql_files
+
+        for sql_path in sorted(self.query_library_path.rglob("*.sql")):
+            relative_path = sql_path.relative_to(self.query_library_path)
+            category = relative_path.parts[0] if len(relative_path.parts) > 1 else "uncategorized"
+            sql_files.setdefault(category, []).append(relative_path.as_posix())
+
+        self._sql_file_cache = sql_files
+        return sql_files
+
+    def _discover_s3_sql_files(self) -> Dict[str, List[str]]:
+        """
+        List a query library stored on S3 and fetch every SQL file concurrently.
+
+        Contents are parsed into the query plan cache so later loads need no round trip.
+
+        Returns:
+            Dictionary mapping category name to SQL file paths relative to the library prefix
+        """
+        bucket, _, prefix = self.query_library_uri[len("s3://"):].partition('/')
+        prefix = f"{prefix.strip('/')}/" if prefix.strip('/') else ""
+
+        s3_client = self._get_boto3_client('s3')
+        paginator = s3_client.get_paginator('list_objects_v2')
+        sql_keys = [
+            obj['Key']
+            for page in paginator.paginate(Bucket=bucket, Prefix=prefix)
+            for obj in page.get('Contents', [])
+            if obj['Key'].endswith('.sql')
+        ]
+
+        def fetch(key: str) -> tuple:
+            body = s3_client.get_object(Bucket=bucket, Key=key)['Body'].read()
+            return key[len(prefix):], body.decode('utf-8')
+
+        with ThreadPoolExecutor(max_workers=S3_LIBRARY_FETCH_MAX_WORKERS) as executor:
+            contents = dict(executor.map(fetch, sql_keys))
+
+        sql_files: Dict[str, List[str]] = {}
+        for relative_path in sorted(contents):
+            parts = relative_path.split('/')
+            category = parts[0] if len(parts) > 1 else "uncategorized"
+            sql_files.setdefault(category, []).append(relative_path)
+
+        for relative_path, sql_content in contents.items():
+            self._query_plan_cache[relative_path] = self._build_query_plan(relative_path, sql_content)
+        self.logger.info("Loaded %d SQL files from %s", len(contents), self.query_library_uri)
+        return sql_files
+
+    def refresh_sql_files(self) -> Dict[str, List[str]]:
+        """Invalidate the cached query library listing and rediscover SQL files."""
+        self._sql_file_cache = None
+        self._query_plan_cache = {}
+        return self.discover_sql_files()
+
+    def _build_query_plan(self, sql_file_path: str, sql_content: str) -> Tuple[str, Dict[str, str], Optional[List[str]]]:
+        """Parse SQL content once into (sql, header metadata, default partition columns)."""
+        sql_path = Path(sql_file_path)
+        return (
+            sql_content,
+            self.extract_query_metadata(sql_content),
+            self._get_default_partition_columns(sql_path.parent.name, sql_path.stem)
+        )
+
+    def _get_query_plan(self, sql_file_path: str) -> Tuple[str, Dict[str, str], Optional[List[str]]]:
+        """
+        Get the parsed query plan for a SQL file, reading and parsing it at most once.
+
+        Args:
+            sql_file_path: Path to the SQL file
+
+        Returns:
+            Tuple of SQL content, header metadata and default partition columns
+        """
+        query_plan = self._query_plan_cache.get(sql_file_path)
+        if query_plan is None:
+            if self.query_library_uri:
+                self.discover_sql_files()
+                query_plan = self._query_plan_cache.get(sql_file_path)
+
+            if query_plan is None:
+                with open(self._resolve_sql_path(sql_file_path), 'r', encoding='utf-8') as file:
+                    query_plan = self._build_query_plan(sql_file_path, file.read())
+                self._query_plan_cache[sql_file_path] = query_plan
+
+        return query_plan
+
+    def load_sql_query(self, sql_file_path: str) -> str:
+        """
+        Load SQL content from a file in the query library.
+
+        Content is cached in the query plan cache; call refresh_sql_files() after editing queries.
+
+        Args:
+            sql_file_path: Path to the SQL file (absolute, relative, or relative to the library)
+
+        Returns:
+            SQL query string
+        """
+        return self._get_query_plan(sql_file_path)[0]
+
+    def _resolve_sql_path(self, sql_file_path: str) -> Path:
+        """Resolve a SQL file path as given or relative to the query library."""
+        sql_path = Path(sql_file_path)
+        if not sql_path.exists():
+            sql_path = self.query_library_path / sql_file_path
+        if not sql_path.exists():
+            raise FileNotFoundError(f"SQL file not found: {sql_file_path}")
+        return sql_path
+
+    @staticmethod
+    def extract_description_fast(sql_path: Path) -> Optional[str]:
+        """
+        Extract the '-- Description:' header comment by reading only the start of the file.
+
+        Args:
+            sql_path: Path to the SQL file
+
+        Returns:
+            Description text, or None if the header has no description
+        """
+        with open(sql_path, 'r', encoding='utf-8', errors='ignore') as file:
+            header = file.read(SQL_HEADER_BYTES)
+
+        return DataPartitioner.extract_query_metadata(header).get('description')
+
+    @staticmethod
+    def extract_query_metadata(sql_content: str) -> Dict[str, str]:
+        """
+        Extract Description, Partitioning and Output header comments from SQL content.
+
+        Args:
+            sql_content: SQL query text
+
+        Returns:
+            Dictionary keyed by lowercase metadata name
+        """
+        return {match.group(1).lower(): match.group(2).strip() for match in _META_RE.finditer(sql_content)}
+
+    def list_available_sql_files(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        List query library SQL files with their descriptions, grouped by category.
+
+        Returns:
+            Dictionary mapping category name to a list of file/description entries
+        """
+        available_files = {}
+
+        for category, sql_files in self.discover_sql_files().items():
+            available_files[category] = [
+                {
+                    "file": sql_file,
+                    "description": (
+                        self._query_plan_cache[sql_file][1].get('description')
+                        if sql_file in self._query_plan_cache
+                        else self.extract_description_fast(self.query_library_path / sql_file)
+                    )
+                }
+                for sql_file in sql_files
+            ]
+
+        return available_files
+
+    def _query_dataframe(self, sql_content: str) -> pl.DataFrame:
+        """Execute SQL on the source engine and return the result as a Polars DataFrame."""
+        if hasattr(self.source_client, 'query_polars'):
+            # DuckDB exports straight to Polars without an intermediate Arrow table
+            return self.source_client.query_polars(sql_content)
+        return pl.from_arrow(self.source_client.query(sql_content, format=QueryResultFormat.ARROW))
+
+    def _s3_key(self, *parts: str) -> str:
+        """Build an S3 key under the configured target prefix."""
+        return "/".join(part for part in (self.target_prefix, *parts) if part)
+
+    def _parquet_write_options(self) -> Dict[str, Any]:
+        """Parquet writer options shared by local, partitioned and S3 outputs."""
+        return dict(
+            compression=self.compression,
+            compression_level=self.compression_level,
+            statistics=True,
+            row_group_size=self.row_group_size,
+            data_page_size=PARQUET_DATA_PAGE_SIZE
+        )
+
+    @staticmethod
+    def _reorder_small_first(dataframe: pl.DataFrame) -> pl.DataFrame:
+        """
+        Order columns by in-memory size so small columns are contiguous in the parquet file.
+
+        Readers can then fetch many small columns with one coalesced range request.
+        """
+        column_sizes = {column: dataframe[column].estimated_size() for column in dataframe.columns}
+        return dataframe.select(sorted(dataframe.columns, key=column_sizes.get))
+
+    def _compute_source_fingerprint(self) -> str:
+        """Hash the source data file listing (size/mtime locally, ETag on S3)."""
+        if self.config.prefer_local_data and self.source_client.has_local_data():
+            from .local_data_manager import LocalDataManager
+            entries = []
+            for file_path in LocalDataManager(self.config).discover_data_files():
+                file_stat = os.stat(file_path)
+                entries.append(f"{file_path}:{file_stat.st_size}:{file_stat.st_mtime_ns}")
+        else:
+            s3_client = self._get_boto3_client('s3')
+            paginator = s3_client.get_paginator('list_objects_v2')
+            entries = [
+                f"{obj['Key']}:{obj['ETag']}"
+                for page in paginator.paginate(Bucket=self.config.s3_bucket, Prefix=f"{self.config.s3_data_prefix}/")
+                for obj in page.get('Contents', [])
+            ]
+
+        return _digest("\n".join(entries).encode())
+
+    def _get_source_fingerprint(self) -> Optional[str]:
+        """Get the source dataset fingerprint, reusing a recent one across SQL file runs."""
+        with self._source_fingerprint_lock:
+            if self._source_fingerprint is not None:
+                computed_at, fingerprint = self._source_fingerprint
+                if time.monotonic() - computed_at < SOURCE_FINGERPRINT_TTL_SECONDS:
+                    return fingerprint
+
+            try:
+                fingerprint = self._compute_source_fingerprint()
+            except Exception as e:
+                self.logger.warning("Could not fingerprint source data, result cache disabled: %s", e)
+                return None
+
+            self._source_fingerprint = (time.monotonic(), fingerprint)
+            return fingerprint
+
+    def _result_cache_key(self, sql_content: str) -> Optional[str]:
+        """
+        Cache key for a query result.
+
+        Covers the SQL text, the source dataset fingerprint, and everything else that
+        shapes the written parquet: the engine's date range filter, the table name the
+        SQL reads from, and the parquet writer options.
+        """
+        fingerprint = self._get_source_fingerprint()
+        if fingerprint is None:
+            return None
+        settings = (
+            self.config.date_start,
+            self.config.date_end,
+            self.config.table_name,
+            sorted(self._parquet_write_options().items())
+        )
+        return _digest("\n".join((sql_content, fingerprint, repr(settings))).encode())
+
+    def run_sql_file(self,
+                     sql_file_path: str,
+                     output_name: Optional[str] = None,
+                     force: bool = False) -> Dict[str, Any]:
+        """
+        Execute a single SQL file and save its result as parquet.
+
+        Local outputs get a '.cache' sidecar holding the result cache key; when the
+        SQL and source data are unchanged the execution is skipped.
+
+        Args:
+            sql_file_path: Path to the SQL file
+            output_name: Output file name without extension (defaults to the SQL file stem)
+            force: Re-execute even if a cached result is current
+
+        Returns:
+            Dictionary with execution status, row count and output path
+        """
+        output_name = output_name or Path(sql_file_path).stem
+
+        try:
+            sql_content = self.load_sql_query(sql_file_path)
+
+            self.logger.info("Running %s", sql_file_path)
+
+            if self.target_bucket:
+                result = self._query_dataframe(sql_content)
+                column_count = len(result.columns)
+                row_count = len(result)
+                s3_key = self._s3_key(f"{output_name}.parquet")
+                size_bytes = self._save_to_s3(result, s3_key)
+                output_location = f"s3://{self.target_bucket}/{s3_key}"
+                self.logger.info("Uploaded %d rows to %s (%.1f MB)", row_count, output_location,
+                                 size_bytes / (1024 * 1024))
+            else:
+                output_file = self.output_path / f"{output_name}.parquet"
+                cache_file = Path(f"{output_file}.cache")
+                cache_key = self._result_cache_key(sql_content)
+
+                if (not force and cache_key and output_file.exists() and cache_file.exists()
+                        and cache_file.read_text() == cache_key):
+                    self.logger.info("Skipping %s: cached result is current", sql_file_path)
+                    cached_result = pl.scan_parquet(output_file)
+                    return {
+                        "status": "success",
+                        "cached": True,
+                        "rows": cached_result.select(pl.len()).collect().item(),
+                        "columns": cached_result.collect_schema().len(),
+                        "output_path": str(output_file)
+                    }
+
+                if hasattr(self.source_client, 'query_lazy'):
+                    # Stream the plan straight to parquet without materializing the result
+                    result = self.source_client.query_lazy(sql_content)
+                    column_count = result.collect_schema().len()
+                    self._save_to_parquet(result, output_file)
+                    row_count = pl.scan_parquet(output_file).select(pl.len()).collect().item()
+                else:
+                    result = self._query_dataframe(sql_content)
+                    column_count = len(result.columns)
+                    row_count = len(result)
+                    self._save_to_parquet(result, output_file)
+
+                if cache_key:
+                    cache_file.write_text(cache_key)
+                output_location = str(output_file)
+
+            return {
+                "status": "success",
+                "rows": row_count,
+                "columns": column_count,
+                "output_path": output_location
+            }
+
+        except Exception as e:
+            self.logger.error("Error running %s: %s", sql_file_path, e)
+            return {"status": "error", "error": str(e)}
+
+    def run_sql_files(self,
+                      sql_file_paths: List[str],
+                      max_workers: int = 4,
+                      force: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Execute multiple SQL files, overlapping their I/O across a thread pool.
+
+        Each worker issues its own engine query. The DuckDB engine runs every
+        query on its own cursor of a shared, cached connection, so workers never
+        share a cursor.
+
+        Args:
+            sql_file_paths: List of SQL file paths to execute
+            max_workers: Maximum number of concurrent executions (1 runs sequentially)
+            force: Re-execute every file even if its cached result is current
+
+        Returns:
+            Dictionary mapping each SQL file path to its execution result
+        """
+        results = {}
+
+        if max_workers <= 1 or len(sql_file_paths) <= 1:
+            for sql_file_path in sql_file_paths:
+                results[sql_file_path] = self.run_sql_file(sql_file_path, force=force)
+        else:
+            results_lock = threading.Lock()
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_path = {
+                    executor.submit(self.run_sql_file, sql_file_path, force=force): sql_file_path
+                    for sql_file_path in sql_file_paths
+                }
+
+                for future in as_completed(future_to_path):
+                    sql_file_path = future_to_path[future]
+                    with results_lock:
+                        results[sql_file_path] = future.result()
+
+        successful = sum(1 for result in results.values() if result.get("status") == "success")
+        self.logger.info("Completed %d/%d SQL files", successful, len(sql_file_paths))
+
+        return results
+
+    def create_analytics_table(self,
+                               sql_file_path: str,
+                               table_name: Optional[str] = None,
+                               partition_columns: Optional[List[str]] = None,
+                               sort_within_partition: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Execute a SQL file and write its result as a Hive-partitioned analytics table.
+
+        Rows are sorted within each partition so parquet min/max page statistics
+        let downstream readers skip pages on common filter columns.
+
+        Args:
+            sql_file_path: Path to the SQL file
+            table_name: Output table directory name (defaults to the SQL file stem)
+            partition_columns: Columns to partition by (None uses the category default, or
+                a single parquet file when there is none)
+            sort_within_partition: Columns to sort rows by inside each partition (None guesses
+                from the query's '-- Partitioning:' header or well-known date columns)
+
+        Returns:
+            Dictionary with execution status, row count and partition count
+        """
+        table_name = table_name or Path(sql_file_path).stem
+
+        try:
+            sql_content, metadata, default_partition_columns = self._get_query_plan(sql_file_path)
+
+            if partition_columns is None:
+                partition_columns = default_partition_columns
+
+            if not partition_columns:
+                return self.run_sql_file(sql_file_path, output_name=table_name)
+
+            self.logger.info("Creating analytics table %s from %s", table_name, sql_file_path)
+            result = self._query_dataframe(sql_content)
+
+            missing_columns = [col for col in partition_columns if col not in result.columns]
+            if missing_columns:
+                raise ValueError(f"Partition columns not found in query result: {missing_columns}")
+
+            if sort_within_partition is None:
+                sort_within_partition = self._guess_sort_columns(metadata, result.columns, partition_columns)
+
+            partition_count = self._create_partitioned_table(
+                result, table_name, partition_columns, sort_within_partition
+            )
+
+            return {
+                "status": "success",
+                "rows": len(result),
+                "columns": len(result.columns),
+                "partitions": partition_count,
+                "output_path": (
+                    f"s3://{self.target_bucket}/{self._s3_key(table_name)}"
+                    if self.target_bucket else str(self.output_path / table_name)
+                )
+            }
+
+        except Exception as e:
+            self.logger.error("Error creating analytics table %s: %s", table_name, e)
+            return {"status": "error", "error": str(e)}
+
+    def export_source_subset(self, output_name: str, predicate: pl.Expr) -> Dict[str, Any]:
+        """
+        Write the rows of the source table matching a predicate to a local parquet file.
+
+        Engines that expose scan() stream the filter straight to disk; others fall back
+        to querying the full table and filtering in memory.
+
+        Args:
+            output_name: Output file name without extension
+            predicate: Polars expression selecting the rows to keep,
+                e.g. pl.col('product_servicecode') == 'AmazonS3'
+
+        Returns:
+            Dictionary with execution status, row count and output path
+        """
+        output_file = self.output_path / f"{output_name}.parquet"
+
+        try:
+            if hasattr(self.source_client, 'scan'):
+                self._save_to_parquet(self.source_client.scan().filter(predicate), output_file)
+            else:
+                source = self._query_dataframe(f"SELECT * FROM {self.config.table_name}")
+                self._save_to_parquet(source.filter(predicate), output_file)
+
+            return {
+                "status": "success",
+                "rows": pl.scan_parquet(output_file).select(pl.len()).collect().item(),
+                "output_path": str(output_file)
+            }
+
+        except Exception as e:
+            self.logger.error("Error exporting source subset %s: %s", output_name, e)
+            return {"status": "error", "error": str(e)}
+
+    def create_analytics_from_category(self, category: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Create analytics tables for every SQL file in a query library category.
+
+        Args:
+            category: Query library category folder name
+
+        Returns:
+            Dictionary mapping each SQL file path to its table creation result
+        """
+        sql_files = self.discover_sql_files().get(category, [])
+        if not sql_files:
+            self.logger.warning("No SQL files found for category: %s", category)
+            return {}
+
+        return {sql_file: self.create_analytics_table(sql_file) for sql_file in sql_files}
+
+    @staticmethod
+    def _get_default_partition_columns(category: str, table_name: str) -> Optional[List[str]]:
+        """Get the default partition columns for a library query, if one is defined."""
+        return _PARTITION_STRATEGIES.get(category, {}).get(table_name)
+
+    @staticmethod
+    def _guess_sort_columns(metadata: Dict[str, str],
+                            columns: List[str],
+                            partition_columns: List[str]) -> List[str]:
+        """Pick in-partition sort columns from query metadata, else well-known date columns."""
+        candidates = [col.strip() for col in metadata.get('partitioning', '').split(',') if col.strip()]
+        candidates = candidates or list(_DEFAULT_SORT_COLUMNS)
+        return [col for col in candidates if col in columns and col not in partition_columns]
+
+    def _create_partitioned_table(self,
+                                  dataframe: pl.DataFrame,
+                                  table_name: str,
+                                  partition_columns: List[str],
+                                  sort_within_partition: Optional[List[str]] = None) -> int:
+        """
+        Write the table as Hive-style partitions, locally or to the target S3 bucket.
+
+        Local tables use Polars' native partitioned writer; S3 tables are sorted by
+        the partition columns and streamed partition by partition so serialization
+        overlaps with uploads.
+
+        Args:
+            dataframe: Query result to partition
+            table_name: Output table directory name
+            partition_columns: Columns to partition by
+            sort_within_partition: Columns to sort rows by inside each partition
+
+        Returns:
+            Number of partitions written
+        """
+        if sort_within_partition or self.target_bucket:
+            # Partition keys lead the sort so each partition's rows come out ordered
+            # (and contiguous, which the S3 upload relies on)
+            dataframe = dataframe.sort(partition_columns + (sort_within_partition or []), maintain_order=True)
+
+        if self.target_bucket:
+            return self._upload_partitions_to_s3(dataframe, table_name, partition_columns)
+
+        table_path = self.output_path / table_name
+        if table_path.exists():
+            # Drop partitions from a previous run so stale files are not counted
+            shutil.rmtree(table_path)
+        table_path.mkdir(parents=True, exist_ok=True)
+
+        self._reorder_small_first(dataframe).write_parquet(
+            table_path,
+            partition_by=partition_columns,
+            **self._parquet_write_options()
+        )
+
+        partition_files = sorted(table_path.rglob("*.parquet"))
+        partition_count = len({file.parent for file in partition_files})
+        self.logger.info("Wrote %d partitions (%d files) for %s", partition_count, len(partition_files), table_name)
+
+        return partition_count
+
+    def _upload_partitions_to_s3(self,
+                                 dataframe: pl.DataFrame,
+                                 table_name: str,
+                                 partition_columns: List[str]) -> int:
+        """
+        Stream partitions to the target S3 bucket with serialization and uploads pipelined.
+
+        Each partition is a zero-copy slice of the sorted result, cut only when the
+        producer reaches it, and handed to a pool of upload workers largest first (LPT
+        order) so long uploads start early. A semaphore caps the partitions in flight so
+        serialized buffers never pile up faster than they can be uploaded.
+
+        Args:
+            dataframe: Query result sorted by the partition columns
+            table_name: Table name used as the key prefix under target_prefix
+            partition_columns: Columns to partition by
+
+        Returns:
+            Number of partitions uploaded
+        """
+        # One (offset, length) row per partition; rows of a partition are contiguous after the sort
+        partition_runs = (
+            dataframe.select(partition_columns)
+            .with_row_index("__partition_offset")
+            .group_by(partition_columns, maintain_order=True)
+            .agg(pl.col("__partition_offset").first(), pl.len().alias("__partition_rows"))
+            .sort("__partition_rows", descending=True, maintain_order=True)
+        )
+        key_prefix = self._s3_key(table_name)
+        in_flight = threading.Semaphore(S3_UPLOAD_MAX_WORKERS + PARTITION_UPLOAD_QUEUE_DEPTH)
+        s3_client = self._get_boto3_client('s3')
+
+        def upload(s3_key: str, partition_data: pl.DataFrame) -> int:
+            try:
+                return self._save_to_s3(partition_data, s3_key, s3_client)
+            finally:
+                in_flight.release()
+
+        total_bytes = 0
+        failed_uploads = []
+        with ThreadPoolExecutor(max_workers=S3_UPLOAD_MAX_WORKERS) as executor:
+            future_to_key = {}
+
+            for *key, offset, length in partition_runs.iter_rows():
+                partition_path = "/".join(
+                    f"{col}={HIVE_DEFAULT_PARTITION if value is None else value}"
+                    for col, value in zip(partition_columns, key)
+                )
+                s3_key = f"{key_prefix}/{partition_path}/00000000.parquet"
+
+                in_flight.acquire()
+                future_to_key[executor.submit(upload, s3_key, dataframe.slice(offset, length))] = s3_key
+
+            for future in as_completed(future_to_key):
+                try:
+                    total_bytes += future.result()
+                except Exception as e:
+                    failed_uploads.append((future_to_key[future], str(e)))
+
+        self.logger.info("Uploaded %d/%d partitions for %s to s3://%s/%s/ (%.1f MB)",
+                         len(future_to_key) - len(failed_uploads), len(future_to_key), table_name,
+                         self.target_bucket, key_prefix, total_bytes / (1024 * 1024))
+        if failed_uploads:
+            raise RuntimeError(f"Failed to upload {len(failed_uploads)} partitions, first error: {failed_uploads[0][1]}")
+
+        return len(future_to_key)
+
+    def _save_to_parquet(self, dataframe: Union[pl.DataFrame, pl.LazyFrame], output_path: Path) -> None:
+        """Write a DataFrame, or stream a LazyFrame, to a local parquet file."""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        write_options = self._parquet_write_options()
+
+        if isinstance(dataframe, pl.LazyFrame):
+            dataframe.sink_parquet(output_path, **write_options)
+        else:
+            self._reorder_small_first(dataframe).write_parquet(output_path, **write_options)
+
+        # The size lookup is an extra stat syscall, only worth paying when the message is emitted
+        if self.logger.isEnabledFor(logging.INFO):
+            rows_label = "streamed result" if isinstance(dataframe, pl.LazyFrame) else f"{len(dataframe):,} rows"
+            self.logger.info("Saved %s to %s (%.1f MB)", rows_label, output_path,
+                             output_path.stat().st_size / (1024 * 1024))
+
+    def _save_to_s3(self, dataframe: pl.DataFrame, s3_key: str, s3_client=None) -> int:
+        """
+        Serialize a DataFrame to parquet in memory and upload it to the target bucket.
+
+        Args:
+            dataframe: DataFrame to upload
+            s3_key: Destination object key
+            s3_client: Optional S3 client to reuse across many uploads
+
+        Returns:
+            Size of the uploaded object in bytes
+        """
+        buffer = io.BytesIO()
+        self._reorder_small_first(dataframe).write_parquet(buffer, **self._parquet_write_options())
+        size_bytes = buffer.tell()
+        buffer.seek(0)
+
+        # Objects above the multipart threshold are uploaded as parallel parts
+        s3_client = s3_client or self._get_boto3_client('s3')
+        s3_client.upload_fileobj(buffer, self.target_bucket, s3_key, Config=self._transfer_config)
+
+        return size_bytes
@@ -2,11 +2,15 @@
 S3 Data Manager - Handle S3 data discovery and access
 """
 import re
-from typing import List, Optional
+import time
+from typing import List, Optional, Tuple
 from pathlib import Path
 
 from ..engine.data_config import DataConfig
-from ..auth import get_boto3_client
+from ..auth import get_cached_boto3_client
+
+# Seconds a partition listing is reused before S3 is listed again
+PARTITION_LIST_TTL_SECONDS = 60.0
 
 
 class S3DataManager:
@@ -15,11 +19,12 @@ class S3DataManager:
     def __init__(self, config: DataConfig):
         """Initialize S3 data manager with configuration."""
         self.config = config
+        self._partitions_cache: Optional[Tuple[float, List[str]]] = None
     
     def _get_boto3_client(self, service_name: str):
         """Get boto3 client using the configuration credentials"""
         creds = self.config.get_aws_credentials()
-        return get_boto3_client(service_name, **creds)
+        return get_cached_boto3_client(service_name, **creds)
     
     def discover_data_files(self) -> List[str]:
         """
@@ -69,6 +74,11 @@ class S3DataManager:
         Returns:
             List of partition names (e.g., ['billing_period=2025-01', 'billing_period=2025-02'])
         """
+        if self._partitions_cache is not None:
+            listed_at, cached_partitions = self._partitions_cache
+            if time.monotonic() - listed_at < PARTITION_LIST_TTL_SECONDS:
+                return list(cached_partitions)
+        
         s3_client = self._get_boto3_client('s3')
         
         try:
@@ -92,7 +102,8 @@ class S3DataManager:
             partitions.sort()
             print(f"Found {len(partitions)} partitions: {partitions[:5]}{'...' if len(partitions) > 5 else ''}")
             
-            return partitions
+            self._partitions_cache = (time.monotonic(), partitions)
+            return list(partitions)
             
         except Exception as e:
             print(f"Error listing partitions: {e}")
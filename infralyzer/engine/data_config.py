@@ -1,9 +1,12 @@
 """
 Data configuration and export type definitions
 """
+import os
+import re
 from enum import Enum
+from types import MappingProxyType
 from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 class DataExportType(Enum):
@@ -15,20 +18,26 @@ class DataExportType(Enum):
 
 
 # AWS Data Export type partition format mapping
-DATA_EXPORT_PARTITION_FORMATS = {
+DATA_EXPORT_PARTITION_FORMATS = MappingProxyType({
     DataExportType.FOCUS_1_0: 'billing_period',      # lowercase for FOCUS 1.0 (monthly: billing_period=YYYY-MM)
     DataExportType.CUR_2_0: 'BILLING_PERIOD',        # uppercase for CUR 2.0 (monthly: BILLING_PERIOD=YYYY-MM)
     DataExportType.COH: 'date',                       # Cost Optimization Hub (daily: date=YYYY-MM-DD)
     DataExportType.CARBON_EMISSION: 'BILLING_PERIOD' # uppercase for Carbon Emissions (monthly: BILLING_PERIOD=YYYY-MM)
-}
+})
 
 # Date format requirements by export type
-DATA_EXPORT_DATE_FORMATS = {
+DATA_EXPORT_DATE_FORMATS = MappingProxyType({
     DataExportType.FOCUS_1_0: 'YYYY-MM',            # Monthly partitions
     DataExportType.CUR_2_0: 'YYYY-MM',              # Monthly partitions  
     DataExportType.COH: 'YYYY-MM-DD',               # Daily partitions
     DataExportType.CARBON_EMISSION: 'YYYY-MM'       # Monthly partitions
-}
+})
+
+# Table names are spliced into SQL as identifiers, so restrict them to plain identifiers
+TABLE_NAME_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# Accepted DuckDB memory_limit values, e.g. '4GB', '512MB', '1.5GiB'
+DUCKDB_MEMORY_LIMIT_PATTERN = re.compile(r'^\d+(\.\d+)?\s*(B|KB|MB|GB|TB|KiB|MiB|GiB|TiB)$', re.IGNORECASE)
 
 
 @dataclass
@@ -57,6 +66,16 @@ class DataConfig:
     pricing_api_instance_types: Optional[List[str]] = None
     savings_plans_include_rates: bool = True
     
+    # DuckDB tuning (None keeps DuckDB's defaults: all cores, 80% of RAM)
+    duckdb_threads: Optional[int] = None
+    duckdb_memory_limit: Optional[str] = None
+    # Persistent DuckDB database (one file per data source, e.g. cache_local.duckdb) instead of :memory:
+    duckdb_cache_path: Optional[str] = None
+    # Byte budget for the in-process S3 byte-range cache (0 disables remote range caching)
+    range_cache_bytes: int = 256 * 1024 * 1024
+    # Warm the current month's S3 data in a background thread when FinOpsEngine is created
+    prefetch_on_init: bool = False
+    
     # AWS Authentication
     aws_region: Optional[str] = None
     aws_access_key_id: Optional[str] = None
@@ -67,6 +86,10 @@ class DataConfig:
     external_id: Optional[str] = None
     expiration: Optional[str] = None
     
+    # Derived from data_export_type in __post_init__
+    partition_format: str = field(init=False, repr=False)
+    date_format: str = field(init=False, repr=False)
+    
     def __post_init__(self):
         """Validate and normalize configuration"""
         # Normalize data export type
@@ -77,30 +100,42 @@ class DataConfig:
                 valid_types = [e.value for e in DataExportType]
                 raise ValueError(f"Invalid data_export_type '{self.data_export_type}'. Must be one of: {valid_types}")
         
+        # Resolve export-type specific formats once
+        self.partition_format = DATA_EXPORT_PARTITION_FORMATS[self.data_export_type]
+        self.date_format = DATA_EXPORT_DATE_FORMATS[self.data_export_type]
+        
+        # Validate table name
+        if not isinstance(self.table_name, str) or not TABLE_NAME_PATTERN.match(self.table_name):
+            raise ValueError(f"Invalid table_name '{self.table_name}'. Use letters, digits and underscores, not starting with a digit")
+        
+        # Validate DuckDB tuning options
+        if self.duckdb_threads is not None:
+            if isinstance(self.duckdb_threads, bool) or not isinstance(self.duckdb_threads, int) or self.duckdb_threads < 1:
+                raise ValueError(f"Invalid duckdb_threads '{self.duckdb_threads}'. Must be a positive integer")
+        
+        if self.duckdb_memory_limit is not None:
+            if not DUCKDB_MEMORY_LIMIT_PATTERN.match(str(self.duckdb_memory_limit).strip()):
+                raise ValueError(f"Invalid duckdb_memory_limit '{self.duckdb_memory_limit}'. Use a size such as '4GB' or '512MB'")
+            self.duckdb_memory_limit = str(self.duckdb_memory_limit).strip()
+        
+        if isinstance(self.range_cache_bytes, bool) or not isinstance(self.range_cache_bytes, int) or self.range_cache_bytes < 0:
+            raise ValueError(f"Invalid range_cache_bytes '{self.range_cache_bytes}'. Must be a non-negative integer")
+        
         # Clean S3 prefix
         self.s3_data_prefix = self.s3_data_prefix.rstrip('/')
         
         # Set local data path if provided
         if self.local_data_path:
-            import os
             self.local_data_path = os.path.abspath(self.local_data_path)
-    
-    @property
-    def partition_format(self) -> str:
-        """Get partition format for this data export type"""
-        return DATA_EXPORT_PARTITION_FORMATS[self.data_export_type]
-    
-    @property
-    def date_format(self) -> str:
-        """Get expected date format for this data export type"""
-        return DATA_EXPORT_DATE_FORMATS[self.data_export_type]
+        
+        if self.duckdb_cache_path:
+            self.duckdb_cache_path = os.path.abspath(self.duckdb_cache_path)
     
     @property
     def local_bucket_path(self) -> Optional[str]:
         """Get local path that mirrors S3 bucket structure"""
         if not self.local_data_path:
             return None
-        import os
         return os.path.join(self.local_data_path, self.s3_bucket, self.s3_data_prefix)
     
     def get_aws_credentials(self) -> Dict[str, Any]:
@@ -4,16 +4,43 @@ DuckDB Engine - Core SQL execution and data management without Polars conversion
 import duckdb
 import pandas as pd
 import pyarrow as pa
+import pyarrow.dataset as pa_ds
+import pyarrow.fs as pa_fs
+import pyarrow.parquet as pq
+import polars as pl
 import os
 import io
+import hashlib
+import logging
+import posixpath
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Tuple
 from datetime import datetime
 
 from .base_engine import BaseQueryEngine, QueryResultFormat
 from .data_config import DataConfig
-from ..auth import check_credential_expiration, get_boto3_client, get_storage_options
+from ..auth import check_credential_expiration, get_cached_boto3_client, get_storage_options
 from ..data.aws_pricing_manager import AWSPricingManager
+from .range_cache import CachingFileSystemHandler, get_shared_range_cache
+
+
+# Rows per record batch when streaming results that DuckDB cannot export to Polars natively
+POLARS_FETCH_BATCH_ROWS = 1_000_000
+
+# Table in a persistent DuckDB cache that records which file set the views were built from
+DUCKDB_META_TABLE = "_infralyzer_meta"
+
+# Minimum S3 file count before footers are prefetched in parallel at registration
+METADATA_PREWARM_MIN_FILES = 16
+
+# Seconds a has_local_data() answer is reused before the local cache is scanned again
+HAS_LOCAL_DATA_TTL_SECONDS = 5.0
+
+# Seconds a discovered data file list is reused before S3 / the local mirror is listed again
+DATA_FILE_LIST_TTL_SECONDS = 60.0
 
 
 class DuckDBEngine(BaseQueryEngine):
@@ -28,6 +55,26 @@ class DuckDBEngine(BaseQueryEngine):
         super().__init__(config)
         self._data = None
         
+        # Cached connections keyed by data source ("local" / "s3") and the
+        # fingerprint of what is currently registered on each of them
+        self._connections: Dict[str, duckdb.DuckDBPyConnection] = {}
+        self._registered_fingerprints: Dict[str, tuple] = {}
+        self._conn_lock = threading.Lock()
+        self._finalizer = weakref.finalize(self, DuckDBEngine._close_connections, self._connections)
+        
+        # Resolved lazily and reused across queries
+        self._storage_options: Optional[Dict[str, str]] = None
+        self._s3_session_token: Optional[str] = None
+        self._has_local_cache: Optional[Tuple[float, bool]] = None
+        # Per source: (listed_at, (date_start, date_end), data files)
+        self._data_file_lists: Dict[str, Tuple[float, tuple, List[str]]] = {}
+        self._pricing_manager: Optional[AWSPricingManager] = None
+        self._api_tables: Dict[str, pa.Table] = {}
+        self._fallback_datasets: Dict[str, pa_ds.Dataset] = {}
+        self._api_register_state: Optional[Tuple[float, Tuple[bool, bool]]] = None
+        self._s3_data_manager = None
+        self._local_data_manager = None
+        
         # Check credential expiration if provided
         if config.expiration:
             check_credential_expiration(config.expiration)
@@ -45,32 +92,222 @@ class DuckDBEngine(BaseQueryEngine):
         return True
     
     def _get_boto3_client(self, service_name: str):
-        """Get boto3 client using the configuration credentials"""
+        """Get boto3 client using the configuration credentials (cached per credentials set)"""
         creds = self.config.get_aws_credentials()
-        return get_boto3_client(service_name, **creds)
+        return get_cached_boto3_client(service_name, **creds)
     
     def _get_storage_options(self) -> Dict[str, str]:
-        """Get storage options for S3 access."""
-        creds = self.config.get_aws_credentials()
-        return get_storage_options(**creds)
+        """Get storage options for S3 access (resolved once per engine)."""
+        # Assumed-role credentials rotate; read them from the refreshable session each time
+        if self._storage_options is None or self.config.role_arn:
+            creds = self.config.get_aws_credentials()
+            self._storage_options = get_storage_options(**creds)
+        return self._storage_options
+    
+    @property
+    def _s3_manager(self):
+        """S3 data manager, created on first use."""
+        if self._s3_data_manager is None:
+            from ..data.s3_data_manager import S3DataManager
+            self._s3_data_manager = S3DataManager(self.config)
+        return self._s3_data_manager
     
-    def _get_duckdb_connection(self) -> duckdb.DuckDBPyConnection:
+    @property
+    def _local_manager(self):
+        """Local data manager, created on first use."""
+        if self._local_data_manager is None:
+            from ..data.local_data_manager import LocalDataManager
+            self._local_data_manager = LocalDataManager(self.config)
+        return self._local_data_manager
+    
+    def _get_duckdb_connection(self, database: str = ":memory:") -> duckdb.DuckDBPyConnection:
         """Create and configure a DuckDB connection with S3 support."""
-        conn = duckdb.connect(":memory:")
+        conn = duckdb.connect(database)
         
         # Load S3 extension
         try:
             conn.execute("LOAD httpfs")
+            # Reuse S3 connections across ranged GETs
+            conn.execute("SET http_keep_alive=true")
         except Exception as e:
-            print(f"Warning: Could not load httpfs extension: {e}")
+            self.logger.warning("Could not load httpfs extension: %s", e)
         
         # Configure S3 credentials
         self._configure_duckdb_s3(conn)
+        self._configure_duckdb_settings(conn)
         
         return conn
     
+    def _configure_duckdb_settings(self, conn: duckdb.DuckDBPyConnection) -> None:
+        """Apply performance settings: parquet metadata caching, parallelism and memory."""
+        settings = [
+            # Keep parquet footers/statistics in memory across queries
+            # (enable_object_cache on older DuckDB, parquet_metadata_cache on newer)
+            "SET enable_object_cache=true",
+            "SET parquet_metadata_cache=true",
+            # Reuse HTTP HEAD results (file sizes, ETags) across S3 scans
+            "SET enable_http_metadata_cache=true",
+            # Cache byte ranges of remote parquet files in DuckDB's buffer pool
+            f"SET enable_external_file_cache={'true' if self.config.range_cache_bytes > 0 else 'false'}",
+            "SET preserve_insertion_order=false",
+            f"SET threads={self.config.duckdb_threads or os.cpu_count() or 1}",
+        ]
+        if self.config.duckdb_memory_limit:
+            settings.append(f"SET memory_limit='{self.config.duckdb_memory_limit}'")
+        
+        # Apply individually: not every setting exists in every DuckDB version
+        for setting in settings:
+            try:
+                conn.execute(setting)
+            except Exception as e:
+                self.logger.warning("Could not apply DuckDB setting '%s': %s", setting, e)
+    
+    def _prewarm_parquet_metadata(self, conn: duckdb.DuckDBPyConnection, file_count: int) -> None:
+        """
+        Read every parquet footer of the registered view once, in parallel.
+        
+        COUNT(*) over parquet is answered from footers alone, and DuckDB spreads
+        the files across its worker threads, so this fills the metadata cache
+        with one round of concurrent range reads instead of serial fetches
+        during the first real query's planning.
+        
+        Args:
+            conn: DuckDB connection or cursor with the main view registered
+            file_count: Number of files backing the view
+        """
+        if file_count < METADATA_PREWARM_MIN_FILES:
+            return
+        
+        try:
+            start = time.perf_counter()
+            conn.execute(f"SELECT COUNT(*) FROM {self.config.table_name}").fetchall()
+            self.logger.info("Prefetched parquet metadata for %d files in %.2fs", file_count, time.perf_counter() - start)
+        except Exception as e:
+            self.logger.warning("Could not prefetch parquet metadata: %s", e)
+    
+    @staticmethod
+    def _close_connections(connections: Dict[str, duckdb.DuckDBPyConnection]) -> None:
+        """Close every cached DuckDB connection (used as the GC finalizer)."""
+        for conn in connections.values():
+            try:
+                conn.close()
+            except Exception:
+                pass
+        connections.clear()
+    
+    def close(self) -> None:
+        """Close cached DuckDB connections and forget registered tables."""
+        with self._conn_lock:
+            self._close_connections(self._connections)
+            self._registered_fingerprints.clear()
+    
+    def _get_cached_connection(self, use_local_data: bool, data_files: List[str]) -> duckdb.DuckDBPyConnection:
+        """
+        Return the cached connection for a data source, registering tables only when needed.
+        
+        Args:
+            use_local_data: Whether the local mirror is being queried
+            data_files: Data files that should back the main table
+            
+        Returns:
+            DuckDB connection with the data and API tables registered
+        """
+        source = "local" if use_local_data else "s3"
+        fingerprint = (
+            use_local_data,
+            tuple(data_files),
+            self.config.enable_pricing_api,
+            self.config.enable_savings_plans_api,
+        )
+        
+        database = self._database_path(source)
+        persisted_key = self._persisted_fingerprint_key(fingerprint) if database != ":memory:" else None
+        
+        conn = self._connections.get(source)
+        if conn is None:
+            if use_local_data:
+                conn = duckdb.connect(database)
+                self._configure_duckdb_settings(conn)
+            else:
+                conn = self._get_duckdb_connection(database)
+            self._connections[source] = conn
+            
+            # A persistent database may already hold the view for this exact file set
+            if persisted_key and self._read_persisted_fingerprint(conn) == persisted_key:
+                self.logger.info("Reusing %s view from DuckDB cache %s", source, database)
+                self._register_api_data_with_duckdb(conn)
+                self._registered_fingerprints[source] = fingerprint
+        elif not use_local_data and self.config.role_arn:
+            # Re-issue S3 credentials when the assumed role has been refreshed
+            if self._get_storage_options().get('aws_session_token') != self._s3_session_token:
+                self.logger.info("Refreshing DuckDB S3 credentials for assumed role")
+                self._configure_duckdb_s3(conn)
+        
+        if self._registered_fingerprints.get(source) != fingerprint:
+            # The file set changed, so a cached schema may be stale
+            self._schema_cache = None
+            if use_local_data:
+                self._register_local_data_with_duckdb(conn, data_files)
+            else:
+                self._register_data_with_duckdb(conn, data_files)
+            
+            # Register API data tables (Pricing and Savings Plans)
+            self._register_api_data_with_duckdb(conn)
+            self._registered_fingerprints[source] = fingerprint
+            
+            # Only native parquet views persist; pyarrow fallbacks live in this process
+            if persisted_key and ("local" if use_local_data else "S3") not in self._fallback_datasets:
+                self._write_persisted_fingerprint(conn, persisted_key)
+        
+        return conn
+    
+    def _database_path(self, source: str) -> str:
+        """
+        DuckDB database for a data source: in-memory, or a per-source file under duckdb_cache_path.
+        
+        Args:
+            source: "local" or "s3"
+            
+        Returns:
+            ":memory:" or a database file path such as 'cache_local.duckdb'
+        """
+        if not self.config.duckdb_cache_path:
+            return ":memory:"
+        base, ext = os.path.splitext(self.config.duckdb_cache_path)
+        return f"{base}_{source}{ext or '.duckdb'}"
+    
+    def _persisted_fingerprint_key(self, fingerprint: tuple) -> str:
+        """Digest of everything the persisted view depends on."""
+        view_inputs = (fingerprint, self.config.table_name, self.config.date_start,
+                       self.config.date_end, self.config.partition_format)
+        return hashlib.blake2b(repr(view_inputs).encode(), digest_size=16).hexdigest()
+    
+    def _read_persisted_fingerprint(self, conn: duckdb.DuckDBPyConnection) -> Optional[str]:
+        """Read the view fingerprint stored in a persistent database, if any."""
+        try:
+            row = conn.execute(
+                f"SELECT value FROM {DUCKDB_META_TABLE} WHERE key = 'view_fingerprint'"
+            ).fetchone()
+            return row[0] if row else None
+        except Exception:
+            return None
+    
+    def _write_persisted_fingerprint(self, conn: duckdb.DuckDBPyConnection, key: str) -> None:
+        """Record which file set the persisted view was built from."""
+        try:
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {DUCKDB_META_TABLE} (key VARCHAR PRIMARY KEY, value VARCHAR)")
+            conn.execute(f"INSERT OR REPLACE INTO {DUCKDB_META_TABLE} VALUES ('view_fingerprint', ?)", [key])
+        except Exception as e:
+            self.logger.warning("Could not record DuckDB cache metadata: %s", e)
+    
     def _configure_duckdb_s3(self, conn: duckdb.DuckDBPyConnection) -> None:
         """Configure DuckDB for S3 access with AWS credentials."""
+        # Without explicit keys or a role to assume, let DuckDB resolve (and refresh)
+        # credentials from the AWS provider chain itself
+        if not self.config.aws_access_key_id and not self.config.role_arn:
+            if self._create_credential_chain_secret(conn):
+                return
+        
         storage_options = self._get_storage_options()
         
         # Set AWS region
@@ -86,113 +323,364 @@ class DuckDBEngine(BaseQueryEngine):
         
         if 'aws_session_token' in storage_options:
             conn.execute(f"SET s3_session_token='{storage_options['aws_session_token']}'")
+        
+        self._s3_session_token = storage_options.get('aws_session_token')
+    
+    def _create_credential_chain_secret(self, conn: duckdb.DuckDBPyConnection) -> bool:
+        """
+        Create a DuckDB S3 secret backed by the AWS credential provider chain.
+        
+        Args:
+            conn: DuckDB connection to create the secret on
+            
+        Returns:
+            True if the secret was created, False to fall back to static settings
+        """
+        secret_params = ["TYPE S3", "PROVIDER credential_chain"]
+        if self.config.aws_profile:
+            secret_params.append(f"PROFILE '{self.config.aws_profile}'")
+        if self.config.aws_region:
+            secret_params.append(f"REGION '{self.config.aws_region}'")
+        
+        try:
+            conn.execute(f"CREATE OR REPLACE SECRET infralyzer_s3 ({', '.join(secret_params)})")
+            return True
+        except Exception as e:
+            self.logger.warning("Could not create credential_chain secret, using static credentials: %s", e)
+            return False
     
     def _discover_data_files(self) -> List[str]:
         """Discover available data files in S3 based on configuration."""
-        from ..data.s3_data_manager import S3DataManager
-        s3_manager = S3DataManager(self.config)
-        return s3_manager.discover_data_files()
+        return self._s3_manager.discover_data_files()
     
     def _discover_local_data_files(self) -> List[str]:
         """Discover available local data files."""
-        from ..data.local_data_manager import LocalDataManager
-        local_manager = LocalDataManager(self.config)
-        return local_manager.discover_data_files()
+        return self._local_manager.discover_data_files()
+    
+    def _list_data_files(self, use_local_data: bool) -> List[str]:
+        """
+        Return the data files for a source, memoized for DATA_FILE_LIST_TTL_SECONDS.
+        
+        Repeat queries on a cached connection then skip the S3 listing (or local
+        glob) that only feeds the registration fingerprint. Empty listings are
+        not cached, and a date range change lists again.
+        
+        Args:
+            use_local_data: Whether to list the local mirror instead of S3
+            
+        Returns:
+            List of data file paths or S3 URIs
+        """
+        source = "local" if use_local_data else "s3"
+        scope = (self.config.date_start, self.config.date_end)
+        cached = self._data_file_lists.get(source)
+        if cached is not None:
+            listed_at, cached_scope, cached_files = cached
+            if cached_scope == scope and time.monotonic() - listed_at < DATA_FILE_LIST_TTL_SECONDS:
+                return cached_files
+        
+        data_files = self._discover_local_data_files() if use_local_data else self._discover_data_files()
+        if data_files:
+            self._data_file_lists[source] = (time.monotonic(), scope, data_files)
+        else:
+            self._data_file_lists.pop(source, None)
+        return data_files
+    
+    def refresh_data_files(self) -> None:
+        """Forget memoized data file listings so the next query discovers files again."""
+        self._data_file_lists.clear()
+        self._has_local_cache = None
     
     def has_local_data(self) -> bool:
-        """Check if local data is available."""
+        """Check if local data is available (memoized for HAS_LOCAL_DATA_TTL_SECONDS)."""
         if not self.config.local_data_path or not self.config.local_bucket_path:
             return False
         
+        if self._has_local_cache is not None:
+            checked_at, available = self._has_local_cache
+            if time.monotonic() - checked_at < HAS_LOCAL_DATA_TTL_SECONDS:
+                return available
+        
         try:
             local_files = self._discover_local_data_files()
-            return len(local_files) > 0
+            available = len(local_files) > 0
         except Exception:
-            return False
+            available = False
+        
+        self._has_local_cache = (time.monotonic(), available)
+        return available
     
-    def _register_data_with_duckdb(self, conn: duckdb.DuckDBPyConnection) -> None:
-        """Register S3 data with DuckDB for SQL queries."""
-        print("Registering S3 data with DuckDB...")
+    def download_data_locally(self, overwrite: bool = False, show_progress: bool = True) -> None:
+        """Download S3 data to local storage and invalidate the local-data check and file listings."""
+        try:
+            super().download_data_locally(overwrite=overwrite, show_progress=show_progress)
+        finally:
+            self.refresh_data_files()
+    
+    def _create_parquet_view(self, conn: duckdb.DuckDBPyConnection, data_files: List[str]) -> None:
+        """
+        Create the main table as a view over parquet files instead of copying rows into DuckDB.
         
-        # Get S3 file paths
-        data_files = self._discover_data_files()
+        Args:
+            conn: DuckDB connection to create the view on
+            data_files: Parquet file paths (local or s3://)
+        """
+        data_files = sorted(set(data_files))
+        partition_filter = self._partition_filter(data_files)
+        glob_path = self._data_files_glob(data_files, partition_filter)
         
-        if not data_files:
-            raise ValueError("No data files found in S3. Check your S3 bucket, prefix, and date filters.")
+        # Relational API: paths are passed as values, never spliced into SQL text.
+        # A single glob keeps the scan description constant-size regardless of file count.
+        # hive_partitioning exposes partition directories (BILLING_PERIOD=..., date=...)
+        # as filterable columns; union_by_name tolerates schema drift across months
+        relation = conn.from_parquet(glob_path or data_files, hive_partitioning=True, union_by_name=True)
+        if partition_filter:
+            relation = relation.filter(partition_filter)
+        relation.create_view(self.config.table_name, replace=True)
+    
+    def _data_files_glob(self, data_files: List[str], partition_filter: str) -> Optional[str]:
+        """
+        Collapse the discovered files into a single recursive glob when that is equivalent.
         
-        print(f"Found {len(data_files)} data files")
+        The glob covers every parquet file under the files' common directory. That
+        only matches the discovered set when discovery was not date-filtered, or
+        when the date filter is re-applied on the hive partition column.
         
-        # Create table from S3 files
-        if len(data_files) == 1:
-            s3_path = data_files[0]
-            conn.execute(f"CREATE OR REPLACE TABLE {self.config.table_name} AS SELECT * FROM read_parquet('{s3_path}')")
-        else:
-            # Multiple files - use array syntax
-            s3_paths = "['" + "', '".join(data_files) + "']"
-            conn.execute(f"CREATE OR REPLACE TABLE {self.config.table_name} AS SELECT * FROM read_parquet({s3_paths})")
+        Args:
+            data_files: Sorted, de-duplicated parquet file paths
+            partition_filter: Partition predicate applied to the view
+            
+        Returns:
+            Glob such as 's3://bucket/prefix/**/*.parquet', or None to list files explicitly
+        """
+        if len(data_files) < 2 or not all(path.endswith('.parquet') for path in data_files):
+            return None
+        
+        date_filtered = bool(self.config.date_start or self.config.date_end)
+        if date_filtered and not partition_filter:
+            return None
+        
+        scheme = "s3://" if data_files[0].startswith("s3://") else ""
+        if any(path.startswith("s3://") != bool(scheme) for path in data_files):
+            return None
         
-        print(f"S3 data registered as table '{self.config.table_name}' in DuckDB")
+        root = posixpath.commonpath([path[len(scheme):] for path in data_files]) if scheme \
+            else os.path.commonpath(data_files)
+        # The common directory must sit inside the configured data location
+        data_root = (f"{self.config.s3_bucket}/{self.config.s3_data_prefix}" if scheme
+                     else self.config.local_bucket_path)
+        if not data_root or not (root == data_root or root.startswith(data_root.rstrip('/') + '/')):
+            return None
+        
+        return f"{scheme}{root}/**/*.parquet"
     
-    def _register_local_data_with_duckdb(self, conn: duckdb.DuckDBPyConnection) -> None:
-        """Register local data with DuckDB for SQL queries."""
-        print("Registering local data with DuckDB...")
+    def _partition_filter(self, data_files: List[str]) -> str:
+        """
+        Build a predicate on the hive partition column from date_start/date_end.
+        
+        DuckDB prunes whole files on hive partition predicates without opening
+        them, so the view stays bounded to the date range even when discovery
+        falls back to listing every partition.
+        
+        Args:
+            data_files: Parquet file paths backing the view
+            
+        Returns:
+            SQL predicate, or an empty string
+        """
+        if not self.config.date_start and not self.config.date_end:
+            return ""
+        
+        # Only filter when every file sits under a partition directory, otherwise the column may not exist
+        partition_col = self.config.partition_format
+        if not all(f"{partition_col}=" in path for path in data_files):
+            return ""
         
-        # Get local file paths
-        data_files = self._discover_local_data_files()
+        conditions = []
+        if self.config.date_start:
+            date_start = self.config.date_start.replace("'", "''")
+            conditions.append(f'"{partition_col}" >= \'{date_start}\'')
+        if self.config.date_end:
+            date_end = self.config.date_end.replace("'", "''")
+            conditions.append(f'"{partition_col}" <= \'{date_end}\'')
+        
+        return " AND ".join(conditions)
+    
+    def _register_data_with_duckdb(self, conn: duckdb.DuckDBPyConnection,
+                                   data_files: Optional[List[str]] = None) -> None:
+        """Register S3 data with DuckDB for SQL queries."""
+        if data_files is None:
+            data_files = self._discover_data_files()
+        
+        if not data_files:
+            raise ValueError("No data files found in S3. Check your S3 bucket, prefix, and date filters.")
+        
+        self._register_parquet_data(conn, data_files, "S3")
+    
+    def _register_local_data_with_duckdb(self, conn: duckdb.DuckDBPyConnection,
+                                   data_files: Optional[List[str]] = None) -> None:
+        """Register local data with DuckDB for SQL queries."""
+        if data_files is None:
+            data_files = self._discover_local_data_files()
         
         if not data_files:
             raise ValueError("No local data files found. Run download_data_locally() first.")
         
-        print(f"Found {len(data_files)} local data files")
+        self._register_parquet_data(conn, data_files, "local")
+    
+    def _register_parquet_data(self, conn: duckdb.DuckDBPyConnection, data_files: List[str], source: str) -> None:
+        """
+        Register S3 or local parquet files as the main table through one code path.
         
-        # Create table from local files
-        if len(data_files) == 1:
-            local_path = data_files[0]
-            conn.execute(f"CREATE OR REPLACE TABLE {self.config.table_name} AS SELECT * FROM read_parquet('{local_path}')")
-        else:
-            # Multiple files - use array syntax
-            local_paths = "['" + "', '".join(data_files) + "']"
-            conn.execute(f"CREATE OR REPLACE TABLE {self.config.table_name} AS SELECT * FROM read_parquet({local_paths})")
+        DuckDB's own parquet reader is used when it can reach the files. If it
+        cannot (e.g. the httpfs extension is unavailable for S3), the files are
+        exposed as a pyarrow dataset instead, which DuckDB scans with
+        projection and filter pushdown.
+        
+        Args:
+            conn: DuckDB connection to register the table on
+            data_files: Parquet file paths (local or s3://)
+            source: Label for log messages ("S3" or "local")
+        """
+        self.logger.info("Registering %s data with DuckDB (%d files)", source, len(data_files))
         
-        print(f"Local data registered as table '{self.config.table_name}' in DuckDB")
+        try:
+            # Expose files as a lazy view
+            self._create_parquet_view(conn, data_files)
+            self._fallback_datasets.pop(source, None)
+        except Exception as e:
+            self.logger.warning("DuckDB could not read %s parquet files directly (%s), using pyarrow dataset", source, e)
+            self._fallback_datasets[source] = self._build_dataset(data_files)
+            conn.register(self.config.table_name, self._fallback_datasets[source])
+        
+        self.logger.info("%s data registered as '%s' in DuckDB", source, self.config.table_name)
+    
+    def _s3_filesystem(self) -> pa_fs.FileSystem:
+        """pyarrow S3 filesystem using the engine's storage options, behind the shared range cache."""
+        storage_options = self._get_storage_options()
+        filesystem = pa_fs.S3FileSystem(
+            access_key=storage_options.get('aws_access_key_id'),
+            secret_key=storage_options.get('aws_secret_access_key'),
+            session_token=storage_options.get('aws_session_token'),
+            region=storage_options.get('aws_region')
+        )
+        if self.config.range_cache_bytes > 0:
+            cache = get_shared_range_cache(self.config.range_cache_bytes)
+            filesystem = pa_fs.PyFileSystem(CachingFileSystemHandler(filesystem, cache))
+        return filesystem
+    
+    def _build_dataset(self, data_files: List[str]) -> pa_ds.Dataset:
+        """
+        Build a hive-partitioned pyarrow dataset over local or S3 parquet files.
+        
+        Args:
+            data_files: Parquet file paths (local or s3://)
+            
+        Returns:
+            pyarrow dataset, filtered to the configured date range when possible
+        """
+        data_files = sorted(set(data_files))
+        filesystem = None
+        base_dir = self.config.local_bucket_path
+        
+        if data_files[0].startswith("s3://"):
+            filesystem = self._s3_filesystem()
+            data_files = [path[len("s3://"):] for path in data_files]
+            base_dir = f"{self.config.s3_bucket}/{self.config.s3_data_prefix}"
+        
+        dataset = pa_ds.dataset(
+            data_files,
+            format="parquet",
+            filesystem=filesystem,
+            partitioning=pa_ds.partitioning(flavor="hive"),
+            partition_base_dir=base_dir
+        )
+        
+        # Same date-range pruning as the SQL view, on the hive partition field
+        partition_col = self.config.partition_format
+        if partition_col in dataset.schema.names:
+            expression = None
+            if self.config.date_start:
+                expression = pa_ds.field(partition_col) >= self.config.date_start
+            if self.config.date_end:
+                end_expression = pa_ds.field(partition_col) <= self.config.date_end
+                expression = end_expression if expression is None else expression & end_expression
+            if expression is not None:
+                dataset = dataset.filter(expression)
+        
+        return dataset
     
     def _register_api_data_with_duckdb(self, conn: duckdb.DuckDBPyConnection) -> None:
         """Register API data (pricing, savings plans) as tables in DuckDB."""
+        if not self.config.enable_pricing_api and not self.config.enable_savings_plans_api:
+            return
+        
+        # Reuse already-loaded tables while they are fresh and the API flags are unchanged
+        api_flags = (self.config.enable_pricing_api, self.config.enable_savings_plans_api)
+        if self._api_register_state is not None:
+            loaded_at, loaded_flags = self._api_register_state
+            max_age_seconds = self.config.api_cache_max_age_days * 86400
+            if loaded_flags == api_flags and time.monotonic() - loaded_at < max_age_seconds:
+                self._register_api_tables(conn)
+                return
+        
         try:
+            self._api_tables.clear()
+            
             # Initialize pricing manager
-            pricing_manager = AWSPricingManager()
+            if self._pricing_manager is None:
+                self._pricing_manager = AWSPricingManager(self.config)
+            pricing_manager = self._pricing_manager
             
-            # Get pricing data as DataFrames
-            pricing_df = pricing_manager.get_ec2_pricing_dataframe()
-            savings_plans_df = pricing_manager.get_savings_plans_dataframe()
+            # Keep Arrow tables: DuckDB scans the buffers in place, no temp files
+            if self.config.enable_pricing_api:
+                pricing_df = pricing_manager.get_pricing_matrix(
+                    instance_types=self.config.pricing_api_instance_types,
+                    regions=self.config.pricing_api_regions
+                )
+                if not pricing_df.is_empty():
+                    self._api_tables['aws_pricing'] = pricing_df.to_arrow()
             
-            if not pricing_df.empty:
-                # Register pricing data as a DuckDB table
-                conn.register('aws_pricing', pricing_df)
-                print("AWS Pricing data registered as 'aws_pricing' table")
+            if self.config.enable_savings_plans_api:
+                savings_plans_df = pricing_manager.get_savings_plan_rates_joinable()
+                if not savings_plans_df.is_empty():
+                    self._api_tables['aws_savings_plans'] = savings_plans_df.to_arrow()
             
-            if not savings_plans_df.empty:
-                # Register savings plans data as a DuckDB table  
-                conn.register('aws_savings_plans', savings_plans_df)
-                print("AWS Savings Plans data registered as 'aws_savings_plans' table")
+            self._register_api_tables(conn)
+            self._api_register_state = (time.monotonic(), api_flags)
+            for table_name in self._api_tables:
+                self.logger.info("AWS API data registered as '%s' table", table_name)
                 
         except Exception as e:
-            print(f"Warning: Could not register API data tables: {e}")
+            self.logger.warning("Could not register API data tables: %s", e)
     
-    def query(self, 
-              sql: str, 
-              format: QueryResultFormat = QueryResultFormat.DATAFRAME,
-              force_s3: bool = False) -> Union[List[Dict[str, Any]], pd.DataFrame, str, pa.Table]:
+    def refresh_api_data(self) -> None:
+        """Reload pricing and savings-plans tables on the next registration, then re-register them."""
+        with self._conn_lock:
+            self._api_register_state = None
+            self._api_tables.clear()
+            for conn in self._connections.values():
+                self._register_api_data_with_duckdb(conn)
+    
+    def _register_api_tables(self, conn: duckdb.DuckDBPyConnection) -> None:
+        """Expose loaded API Arrow tables on a connection or cursor (zero-copy)."""
+        for table_name, table in self._api_tables.items():
+            conn.register(table_name, table)
+    
+    def _log_query(self, sql: str) -> None:
+        """Log the (truncated) SQL being executed when INFO logging is enabled."""
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Running query: %.100s%s", sql, '...' if len(sql) > 100 else '')
+    
+    def _open_cursor(self, force_s3: bool = False) -> duckdb.DuckDBPyConnection:
         """
-        Execute SQL query and return results in specified format - NO POLARS CONVERSION.
+        Pick the data source and return a cursor on its cached, registered connection.
         
         Args:
-            sql: SQL query to execute
-            format: Desired output format
             force_s3: Force using S3 data even if local data is available
             
         Returns:
-            Query results in the specified format (native, no conversion overhead)
+            DuckDB cursor; the caller is responsible for closing it
         """
         # Determine data source
         use_local_data = (
@@ -201,50 +689,115 @@ class DuckDBEngine(BaseQueryEngine):
             self.has_local_data()
         )
         
-        # Create appropriate DuckDB connection
-        if use_local_data:
-            print("Executing SQL query with DuckDB engine using LOCAL DATA...")
-            print("Data source: Local files")
-            conn = duckdb.connect(":memory:")
-        else:
-            if force_s3:
-                print("Executing SQL query with DuckDB engine using S3 DATA...")
-                print("Data source: S3 (forced)")
+        # Report data source
+        if self.logger.isEnabledFor(logging.INFO):
+            if use_local_data:
+                source = "Local files"
+            elif force_s3:
+                source = "S3 (forced)"
             elif not self.config.local_data_path:
-                print("Data source: S3 (local data not configured)")
+                source = "S3 (local data not configured)"
             elif not self.config.prefer_local_data:
-                print("Data source: S3 (prefer_local_data=False)")
+                source = "S3 (prefer_local_data=False)"
             else:
-                print("Data source: S3 (no local data found)")
-            
-            # For S3 data, we need full S3 configuration
-            conn = self._get_duckdb_connection()
+                source = "S3 (no local data found)"
+            self.logger.info("Executing SQL query with DuckDB engine, data source: %s", source)
         
         try:
-            # Register data with DuckDB
-            if use_local_data:
-                self._register_local_data_with_duckdb(conn)
-            else:
-                self._register_data_with_duckdb(conn)
+            data_files = self._list_data_files(use_local_data)
             
-            # Register API data tables (Pricing and Savings Plans)
-            self._register_api_data_with_duckdb(conn)
+            # Reuse the cached connection; tables are re-registered only when
+            # the file set or API flags change. Each query runs on its own cursor.
+            with self._conn_lock:
+                previous_fingerprint = self._registered_fingerprints.get("s3")
+                cursor = self._get_cached_connection(use_local_data, data_files).cursor()
+                # Arrow-backed registrations are connection-scoped, so attach them to each cursor
+                fallback_dataset = self._fallback_datasets.get("local" if use_local_data else "S3")
+                if fallback_dataset is not None:
+                    cursor.register(self.config.table_name, fallback_dataset)
+                # Registered Arrow tables are connection-scoped, so attach them to each cursor
+                self._register_api_tables(cursor)
+                s3_registered = not use_local_data and self._registered_fingerprints.get("s3") != previous_fingerprint
             
+            # Footer prewarm scans every file, so it runs after the lock is released
+            if s3_registered:
+                self._prewarm_parquet_metadata(cursor, len(data_files))
+            return cursor
+        except Exception as e:
+            self.logger.error("DuckDB query error: %s", e)
+            raise
+    
+    def prefetch_current_partition(self) -> bool:
+        """
+        Warm DuckDB's caches with the current month's S3 parquet data.
+        
+        Reads every column of the current-month partition once without
+        materializing rows, so footers land in the parquet metadata cache and
+        column chunks in the external file cache (or the pyarrow range cache on
+        the fallback path) before the first dashboard query arrives.
+        
+        Returns:
+            True if the prefetch ran, False if it was skipped or failed
+        """
+        partition_col = self.config.partition_format
+        # Monthly partitions are 'YYYY-MM'; daily 'YYYY-MM-DD' values of this month also sort at or after it
+        month_start = datetime.now().strftime('%Y-%m')
+        
+        try:
+            start = time.perf_counter()
+            cursor = self._open_cursor(force_s3=True)
+            try:
+                # DuckDB identifiers are case-insensitive
+                columns = {row[0].lower() for row in cursor.execute(f"DESCRIBE {self.config.table_name}").fetchall()}
+                if partition_col.lower() not in columns:
+                    self.logger.info("Skipping prefetch: '%s' is not a partition column of the S3 data", partition_col)
+                    return False
+                cursor.execute(
+                    f"SELECT COUNT(COLUMNS(*)) FROM {self.config.table_name} "
+                    f"WHERE CAST(\"{partition_col}\" AS VARCHAR) >= ?",
+                    [month_start]
+                ).fetchall()
+            finally:
+                cursor.close()
+            self.logger.info("Prefetched S3 data for %s >= %s in %.2fs", partition_col, month_start, time.perf_counter() - start)
+            return True
+        except Exception as e:
+            self.logger.warning("Could not prefetch current partition: %s", e)
+            return False
+    
+    def query(self, 
+              sql: str, 
+              format: QueryResultFormat = QueryResultFormat.DATAFRAME,
+              force_s3: bool = False) -> Union[List[Dict[str, Any]], pd.DataFrame, str, pa.Table]:
+        """
+        Execute SQL query and return results in specified format - NO POLARS CONVERSION.
+        
+        Args:
+            sql: SQL query to execute
+            format: Desired output format
+            force_s3: Force using S3 data even if local data is available
+            
+        Returns:
+            Query results in the specified format (native, no conversion overhead)
+        """
+        conn = self._open_cursor(force_s3)
+        
+        try:
             # Execute query
-            print(f"Running query: {sql[:100]}{'...' if len(sql) > 100 else ''}")
+            self._log_query(sql)
             
             # Return results in requested format - NO CONVERSION OVERHEAD
             if format == QueryResultFormat.RECORDS:
                 # Direct to list of dictionaries
                 result_df = conn.execute(sql).fetchdf()
                 result = result_df.to_dict('records')
-                print(f"Query completed (Records): {len(result)} rows, {len(result[0]) if result else 0} columns")
+                self.logger.info("Query completed (Records): %d rows, %d columns", len(result), len(result[0]) if result else 0)
                 return result
                 
             elif format == QueryResultFormat.DATAFRAME:
                 # Direct pandas DataFrame
                 result_df = conn.execute(sql).fetchdf()
-                print(f"Query completed (DataFrame): {result_df.shape[0]} rows, {result_df.shape[1]} columns")
+                self.logger.info("Query completed (DataFrame): %d rows, %d columns", result_df.shape[0], result_df.shape[1])
                 return result_df
                 
             elif format == QueryResultFormat.CSV:
@@ -253,29 +806,65 @@ class DuckDBEngine(BaseQueryEngine):
                 csv_buffer = io.StringIO()
                 result_df.to_csv(csv_buffer, index=False)
                 result = csv_buffer.getvalue()
-                print(f"Query completed (CSV): {result_df.shape[0]} rows")
+                self.logger.info("Query completed (CSV): %d rows", result_df.shape[0])
                 return result
                 
             elif format == QueryResultFormat.ARROW:
                 # Direct Arrow table
                 result_arrow = conn.execute(sql).fetch_arrow_table()
-                print(f"Query completed (Arrow): {len(result_arrow)} rows, {len(result_arrow.column_names)} columns")
+                self.logger.info("Query completed (Arrow): %d rows, %d columns", len(result_arrow), len(result_arrow.column_names))
                 return result_arrow
                 
             elif format == QueryResultFormat.RAW:
                 # Raw DuckDB result
                 result = conn.execute(sql).fetchall()
-                print(f"Query completed (Raw): {len(result)} rows")
+                self.logger.info("Query completed (Raw): %d rows", len(result))
                 return result
                 
             else:
                 raise ValueError(f"Unsupported format: {format}")
             
         except Exception as e:
-            print(f"DuckDB query error: {str(e)}")
+            self.logger.error("DuckDB query error: %s", e)
+            raise
+        finally:
+            # Close the per-query cursor; the cached connection stays open
+            conn.close()
+    
+    def query_polars(self, sql: str, force_s3: bool = False, batch_size: int = POLARS_FETCH_BATCH_ROWS) -> pl.DataFrame:
+        """
+        Execute SQL query and return a Polars DataFrame straight from DuckDB.
+        
+        Uses DuckDB's native Polars export (Arrow C Data Interface) so no
+        intermediate pyarrow.Table is built before conversion.
+        
+        Args:
+            sql: SQL query to execute
+            force_s3: Force using S3 data even if local data is available
+            batch_size: Rows per record batch for the streaming fallback
+            
+        Returns:
+            Polars DataFrame with the query results
+        """
+        conn = self._open_cursor(force_s3)
+        
+        try:
+            self._log_query(sql)
+            try:
+                result = conn.execute(sql).pl()
+            except Exception as e:
+                # Types the native export cannot handle: stream record batches instead
+                self.logger.warning("Native Polars export failed (%s), streaming record batches", e)
+                relation = conn.execute(sql)
+                reader = (relation.to_arrow_reader(batch_size) if hasattr(relation, 'to_arrow_reader')
+                          else relation.fetch_record_batch(batch_size))
+                result = pl.from_arrow(reader)
+            self.logger.info("Query completed (Polars): %d rows, %d columns", result.height, result.width)
+            return result
+        except Exception as e:
+            self.logger.error("DuckDB query error: %s", e)
             raise
         finally:
-            # Clean up connection
             conn.close()
     
     def schema(self) -> Dict[str, str]:
@@ -283,15 +872,61 @@ class DuckDBEngine(BaseQueryEngine):
         if self._schema_cache:
             return self._schema_cache
         
+        # Read one parquet footer instead of registering everything and running a query
+        try:
+            self._schema_cache = self._schema_from_parquet_footer()
+            return self._schema_cache
+        except Exception as e:
+            self.logger.debug("Footer schema read failed, falling back to a query: %s", e)
+        
         # Use a simple query to get schema
         try:
             result = self.query(f"SELECT * FROM {self.config.table_name} LIMIT 0", format=QueryResultFormat.DATAFRAME)
             self._schema_cache = dict(zip(result.columns, [str(dt) for dt in result.dtypes]))
             return self._schema_cache
         except Exception as e:
-            print(f"Could not get schema: {e}")
+            self.logger.warning("Could not get schema: %s", e)
             return {}
     
+    def _schema_from_parquet_footer(self) -> Dict[str, str]:
+        """
+        Build the schema dict from a single data file's parquet footer.
+        
+        Types are reported as pandas dtype strings, matching the query-based
+        path, and hive partition keys from the file path are included.
+        
+        Returns:
+            Mapping of column name to dtype string
+        """
+        use_local_data = self.config.prefer_local_data and self.has_local_data()
+        data_files = self._list_data_files(use_local_data)
+        if not data_files:
+            raise ValueError("No data files found")
+        
+        path = min(data_files)
+        if path.startswith("s3://"):
+            parquet_schema = pq.read_schema(path[len("s3://"):], filesystem=self._s3_filesystem())
+        else:
+            parquet_schema = pq.read_schema(path)
+        
+        empty_df = parquet_schema.empty_table().to_pandas()
+        schema = {}
+        for field in parquet_schema:
+            # DuckDB's fetchdf() returns strings as object columns
+            if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+                schema[field.name] = 'object'
+            else:
+                schema[field.name] = str(empty_df.dtypes[field.name])
+        
+        # Partition directories become columns of the hive-partitioned view
+        known_columns = {column.lower() for column in schema}
+        for part in path.split('/')[:-1]:
+            key, sep, _ = part.partition('=')
+            if sep and key.lower() not in known_columns:
+                schema[key] = 'object'
+        
+        return schema
+    
     def catalog(self) -> Dict[str, Any]:
         """Get data catalog information."""
         return {
@@ -4,7 +4,6 @@ Polars Engine - Direct Polars-based query execution
 import polars as pl
 import pandas as pd
 import pyarrow as pa
-import io
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Union
 from datetime import datetime
@@ -107,6 +106,45 @@ class PolarsEngine(BaseQueryEngine):
         
         return self._dataframe
     
+    def scan(self, force_s3: bool = False) -> pl.LazyFrame:
+        """
+        Lazily scan the source parquet files without loading them into memory.
+        
+        Args:
+            force_s3: Force using S3 data even if local data is available
+            
+        Returns:
+            LazyFrame over the configured data table
+        """
+        use_local_data = (
+            not force_s3 and 
+            self.config.prefer_local_data and 
+            self.has_local_data()
+        )
+        
+        if use_local_data:
+            data_files = self._discover_local_data_files()
+            return pl.scan_parquet(data_files)
+        
+        data_files = self._discover_data_files()
+        if not data_files:
+            raise ValueError("No data files found in S3. Check your S3 bucket, prefix, and date filters.")
+        return pl.scan_parquet(data_files, storage_options=self._get_storage_options())
+    
+    def query_lazy(self, sql: str, force_s3: bool = False) -> pl.LazyFrame:
+        """
+        Build a lazy Polars SQL plan over the source parquet files without loading them.
+        
+        Args:
+            sql: SQL query to plan
+            force_s3: Force using S3 data even if local data is available
+            
+        Returns:
+            LazyFrame that streams from the source files when collected or sunk
+        """
+        ctx = pl.SQLContext({self.config.table_name: self.scan(force_s3)})
+        return ctx.execute(sql)
+    
     def query(self, 
               sql: str, 
               format: QueryResultFormat = QueryResultFormat.DATAFRAME,
@@ -148,9 +186,8 @@ class PolarsEngine(BaseQueryEngine):
                 return result_df.to_pandas()
                 
             elif format == QueryResultFormat.CSV:
-                csv_buffer = io.StringIO()
-                result_df.to_pandas().to_csv(csv_buffer, index=False)
-                return csv_buffer.getvalue()
+                # Write CSV natively instead of converting every column to pandas first
+                return result_df.write_csv()
                 
             elif format == QueryResultFormat.ARROW:
                 return result_df.to_arrow()
@@ -187,9 +224,7 @@ class PolarsEngine(BaseQueryEngine):
                 elif format == QueryResultFormat.DATAFRAME:
                     return result_df.to_pandas()
                 elif format == QueryResultFormat.CSV:
-                    csv_buffer = io.StringIO()
-                    result_df.to_pandas().to_csv(csv_buffer, index=False)
-                    return csv_buffer.getvalue()
+                    return result_df.write_csv()
                 elif format == QueryResultFormat.ARROW:
                     return result_df.to_arrow()
                 elif format == QueryResultFormat.RAW:
@@ -203,8 +238,12 @@ class PolarsEngine(BaseQueryEngine):
             return self._schema_cache
         
         try:
-            df = self._load_data()
-            self._schema_cache = {col: str(dtype) for col, dtype in zip(df.columns, df.dtypes)}
+            if self._dataframe is not None:
+                schema = self._dataframe.schema
+            else:
+                # Resolve the schema from parquet footers instead of loading every row
+                schema = self.scan().collect_schema()
+            self._schema_cache = {col: str(dtype) for col, dtype in schema.items()}
             return self._schema_cache
         except Exception as e:
             print(f"Could not get schema: {e}")
@@ -0,0 +1,224 @@
+"""
+Byte-range cache for remote parquet reads
+"""
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.fs as pa_fs
+
+
+# Cache key: (path, file size, object version, offset, length)
+RangeKey = Tuple[str, int, str, int, int]
+
+
+class RangeCache:
+    """
+    Process-wide LRU of exact byte ranges, bounded by total cached bytes.
+    
+    Only exact (path, size, version, offset, length) matches are served;
+    overlapping ranges are not merged. The version (ETag or modification
+    time) keeps an object overwritten with the same size from serving stale
+    bytes. Least recently used ranges are evicted first.
+    """
+    
+    def __init__(self, max_bytes: int):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_bytes: Upper bound on the total size of cached ranges
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[RangeKey, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: RangeKey) -> Optional[bytes]:
+        """Return the cached range, or None on a miss."""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+    
+    def put(self, key: RangeKey, data: bytes) -> None:
+        """Insert a range, evicting least recently used ranges to stay within budget."""
+        size = len(data)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = data
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted)
+    
+    def clear(self) -> None:
+        """Drop all cached ranges."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+
+_shared_cache: Optional[RangeCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_range_cache(max_bytes: int) -> RangeCache:
+    """
+    Get the process-wide range cache, growing its budget to max_bytes if needed.
+    
+    Args:
+        max_bytes: Requested byte budget
+        
+    Returns:
+        Shared RangeCache instance
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = RangeCache(max_bytes)
+        elif max_bytes > _shared_cache.max_bytes:
+            _shared_cache.max_bytes = max_bytes
+        return _shared_cache
+
+
+class _CachedRangeFile:
+    """Read-only file object that serves reads from a RangeCache before the wrapped file."""
+    
+    def __init__(self, handle: pa.NativeFile, path: str, version: str, cache: RangeCache):
+        self._handle = handle
+        self._path = path
+        self._size = handle.size()
+        self._version = version
+        self._cache = cache
+    
+    @property
+    def closed(self) -> bool:
+        return self._handle.closed
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def writable(self) -> bool:
+        return False
+    
+    def tell(self) -> int:
+        return self._handle.tell()
+    
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._handle.seek(offset, whence)
+    
+    def size(self) -> int:
+        return self._size
+    
+    def read(self, nbytes: int = -1) -> bytes:
+        position = self._handle.tell()
+        if nbytes is None or nbytes < 0:
+            nbytes = self._size - position
+        key = (self._path, self._size, self._version, position, nbytes)
+        
+        data = self._cache.get(key)
+        if data is None:
+            data = self._handle.read(nbytes)
+            self._cache.put(key, data)
+        else:
+            self._handle.seek(position + len(data))
+        return data
+    
+    def close(self) -> None:
+        self._handle.close()
+
+
+class CachingFileSystemHandler(pa_fs.FileSystemHandler):
+    """
+    pyarrow filesystem handler that routes random-access reads through a RangeCache.
+    
+    Everything else is delegated to the wrapped filesystem. Use with
+    pyarrow.fs.PyFileSystem(CachingFileSystemHandler(fs, cache)).
+    """
+    
+    def __init__(self, filesystem: pa_fs.FileSystem, cache: RangeCache):
+        """
+        Initialize the handler.
+        
+        Args:
+            filesystem: Underlying filesystem (e.g. pyarrow S3FileSystem)
+            cache: Range cache shared across opened files
+        """
+        self._fs = filesystem
+        self._cache = cache
+    
+    def __eq__(self, other):
+        return (isinstance(other, CachingFileSystemHandler)
+                and self._fs.equals(other._fs) and self._cache is other._cache)
+    
+    def __ne__(self, other):
+        return not self == other
+    
+    def get_type_name(self):
+        return f"range-cached-{self._fs.type_name}"
+    
+    def normalize_path(self, path):
+        return self._fs.normalize_path(path)
+    
+    def get_file_info(self, paths):
+        return self._fs.get_file_info(paths)
+    
+    def get_file_info_selector(self, selector):
+        return self._fs.get_file_info(selector)
+    
+    def create_dir(self, path, recursive):
+        self._fs.create_dir(path, recursive=recursive)
+    
+    def delete_dir(self, path):
+        self._fs.delete_dir(path)
+    
+    def delete_dir_contents(self, path, missing_dir_ok=False):
+        self._fs.delete_dir_contents(path, missing_dir_ok=missing_dir_ok)
+    
+    def delete_root_dir_contents(self):
+        self._fs.delete_dir_contents("/", accept_root_dir=True)
+    
+    def delete_file(self, path):
+        self._fs.delete_file(path)
+    
+    def move(self, src, dest):
+        self._fs.move(src, dest)
+    
+    def copy_file(self, src, dest):
+        self._fs.copy_file(src, dest)
+    
+    def open_input_stream(self, path):
+        return self._fs.open_input_stream(path)
+    
+    def _object_version(self, handle: pa.NativeFile, path: str) -> str:
+        """ETag from the opened object's metadata (S3), else the modification time from get_file_info."""
+        metadata = handle.metadata() or {}
+        etag = metadata.get("ETag") or metadata.get(b"ETag")
+        if etag:
+            return etag.decode() if isinstance(etag, bytes) else etag
+        return str(self._fs.get_file_info(path).mtime_ns)
+    
+    def open_input_file(self, path):
+        handle = self._fs.open_input_file(path)
+        version = self._object_version(handle, path)
+        return pa.PythonFile(_CachedRangeFile(handle, path, version, self._cache), mode="r")
+    
+    def open_output_stream(self, path, metadata):
+        return self._fs.open_output_stream(path, metadata=metadata)
+    
+    def open_append_stream(self, path, metadata):
+        return self._fs.open_append_stream(path, metadata=metadata)
@@ -1,7 +1,14 @@
 """
 Unified FinOps Engine - Main interface for all cost analytics functionality
 """
-from typing import Dict, Any, Optional, Union, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import copy
+import threading
+import time
+from typing import Dict, Any, Optional, Union, List, Set, Callable, TYPE_CHECKING
+
+import numpy as np
 
 from .engine import (
     BaseQueryEngine, 
@@ -11,15 +18,75 @@ from .engine import (
     DataConfig, 
     DataExportType
 )
-from .analytics import (
-    KPISummaryAnalytics,
-    SpendAnalytics,
-    OptimizationAnalytics,
-    AllocationAnalytics,
-    DiscountAnalytics,
-    AIRecommendationAnalytics
+from .utils.exports import get_total_spend, get_savings_potential
+from .logging_config import get_logger
+
+# Analytics modules are imported on first use of the matching property
+if TYPE_CHECKING:
+    from .analytics import (
+        KPISummaryAnalytics,
+        SpendAnalytics,
+        OptimizationAnalytics,
+        AllocationAnalytics,
+        DiscountAnalytics,
+        AIRecommendationAnalytics
+    )
+    from .analytics.mcp_integration import MCPIntegrationAnalytics
+
+
+logger = get_logger("infralyzer.FinOpsEngine")
+
+# Worker threads for independent analytics queries in composite calls (dashboard, executive summary)
+ANALYTICS_MAX_WORKERS = 8
+
+# Sections returned by get_dashboard_data (selectable through its include argument)
+DASHBOARD_SECTIONS = (
+    "kpi_summary", "spend_summary", "top_services", "top_regions",
+    "optimization_opportunities", "tagging_compliance", "discount_agreements", "ai_insights"
 )
-from .analytics.mcp_integration import MCPIntegrationAnalytics
+
+# Health check score categories, in the order they are computed
+HEALTH_CHECK_CATEGORIES = ("cost_efficiency", "resource_optimization", "tagging_compliance")
+
+# Executive summary insight lines, filled from spend/mom/savings/score values
+_INSIGHT_TEMPLATES = (
+    "Current monthly spend: ${spend:,.2f}",
+    "Month-over-month change: {mom:+.1f}%",
+    "Optimization opportunity: ${savings:,.2f} potential monthly savings",
+    "Cost health score: {score:.1f}/100"
+)
+
+# Seconds an analytics result is reused across dashboard/summary/health-check calls (0 disables)
+RESULT_CACHE_TTL_SECONDS = 60.0
+# Maximum cached analytics results per engine (least recently used are evicted)
+RESULT_CACHE_SIZE = 128
+
+
+class _slot_cached_property:
+    """
+    cached_property for __slots__ classes.
+    
+    The first access computes the value and stores it in the slot named
+    '_<attribute>'; later accesses read the slot directly.
+    """
+    
+    def __init__(self, func: Callable[[Any], Any]):
+        self.func = func
+        self.__doc__ = func.__doc__
+    
+    def __set_name__(self, owner, name):
+        # Member descriptor that __slots__ created for the backing slot
+        self.slot = owner.__dict__[f"_{name}"]
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            value = self.func(instance)
+            self.slot.__set__(instance, value)
+            return value
 
 
 class FinOpsEngine:
@@ -50,76 +117,81 @@ class FinOpsEngine:
         result = engine.query("SELECT * FROM CUR LIMIT 10")
     """
     
-    def __init__(self, config: DataConfig, engine_name: str = "duckdb"):
+    # No per-instance __dict__; analytics modules are cached in the underscored slots
+    __slots__ = (
+        "engine", "config", "engine_name",
+        "result_cache_ttl", "_result_cache", "_result_cache_lock",
+        "_kpi", "_spend", "_optimization", "_allocation", "_discounts", "_ai", "_mcp"
+    )
+    
+    def __init__(self, config: DataConfig, engine_name: str = "duckdb",
+                 result_cache_ttl: float = RESULT_CACHE_TTL_SECONDS):
         """
         Initialize FinOps Engine with configuration and pluggable query engine.
         
         Args:
             config: DataConfig object with AWS credentials and data settings
             engine_name: Query engine to use ('duckdb', 'polars', 'athena')
+            result_cache_ttl: Seconds to reuse analytics results between composite calls (0 disables)
         """
         # Initialize pluggable query engine
         self.engine = QueryEngineFactory.create_engine(engine_name, config)
         self.config = config
         self.engine_name = engine_name
         
-        # Initialize all analytics modules
-        self._kpi = None
-        self._spend = None
-        self._optimization = None
-        self._allocation = None
-        self._discounts = None
-        self._ai = None
-        self._mcp = None
-    
-    @property
-    def kpi(self) -> KPISummaryAnalytics:
+        # Warm S3 data while the caller finishes setting up (opt-in; needs an S3 source)
+        if (config.prefetch_on_init and config.s3_bucket
+                and hasattr(self.engine, 'prefetch_current_partition')):
+            threading.Thread(target=self._prefetch_current_partition, name="infralyzer-prefetch", daemon=True).start()
+        
+        # Short-lived analytics results keyed by (method, date range, kwargs) -> (stored_at, result)
+        self.result_cache_ttl = result_cache_ttl
+        self._result_cache: "OrderedDict[Any, Any]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        
+        # Analytics modules are created on first access and cached in their slots
+    
+    @_slot_cached_property
+    def kpi(self) -> "KPISummaryAnalytics":
         """Access KPI Summary Analytics module."""
-        if self._kpi is None:
-            self._kpi = KPISummaryAnalytics(self.engine)
-        return self._kpi
+        from .analytics import KPISummaryAnalytics
+        return KPISummaryAnalytics(self.engine)
     
-    @property
-    def spend(self) -> SpendAnalytics:
+    @_slot_cached_property
+    def spend(self) -> "SpendAnalytics":
         """Access Spend Analytics module."""
-        if self._spend is None:
-            self._spend = SpendAnalytics(self.engine)
-        return self._spend
+        from .analytics import SpendAnalytics
+        return SpendAnalytics(self.engine)
     
-    @property
-    def optimization(self) -> OptimizationAnalytics:
+    @_slot_cached_property
+    def optimization(self) -> "OptimizationAnalytics":
         """Access Optimization Analytics module."""
-        if self._optimization is None:
-            self._optimization = OptimizationAnalytics(self.engine)
-        return self._optimization
+        from .analytics import OptimizationAnalytics
+        return OptimizationAnalytics(self.engine)
     
-    @property
-    def allocation(self) -> AllocationAnalytics:
+    @_slot_cached_property
+    def allocation(self) -> "AllocationAnalytics":
         """Access Allocation Analytics module."""
-        if self._allocation is None:
-            self._allocation = AllocationAnalytics(self.engine)
-        return self._allocation
+        from .analytics import AllocationAnalytics
+        return AllocationAnalytics(self.engine)
     
-    @property
-    def discounts(self) -> DiscountAnalytics:
+    @_slot_cached_property
+    def discounts(self) -> "DiscountAnalytics":
         """Access Discount Analytics module."""
-        if self._discounts is None:
-            self._discounts = DiscountAnalytics(self.engine)
-        return self._discounts
+        from .analytics import DiscountAnalytics
+        return DiscountAnalytics(self.engine)
     
-    @property
-    def ai(self) -> AIRecommendationAnalytics:
+    @_slot_cached_property
+    def ai(self) -> "AIRecommendationAnalytics":
         """Access AI Recommendation Analytics module."""
-        if self._ai is None:
-            self._ai = AIRecommendationAnalytics(self.engine)
-        return self._ai
+        from .analytics import AIRecommendationAnalytics
+        return AIRecommendationAnalytics(self.engine)
     
-    @property
-    def mcp(self) -> MCPIntegrationAnalytics:
+    @_slot_cached_property
+    def mcp(self) -> "MCPIntegrationAnalytics":
         """Access MCP Integration Analytics module."""
-        if self._mcp is None:
-            self._mcp = MCPIntegrationAnalytics(self.engine)
-        return self._mcp
+        from .analytics.mcp_integration import MCPIntegrationAnalytics
+        return MCPIntegrationAnalytics(self.engine)
     
     # Direct engine access methods
     def query(self, 
@@ -211,25 +283,120 @@ class FinOpsEngine:
         """Print information about the data source."""
         return self.engine.info()
     
+    def _prefetch_current_partition(self) -> None:
+        """Background task: prefetch the current month's S3 data unless local data will be queried."""
+        try:
+            if self.config.prefer_local_data and self.engine.has_local_data():
+                return
+            self.engine.prefetch_current_partition()
+        except Exception as e:
+            logger.warning("Background prefetch failed: %s", e)
+    
+    def _cached_call(self, func: Callable[..., Any], **kwargs) -> Any:
+        """
+        Call an analytics method, reusing its result for result_cache_ttl seconds.
+        
+        Cached results are deep-copied in and out so callers can mutate what they
+        get back; at most RESULT_CACHE_SIZE results are kept.
+        
+        Args:
+            func: Bound analytics method, e.g. self.kpi.get_comprehensive_summary
+            **kwargs: Keyword arguments for the call (must be hashable)
+            
+        Returns:
+            The method's result, possibly from the cache
+        """
+        if self.result_cache_ttl <= 0:
+            return func(**kwargs)
+        
+        # The configured date range is part of the key so changing it never serves stale results
+        key = (func.__qualname__, self.config.date_start, self.config.date_end, frozenset(kwargs.items()))
+        with self._result_cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                if time.monotonic() - cached[0] < self.result_cache_ttl:
+                    self._result_cache.move_to_end(key)
+                else:
+                    del self._result_cache[key]
+                    cached = None
+        if cached is not None:
+            return copy.deepcopy(cached[1])
+        
+        result = func(**kwargs)
+        # Don't pin failures for the whole TTL
+        if not (isinstance(result, dict) and "error" in result):
+            entry = (time.monotonic(), copy.deepcopy(result))
+            with self._result_cache_lock:
+                self._result_cache[key] = entry
+                self._result_cache.move_to_end(key)
+                while len(self._result_cache) > RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+        return result
+    
+    def clear_result_cache(self) -> None:
+        """Drop cached analytics results so the next call re-queries the data."""
+        with self._result_cache_lock:
+            self._result_cache.clear()
+    
+    def _run_concurrently(self, tasks: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """
+        Run independent analytics calls on a thread pool and gather results by key.
+        
+        Args:
+            tasks: Mapping of result key to zero-argument callable
+            
+        Returns:
+            Mapping of result key to the call's result, or {"error": ...} if it raised
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(ANALYTICS_MAX_WORKERS, len(tasks)))) as executor:
+            future_to_key = {executor.submit(task): key for key, task in tasks.items()}
+            for future in as_completed(future_to_key):
+                key = future_to_key[future]
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    logger.exception("Error generating %s", key)
+                    results[key] = {"error": str(e)}
+        
+        # Keep the caller's key order
+        return {key: results[key] for key in tasks}
+    
     # Convenience methods for common operations
-    def get_dashboard_data(self) -> Dict[str, Any]:
+    def get_dashboard_data(self, *, top_n: int = 5, include: Optional[Set[str]] = None) -> Dict[str, Any]:
         """
         Get comprehensive dashboard data combining multiple analytics.
         
+        Args:
+            top_n: Rows to return for list sections (services, regions, idle resources,
+                   discount agreements, AI insights); section totals and summaries
+                   still cover the full result, only the lists are shortened
+            include: Dashboard sections to compute (see DASHBOARD_SECTIONS); None computes all
+        
         Returns:
-            Dictionary with data for all dashboard components
+            Dictionary with data for the requested dashboard components
         """
+        if include is not None:
+            unknown = set(include) - set(DASHBOARD_SECTIONS)
+            if unknown:
+                raise ValueError(f"Unknown dashboard sections {sorted(unknown)}. Valid sections: {list(DASHBOARD_SECTIONS)}")
+        
         try:
-            dashboard_data = {
-                "kpi_summary": self.kpi.get_comprehensive_summary(),
-                "spend_summary": self.spend.get_invoice_summary(),
-                "top_services": self.spend.get_top_services(limit=5),
-                "top_regions": self.spend.get_top_regions(limit=5),
-                "optimization_opportunities": self.optimization.get_idle_resources(),
-                "tagging_compliance": self.allocation.get_tagging_compliance(),
-                "discount_agreements": self.discounts.get_current_agreements(),
-                "ai_insights": self.ai.get_optimization_insights()
+            tasks = {
+                "kpi_summary": lambda: self._cached_call(self.kpi.get_comprehensive_summary),
+                "spend_summary": lambda: self._cached_call(self.spend.get_invoice_summary),
+                "top_services": lambda: self._cached_call(self.spend.get_top_services, limit=top_n),
+                "top_regions": lambda: self._cached_call(self.spend.get_top_regions, limit=top_n),
+                "optimization_opportunities": lambda: self._cached_call(self.optimization.get_idle_resources, limit=top_n),
+                "tagging_compliance": lambda: self._cached_call(self.allocation.get_tagging_compliance),
+                "discount_agreements": lambda: self._cached_call(self.discounts.get_current_agreements, limit=top_n),
+                "ai_insights": lambda: self._cached_call(self.ai.get_optimization_insights, limit=top_n)
             }
+            if include is not None:
+                tasks = {key: task for key, task in tasks.items() if key in include}
+            
+            # Independent, I/O-bound queries: run them concurrently
+            dashboard_data = self._run_concurrently(tasks)
             
             # Add metadata
             dashboard_data["metadata"] = {
@@ -241,66 +408,166 @@ class FinOpsEngine:
             return dashboard_data
             
         except Exception as e:
-            print(f"Error generating dashboard data: {e}")
+            logger.exception("Error generating dashboard data")
             return {"error": str(e)}
     
-    def run_cost_health_check(self) -> Dict[str, Any]:
+    def _health_check_bundle_sql(self, utilization_threshold: float = 5.0) -> str:
         """
-        Run comprehensive cost health check across all modules.
+        Build one statement computing the idle-resource count and tagging compliance score.
+        
+        Both inputs come from a single scan of the current month's CUR rows and reuse the
+        SQL fragments behind OptimizationAnalytics.get_idle_resources and
+        AllocationAnalytics.get_tagging_compliance, so the results always agree.
         
+        Args:
+            utilization_threshold: Utilization percentage threshold for idle detection
+            
         Returns:
-            Health check results with scores and recommendations
+            SQL returning a single row with idle_count, tagged_resources and total_resources
         """
-        health_check = {
-            "overall_score": 0,
-            "category_scores": {},
-            "findings": [],
-            "recommendations": []
+        from .analytics.optimization import IDLE_RESOURCES_MAX_ROWS, resource_utilization_sql
+        from .analytics.allocation import resource_tagging_sql
+        
+        return f"""
+        WITH current_month AS (
+            SELECT 
+                line_item_resource_id,
+                product_servicecode,
+                product_instance_type,
+                line_item_unblended_cost,
+                line_item_usage_amount,
+                line_item_usage_start_date,
+                resource_tags
+            FROM {self.config.table_name}
+            WHERE line_item_unblended_cost > 0
+                AND DATE_TRUNC('month', line_item_usage_start_date) = DATE_TRUNC('month', CURRENT_DATE)
+        ),
+        resource_utilization AS ({resource_utilization_sql('current_month')}),
+        resource_tagging AS ({resource_tagging_sql('current_month')}),
+        compliance AS (
+            SELECT DISTINCT tagging_status, product_servicecode, line_item_resource_id
+            FROM resource_tagging
+        )
+        SELECT 
+            (SELECT LEAST(COUNT(*), {IDLE_RESOURCES_MAX_ROWS}) FROM resource_utilization
+             WHERE avg_utilization < {utilization_threshold * 2}) as idle_count,
+            (SELECT COUNT(*) FROM compliance WHERE tagging_status != 'untagged') as tagged_resources,
+            (SELECT COUNT(*) FROM compliance) as total_resources
+        """
+    
+    def _health_check_bundle(self) -> Dict[str, Any]:
+        """
+        Run the fused health-check query.
+        
+        Returns:
+            Dictionary with idle_count and compliance_score
+        """
+        row = self.engine.query(self._health_check_bundle_sql(), format=QueryResultFormat.RECORDS)[0]
+        total_resources = int(row["total_resources"] or 0)
+        tagged_resources = int(row["tagged_resources"] or 0)
+        compliance_score = (tagged_resources / total_resources * 100) if total_resources > 0 else 0
+        return {
+            "idle_count": int(row["idle_count"] or 0),
+            "compliance_score": round(compliance_score, 1)
         }
+    
+    def run_cost_health_check(self,
+                              kpi_summary: Optional[Dict[str, Any]] = None,
+                              idle_resources: Optional[Dict[str, Any]] = None,
+                              tagging_compliance: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Run comprehensive cost health check across all modules.
+        
+        When idle resources or tagging compliance are not supplied, both are computed
+        together by one fused query instead of two separate table scans.
+        
+        Args:
+            kpi_summary: Pre-fetched result of kpi.get_comprehensive_summary()
+            idle_resources: Pre-fetched result of optimization.get_idle_resources()
+            tagging_compliance: Pre-fetched result of allocation.get_tagging_compliance()
         
+        Returns:
+            Health check results with scores and recommendations
+        """
         try:
-            # KPI Health Check
-            kpi_summary = self.kpi.get_comprehensive_summary()
-            total_spend = kpi_summary.get("overall_spend", {}).get("spend_all_cost", 0)
-            total_savings = kpi_summary.get("savings_summary", {}).get("total_potential_savings", 0)
-            
-            savings_ratio = (total_savings / total_spend * 100) if total_spend > 0 else 0
-            kpi_score = min(100, savings_ratio * 2)  # Scale savings potential to score
-            health_check["category_scores"]["cost_efficiency"] = round(kpi_score, 1)
-            
-            # Optimization Health Check
-            idle_resources = self.optimization.get_idle_resources()
-            idle_count = len(idle_resources.get("idle_resources", []))
-            optimization_score = max(0, 100 - (idle_count * 5))  # Deduct points for idle resources
-            health_check["category_scores"]["resource_optimization"] = round(optimization_score, 1)
+            if kpi_summary is None:
+                kpi_summary = self._cached_call(self.kpi.get_comprehensive_summary)
             
-            # Tagging Compliance Check
-            tagging_compliance = self.allocation.get_tagging_compliance()
-            compliance_score = tagging_compliance.get("compliance_score", 0)
-            health_check["category_scores"]["tagging_compliance"] = compliance_score
+            bundle = None
+            if idle_resources is None or tagging_compliance is None:
+                try:
+                    bundle = self._cached_call(self._health_check_bundle)
+                except Exception as e:
+                    logger.warning("Fused health check query failed, using module queries: %s", e)
             
-            # Calculate overall score
-            scores = list(health_check["category_scores"].values())
-            health_check["overall_score"] = round(sum(scores) / len(scores), 1) if scores else 0
-            
-            # Generate findings and recommendations
-            if compliance_score < 70:
-                health_check["findings"].append("Low tagging compliance detected")
-                health_check["recommendations"].append("Implement automated tagging policies")
-            
-            if idle_count > 5:
-                health_check["findings"].append(f"{idle_count} idle resources found")
-                health_check["recommendations"].append("Review and terminate unused resources")
-            
-            if savings_ratio > 20:
-                health_check["findings"].append("High optimization potential identified")
-                health_check["recommendations"].append("Prioritize cost optimization initiatives")
+            if bundle is not None:
+                idle_count = bundle["idle_count"]
+                compliance_score = bundle["compliance_score"]
+            else:
+                if idle_resources is None:
+                    idle_resources = self._cached_call(self.optimization.get_idle_resources)
+                if tagging_compliance is None:
+                    tagging_compliance = self._cached_call(self.allocation.get_tagging_compliance)
+                idle_count = len(idle_resources.get("idle_resources", []))
+                compliance_score = tagging_compliance.get("compliance_score", 0)
             
-            return health_check
+            return self._score_health_check(kpi_summary, idle_count, compliance_score)
             
         except Exception as e:
-            health_check["error"] = str(e)
-            return health_check
+            return {
+                "overall_score": 0,
+                "category_scores": {},
+                "findings": [],
+                "recommendations": [],
+                "error": str(e)
+            }
+    
+    def _score_health_check(self, kpi_summary: Dict[str, Any], idle_count: int,
+                            compliance_score: float) -> Dict[str, Any]:
+        """
+        Score cost efficiency, resource optimization and tagging compliance.
+        
+        Args:
+            kpi_summary: Result of kpi.get_comprehensive_summary()
+            idle_count: Number of idle or underutilized resources
+            compliance_score: Tagging compliance percentage
+            
+        Returns:
+            Health check results with scores and recommendations
+        """
+        total_spend = get_total_spend(kpi_summary)
+        total_savings = get_savings_potential(kpi_summary)
+        savings_ratio = (total_savings / total_spend * 100) if total_spend > 0 else 0
+        
+        # Score every category in one clipped, rounded array (order matches HEALTH_CHECK_CATEGORIES)
+        scores = np.array([
+            savings_ratio * 2,        # Scale savings potential to score
+            100 - idle_count * 5,     # Deduct points for idle resources
+            compliance_score
+        ], dtype=float)
+        scores = np.round(np.clip(scores, 0, 100), 1)
+        
+        health_check = {
+            "overall_score": float(np.round(scores.mean(), 1)),
+            "category_scores": dict(zip(HEALTH_CHECK_CATEGORIES, scores.tolist())),
+            "findings": [],
+            "recommendations": []
+        }
+        
+        # Generate findings and recommendations
+        if compliance_score < 70:
+            health_check["findings"].append("Low tagging compliance detected")
+            health_check["recommendations"].append("Implement automated tagging policies")
+        
+        if idle_count > 5:
+            health_check["findings"].append(f"{idle_count} idle resources found")
+            health_check["recommendations"].append("Review and terminate unused resources")
+        
+        if savings_ratio > 20:
+            health_check["findings"].append("High optimization potential identified")
+            health_check["recommendations"].append("Prioritize cost optimization initiatives")
+        
+        return health_check
     
     def generate_executive_summary(self) -> Dict[str, Any]:
         """
@@ -310,15 +577,26 @@ class FinOpsEngine:
             Executive summary with key metrics and insights
         """
         try:
-            # Get core metrics
-            kpi_summary = self.kpi.get_comprehensive_summary()
-            spend_summary = self.spend.get_invoice_summary()
-            health_check = self.run_cost_health_check()
+            # Fetch KPI and spend once, concurrently, and share KPI with the health check
+            core_metrics = self._run_concurrently({
+                "kpi_summary": lambda: self._cached_call(self.kpi.get_comprehensive_summary),
+                "spend_summary": lambda: self._cached_call(self.spend.get_invoice_summary)
+            })
+            kpi_summary = core_metrics["kpi_summary"]
+            spend_summary = core_metrics["spend_summary"]
+            health_check = self.run_cost_health_check(kpi_summary=kpi_summary)
             
             # Extract key metrics
-            current_spend = kpi_summary.get("overall_spend", {}).get("spend_all_cost", 0)
+            current_spend = get_total_spend(kpi_summary)
             mom_change = spend_summary.get("mom_change", 0)
-            total_savings_potential = kpi_summary.get("savings_summary", {}).get("total_potential_savings", 0)
+            total_savings_potential = get_savings_potential(kpi_summary)
+            
+            insight_values = {
+                "spend": current_spend,
+                "mom": mom_change,
+                "savings": total_savings_potential,
+                "score": health_check.get("overall_score", 0)
+            }
             
             executive_summary = {
                 "summary_date": kpi_summary.get("summary_metadata", {}).get("query_date"),
@@ -328,12 +606,7 @@ class FinOpsEngine:
                     "optimization_potential": total_savings_potential,
                     "cost_health_score": health_check.get("overall_score", 0)
                 },
-                "executive_insights": [
-                    f"Current monthly spend: ${current_spend:,.2f}",
-                    f"Month-over-month change: {mom_change:+.1f}%",
-                    f"Optimization opportunity: ${total_savings_potential:,.2f} potential monthly savings",
-                    f"Cost health score: {health_check.get('overall_score', 0):.1f}/100"
-                ],
+                "executive_insights": [template.format_map(insight_values) for template in _INSIGHT_TEMPLATES],
                 "priority_actions": health_check.get("recommendations", [])[:3],  # Top 3 recommendations
                 "detailed_findings": health_check.get("findings", [])
             }
@@ -341,6 +614,7 @@ class FinOpsEngine:
             return executive_summary
             
         except Exception as e:
+            logger.exception("Error generating executive summary")
             return {"error": str(e), "message": "Unable to generate executive summary"}
     
     @classmethod
@@ -2,46 +2,171 @@
 Data export and report generation utilities
 """
 import polars as pl
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Union, Tuple
+import asyncio
+from collections import deque
+from functools import lru_cache, partial
 import json
 import csv
-import io
 from datetime import datetime
 from pathlib import Path
 
 
+# Rows converted to dicts at a time when streaming a DataFrame to a JSON file
+JSON_EXPORT_SLICE_ROWS = 10_000
+
+# Timestamp formats used in report headers and summaries
+_REPORT_TS_FMT = '%Y-%m-%d %H:%M:%S'
+_REPORT_DATE_FMT = '%Y-%m-%d'
+
+# Executive summary recommendation per risk level, and the fallback for unknown levels
+_RISK_RECOMMENDATIONS = {
+    "LOW": "Continue current monitoring and optimization practices",
+    "MEDIUM": "Increase monitoring frequency and implement cost controls",
+    "HIGH": "Immediate action required - review and implement cost optimization measures"
+}
+_RISK_DEFAULT = "Review cost management practices"
+
+
+@lru_cache(maxsize=4096)
+def _pretty_key(key: str) -> Tuple[str, bool, bool]:
+    """Return (display title, is cost field, is percentage field) for a report key."""
+    lowered = key.lower()
+    return key.replace('_', ' ').title(), 'cost' in lowered, 'percentage' in lowered
+
+
+def get_total_spend(kpi_data: Dict[str, Any]) -> float:
+    """Total spend from a KPI summary (overall_spend.spend_all_cost), 0 when missing."""
+    return (kpi_data.get('overall_spend') or {}).get('spend_all_cost', 0)
+
+
+def get_savings_potential(kpi_data: Dict[str, Any]) -> float:
+    """Potential savings from a KPI summary (savings_summary.total_potential_savings), 0 when missing."""
+    return (kpi_data.get('savings_summary') or {}).get('total_potential_savings', 0)
+
+
+def _json_default(value: Any) -> Any:
+    """json default hook: embed DataFrames as row lists via Polars' writer, stringify anything else."""
+    if isinstance(value, pl.DataFrame):
+        return json.loads(value.write_json())
+    return str(value)
+
+
+def _format_leaf(value: Any, is_cost: bool, is_pct: bool) -> str:
+    """Format a scalar report value: currency for cost fields, percent for percentage floats."""
+    if isinstance(value, (int, float)) and is_cost:
+        return f"${value:,.2f}"
+    if isinstance(value, float) and is_pct:
+        return f"{value:.1f}%"
+    return str(value)
+
+
+def _fmt_str(value: str, is_cost: bool, is_pct: bool) -> str:
+    return value
+
+
+def _fmt_int(value: int, is_cost: bool, is_pct: bool) -> str:
+    return f"${value:,.2f}" if is_cost else str(value)
+
+
+def _fmt_float(value: float, is_cost: bool, is_pct: bool) -> str:
+    if is_cost:
+        return f"${value:,.2f}"
+    if is_pct:
+        return f"{value:.1f}%"
+    return str(value)
+
+
+def _fmt_none(value: None, is_cost: bool, is_pct: bool) -> str:
+    return "None"
+
+
+# Exact-type fast paths for the common leaf values; other types go through _format_leaf
+_LEAF_FORMATTERS = {
+    str: _fmt_str,
+    int: _fmt_int,
+    float: _fmt_float,
+    type(None): _fmt_none,
+}
+
+
+def _walk_sections(lines: List[str], section_lines, data: Dict[str, Any], level: int) -> None:
+    """
+    Append a nested report to lines using an explicit stack instead of recursion.
+    
+    Args:
+        lines: Output list that lines are appended to
+        section_lines: Generator function (section_data, level) yielding lines or (dict, level) to descend into
+        data: Top-level report dictionary
+        level: Starting nesting level
+    """
+    stack = deque([section_lines(data, level)])
+    while stack:
+        item = next(stack[-1], None)
+        if item is None:
+            stack.pop()
+        elif isinstance(item, str):
+            lines.append(item)
+        else:
+            stack.append(section_lines(*item))
+
+
 class DataExporter:
     """Utility for exporting cost analytics data in various formats."""
     
     @staticmethod
     def export_to_json(data: Union[pl.DataFrame, Dict[str, Any]], 
                       file_path: Optional[str] = None,
-                      indent: int = 2) -> Union[str, None]:
+                      indent: Optional[int] = 2) -> Union[str, None]:
         """
         Export data to JSON format.
         
         Args:
-            data: DataFrame or dictionary to export
+            data: DataFrame or dictionary to export (DataFrame values inside a dictionary become row lists)
             file_path: Optional file path to save to
-            indent: JSON indentation level
+            indent: JSON indentation level; None writes compact JSON, using Polars' native writer for DataFrames
             
         Returns:
             JSON string if no file_path, None if saved to file
         """
+        if isinstance(data, pl.DataFrame) and indent is None:
+            # Serialized in Rust straight from Arrow buffers, no per-row Python dicts
+            if file_path:
+                data.write_json(file_path)
+                return None
+            return data.write_json()
+        
+        if file_path:
+            # Stream straight to disk rather than building the whole JSON string
+            with open(file_path, 'w', encoding='utf-8') as f:
+                if isinstance(data, pl.DataFrame):
+                    DataExporter._write_json_rows(data, f, indent)
+                else:
+                    json.dump(data, f, indent=indent, default=_json_default)
+            return None
+        
         if isinstance(data, pl.DataFrame):
             # Convert DataFrame to dictionary
             json_data = data.to_dicts()
         else:
             json_data = data
         
-        json_str = json.dumps(json_data, indent=indent, default=str)
+        return json.dumps(json_data, indent=indent, default=_json_default)
+    
+    @staticmethod
+    def _write_json_rows(df: pl.DataFrame, f, indent: int) -> None:
+        """Write a DataFrame as an indented JSON array of row objects, one slice at a time."""
+        row_prefix = "\n" + " " * indent
         
-        if file_path:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(json_str)
-            return None
-        else:
-            return json_str
+        f.write("[")
+        first = True
+        for chunk in df.iter_slices(n_rows=JSON_EXPORT_SLICE_ROWS):
+            for row in chunk.to_dicts():
+                # Nest the row one level deeper, as json.dumps does for list items
+                row_json = json.dumps(row, indent=indent, default=_json_default).replace("\n", row_prefix)
+                f.write(("" if first else ",") + row_prefix + row_json)
+                first = False
+        f.write("]" if first else "\n]")
     
     @staticmethod
     def export_to_csv(df: pl.DataFrame, 
@@ -62,10 +187,47 @@ class DataExporter:
             df.write_csv(file_path, include_header=include_headers)
             return None
         else:
-            # Return as string
-            output = io.StringIO()
-            df.write_csv(output, include_header=include_headers)
-            return output.getvalue()
+            # write_csv returns the CSV text directly when no file is given
+            return df.write_csv(include_header=include_headers)
+    
+    @staticmethod
+    async def export_to_json_async(data: Union[pl.DataFrame, Dict[str, Any]], 
+                                   file_path: Optional[str] = None,
+                                   indent: Optional[int] = 2) -> Union[str, None]:
+        """
+        Async variant of export_to_json; serialization and disk writes run in the default executor.
+        
+        Polars releases the GIL while serializing, so the event loop keeps serving
+        other requests (e.g. the next query) while the export is written.
+        
+        Args:
+            data: DataFrame or dictionary to export
+            file_path: Optional file path to save to
+            indent: JSON indentation level
+            
+        Returns:
+            JSON string if no file_path, None if saved to file
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(DataExporter.export_to_json, data, file_path, indent))
+    
+    @staticmethod
+    async def export_to_csv_async(df: pl.DataFrame, 
+                                  file_path: Optional[str] = None,
+                                  include_headers: bool = True) -> Union[str, None]:
+        """
+        Async variant of export_to_csv; serialization and disk writes run in the default executor.
+        
+        Args:
+            df: Polars DataFrame to export
+            file_path: Optional file path to save to
+            include_headers: Whether to include column headers
+            
+        Returns:
+            CSV string if no file_path, None if saved to file
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(DataExporter.export_to_csv, df, file_path, include_headers))
     
     @staticmethod
     def export_to_excel(df: pl.DataFrame, 
@@ -82,16 +244,16 @@ class DataExporter:
             include_headers: Whether to include column headers
         """
         try:
-            # Convert to pandas for Excel export (xlsxwriter dependency)
-            pandas_df = df.to_pandas()
-            pandas_df.to_excel(file_path, sheet_name=sheet_name, index=False, header=include_headers)
+            # Polars writes through xlsxwriter directly, no pandas conversion
+            df.write_excel(workbook=file_path, worksheet=sheet_name, include_header=include_headers)
         except ImportError:
-            raise ImportError("Excel export requires pandas and openpyxl/xlsxwriter. Install with: pip install pandas openpyxl")
+            raise ImportError("Excel export requires xlsxwriter. Install with: pip install xlsxwriter")
     
     @staticmethod
     def export_summary_report(data: Dict[str, Any], 
                             format: str = "json",
-                            file_path: Optional[str] = None) -> Union[str, None]:
+                            file_path: Optional[str] = None,
+                            generated_at: Optional[datetime] = None) -> Union[str, None]:
         """
         Export formatted summary report.
         
@@ -99,6 +261,7 @@ class DataExporter:
             data: Summary data dictionary
             format: Export format (json, txt, markdown)
             file_path: Optional file path to save to
+            generated_at: Report timestamp (defaults to now); pass one value when generating reports in a batch
             
         Returns:
             Formatted string if no file_path, None if saved to file
@@ -107,10 +270,10 @@ class DataExporter:
             return DataExporter.export_to_json(data, file_path)
         
         elif format.lower() == "txt":
-            report_text = DataExporter._format_text_report(data)
+            report_text = DataExporter._format_text_report(data, generated_at)
             
         elif format.lower() == "markdown":
-            report_text = DataExporter._format_markdown_report(data)
+            report_text = DataExporter._format_markdown_report(data, generated_at)
             
         else:
             raise ValueError(f"Unsupported format: {format}")
@@ -123,88 +286,78 @@ class DataExporter:
             return report_text
     
     @staticmethod
-    def _format_text_report(data: Dict[str, Any]) -> str:
+    def _format_text_report(data: Dict[str, Any], generated_at: Optional[datetime] = None) -> str:
         """Format data as plain text report."""
         lines = []
         lines.append("FINOPS COST ANALYTICS REPORT")
         lines.append("=" * 40)
-        lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        lines.append(f"Generated: {(generated_at or datetime.now()).strftime(_REPORT_TS_FMT)}")
         lines.append("")
         
-        def format_section(section_data, level=0):
+        def section_lines(section_data, level):
+            # Yields output lines, or (nested dict, level) to descend into
             indent = "  " * level
-            section_lines = []
             
             for key, value in section_data.items():
-                if isinstance(value, dict):
-                    section_lines.append(f"{indent}{key.replace('_', ' ').title()}:")
-                    section_lines.extend(format_section(value, level + 1))
+                pretty, is_cost, is_pct = _pretty_key(key)
+                leaf = _LEAF_FORMATTERS.get(type(value))
+                if leaf is not None:
+                    yield f"{indent}{pretty}: {leaf(value, is_cost, is_pct)}"
+                elif isinstance(value, dict):
+                    yield f"{indent}{pretty}:"
+                    yield value, level + 1
                 elif isinstance(value, list):
-                    section_lines.append(f"{indent}{key.replace('_', ' ').title()}:")
+                    yield f"{indent}{pretty}:"
                     for item in value[:5]:  # Limit to 5 items
                         if isinstance(item, dict):
-                            section_lines.extend(format_section(item, level + 1))
+                            yield item, level + 1
                         else:
-                            section_lines.append(f"{indent}  - {item}")
+                            yield f"{indent}  - {item}"
                     if len(value) > 5:
-                        section_lines.append(f"{indent}  ... and {len(value) - 5} more")
+                        yield f"{indent}  ... and {len(value) - 5} more"
                 else:
-                    formatted_key = key.replace('_', ' ').title()
-                    if isinstance(value, (int, float)) and 'cost' in key.lower():
-                        formatted_value = f"${value:,.2f}"
-                    elif isinstance(value, float) and 'percentage' in key.lower():
-                        formatted_value = f"{value:.1f}%"
-                    else:
-                        formatted_value = str(value)
-                    section_lines.append(f"{indent}{formatted_key}: {formatted_value}")
-            
-            return section_lines
+                    yield f"{indent}{pretty}: {_format_leaf(value, is_cost, is_pct)}"
         
-        lines.extend(format_section(data))
+        _walk_sections(lines, section_lines, data, 0)
         return "\n".join(lines)
     
     @staticmethod
-    def _format_markdown_report(data: Dict[str, Any]) -> str:
+    def _format_markdown_report(data: Dict[str, Any], generated_at: Optional[datetime] = None) -> str:
         """Format data as Markdown report."""
         lines = []
         lines.append("# FinOps Cost Analytics Report")
         lines.append("")
-        lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        lines.append(f"**Generated:** {(generated_at or datetime.now()).strftime(_REPORT_TS_FMT)}")
         lines.append("")
         
-        def format_section(section_data, level=2):
-            section_lines = []
-            
+        def section_lines(section_data, level):
+            # Yields output lines, or (nested dict, level) to descend into
             for key, value in section_data.items():
-                if isinstance(value, dict):
-                    section_lines.append(f"{'#' * level} {key.replace('_', ' ').title()}")
-                    section_lines.append("")
-                    section_lines.extend(format_section(value, level + 1))
+                pretty, is_cost, is_pct = _pretty_key(key)
+                leaf = _LEAF_FORMATTERS.get(type(value))
+                if leaf is not None:
+                    yield f"**{pretty}:** {leaf(value, is_cost, is_pct)}"
+                    yield ""
+                elif isinstance(value, dict):
+                    yield f"{'#' * level} {pretty}"
+                    yield ""
+                    yield value, level + 1
                 elif isinstance(value, list):
-                    section_lines.append(f"{'#' * level} {key.replace('_', ' ').title()}")
-                    section_lines.append("")
+                    yield f"{'#' * level} {pretty}"
+                    yield ""
                     for item in value[:10]:  # Limit to 10 items
                         if isinstance(item, dict):
-                            section_lines.extend(format_section(item, level + 1))
+                            yield item, level + 1
                         else:
-                            section_lines.append(f"- {item}")
+                            yield f"- {item}"
                     if len(value) > 10:
-                        section_lines.append(f"- *... and {len(value) - 10} more items*")
-                    section_lines.append("")
+                        yield f"- *... and {len(value) - 10} more items*"
+                    yield ""
                 else:
-                    formatted_key = key.replace('_', ' ').title()
-                    if isinstance(value, (int, float)) and 'cost' in key.lower():
-                        formatted_value = f"${value:,.2f}"
-                    elif isinstance(value, float) and 'percentage' in key.lower():
-                        formatted_value = f"{value:.1f}%"
-                    else:
-                        formatted_value = str(value)
-                    section_lines.append(f"**{formatted_key}:** {formatted_value}")
-                    section_lines.append("")
-            
-            return section_lines
+                    yield f"**{pretty}:** {_format_leaf(value, is_cost, is_pct)}"
+                    yield ""
         
-        lines.extend(format_section(data))
+        _walk_sections(lines, section_lines, data, 2)
         return "\n".join(lines)
 
 
@@ -214,7 +367,8 @@ class ReportGenerator:
     @staticmethod
     def generate_executive_summary(kpi_data: Dict[str, Any], 
                                  spend_data: Dict[str, Any],
-                                 optimization_data: Dict[str, Any]) -> Dict[str, Any]:
+                                 optimization_data: Dict[str, Any],
+                                 generated_at: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Generate executive summary report.
         
@@ -222,13 +376,14 @@ class ReportGenerator:
             kpi_data: KPI summary data
             spend_data: Spend analytics data
             optimization_data: Optimization recommendations
+            generated_at: Report timestamp (defaults to now); pass one value when generating reports in a batch
             
         Returns:
             Executive summary dictionary
         """
         # Extract key metrics
-        total_spend = kpi_data.get('overall_spend', {}).get('spend_all_cost', 0)
-        savings_potential = kpi_data.get('savings_summary', {}).get('total_potential_savings', 0)
+        total_spend = get_total_spend(kpi_data)
+        savings_potential = get_savings_potential(kpi_data)
         mom_change = spend_data.get('mom_change', 0)
         
         # Calculate key ratios
@@ -236,7 +391,7 @@ class ReportGenerator:
         
         summary = {
             "executive_summary": {
-                "report_date": datetime.now().strftime('%Y-%m-%d'),
+                "report_date": (generated_at or datetime.now()).strftime(_REPORT_DATE_FMT),
                 "key_metrics": {
                     "current_monthly_spend": total_spend,
                     "optimization_potential": savings_potential,
@@ -259,12 +414,12 @@ class ReportGenerator:
         highlights = []
         
         # Spend highlights
-        total_spend = kpi_data.get('overall_spend', {}).get('spend_all_cost', 0)
+        total_spend = get_total_spend(kpi_data)
         if total_spend > 0:
             highlights.append(f"Monthly cloud spend: ${total_spend:,.2f}")
         
         # Savings highlights
-        savings_potential = kpi_data.get('savings_summary', {}).get('total_potential_savings', 0)
+        savings_potential = get_savings_potential(kpi_data)
         if savings_potential > 0:
             highlights.append(f"Identified ${savings_potential:,.2f} in potential monthly savings")
         
@@ -336,9 +491,4 @@ class ReportGenerator:
     @staticmethod
     def _get_risk_recommendation(risk_level: str) -> str:
         """Get recommendation based on risk level."""
-        recommendations = {
-            "LOW": "Continue current monitoring and optimization practices",
-            "MEDIUM": "Increase monitoring frequency and implement cost controls",
-            "HIGH": "Immediate action required - review and implement cost optimization measures"
-        }
-        return recommendations.get(risk_level, "Review cost management practices")
\ No newline at end of file
+        return _RISK_RECOMMENDATIONS.get(risk_level, _RISK_DEFAULT)
\ No newline at end of file
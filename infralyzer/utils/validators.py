@@ -2,25 +2,146 @@
 Validation utilities for data quality and configuration validation
 """
 import polars as pl
-from typing import Dict, List, Any, Optional, Union
-from datetime import datetime
+from typing import Dict, List, Any, Optional, Union, Tuple, Sequence
+from datetime import datetime, timezone
+from collections import OrderedDict
+from functools import lru_cache
+import os
 import re
+import shutil
+import string
+import threading
+
+
+# Date format pattern for monthly billing periods (YYYY-MM)
+_MONTH_DATE_RE = re.compile(r'^\d{4}-\d{2}$')
+# Date format pattern for daily periods (YYYY-MM-DD)
+_DAY_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+# Expected date format pattern per data export type
+_DATE_FORMAT_PATTERNS = {
+    'CUR2.0': _MONTH_DATE_RE,
+    'FOCUS1.0': _MONTH_DATE_RE,
+    'COH': _DAY_DATE_RE,
+    'CARBON_EMISSION': _MONTH_DATE_RE
+}
+# Human-readable date format per data export type
+_DATE_FORMAT_DESCRIPTIONS = {
+    'CUR2.0': 'YYYY-MM (e.g., 2025-01)',
+    'FOCUS1.0': 'YYYY-MM (e.g., 2025-01)',
+    'COH': 'YYYY-MM-DD (e.g., 2025-01-15)',
+    'CARBON_EMISSION': 'YYYY-MM (e.g., 2025-01)'
+}
+# Columns a cost DataFrame must contain
+_REQUIRED_COST_COLUMNS = ('line_item_unblended_cost',)
+# Columns whose null share is reported by validate_cost_data
+_CRITICAL_COST_COLUMNS = ('line_item_unblended_cost', 'product_servicecode')
+# Columns that uniquely identify a CUR line item row
+CUR_UNIQUE_KEY = ('identity_line_item_id', 'line_item_usage_start_date')
+# Frames larger than this skip the full-row duplicate check by default
+DUPLICATE_CHECK_MAX_ROWS = 1_000_000
+# Number of cached date-range and S3 config validation results
+VALIDATION_CACHE_SIZE = 256
+# Number of cached validate_cost_data results (keyed by caller-supplied cache_key)
+COST_VALIDATION_CACHE_SIZE = 32
+# Supported data export types
+_VALID_EXPORT_TYPES = ('CUR2.0', 'FOCUS1.0', 'COH', 'CARBON_EMISSION')
+# S3 bucket names must start and end with a lowercase letter or number
+_S3_BUCKET_EDGE_CHARS = frozenset(string.ascii_lowercase + string.digits)
+# S3 bucket names may only contain lowercase letters, numbers, hyphens and periods
+_S3_BUCKET_CHARS = string.ascii_lowercase + string.digits + '.-'
+# Bucket names made only of these characters may be formatted as an IP address
+_IP_ADDRESS_CHARS = string.digits + '.'
+# S3 bucket names cannot be formatted as an IP address
+_S3_BUCKET_IP_RE = re.compile(r'^\d+\.\d+\.\d+\.\d+$')
+
+_cost_validation_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_cost_validation_cache_lock = threading.Lock()
+
+
+def _probe_path(path: str) -> Tuple[bool, bool]:
+    """
+    Return (exists, writable) for a path with as few syscalls as possible.
+    
+    A successful os.access(W_OK) implies the path exists, so os.stat only runs
+    to tell a missing path from an existing read-only one.
+    """
+    try:
+        if os.access(path, os.W_OK):
+            return True, True
+        os.stat(path)
+        return True, False
+    except (OSError, ValueError):
+        return False, False
+
+
+def _free_disk_space(path: str) -> int:
+    """Return the bytes available to unprivileged users on the filesystem holding path."""
+    if hasattr(os, 'statvfs'):
+        stats = os.statvfs(path)
+        return stats.f_bavail * stats.f_frsize
+    return shutil.disk_usage(path).free
+
+
+def _copy_validation_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached validation result so callers cannot mutate the cache."""
+    return {key: list(value) if isinstance(value, list) else value for key, value in result.items()}
 
 
 class DataValidator:
     """Utility for validating cost data quality and consistency."""
     
     @staticmethod
-    def validate_cost_data(df: pl.DataFrame) -> Dict[str, Any]:
+    def validate_cost_data(df: pl.DataFrame, exact: bool = True,
+                           max_duplicate_check_rows: Optional[int] = DUPLICATE_CHECK_MAX_ROWS,
+                           cache_key: Optional[str] = None,
+                           unique_key: Optional[Sequence[str]] = CUR_UNIQUE_KEY) -> Dict[str, Any]:
         """
         Validate cost data DataFrame for common quality issues.
         
         Args:
             df: Polars DataFrame with cost data
+            exact: Count duplicate rows exactly; when False, estimate the
+                distinct row count with HyperLogLog (approx_n_unique) over row hashes
+            max_duplicate_check_rows: Skip the full-row duplicate check for frames
+                with more rows than this (None always runs it)
+            cache_key: Optional identifier of the source data (e.g. an S3 ETag);
+                results are reused while the key, row count and columns match
+            unique_key: Columns identifying a row; when all are present, duplicates
+                are counted on these columns instead of hashing whole rows
             
         Returns:
             Dictionary with validation results and recommendations
         """
+        unique_key = tuple(unique_key or ())
+        if cache_key is None:
+            return DataValidator._compute_cost_validation(df, exact, max_duplicate_check_rows, unique_key)
+        
+        entry_key = (cache_key, df.height, tuple(df.columns), exact, max_duplicate_check_rows, unique_key)
+        with _cost_validation_cache_lock:
+            cached = _cost_validation_cache.get(entry_key)
+            if cached is not None:
+                _cost_validation_cache.move_to_end(entry_key)
+                return _copy_validation_result(cached)
+        
+        result = DataValidator._compute_cost_validation(df, exact, max_duplicate_check_rows, unique_key)
+        with _cost_validation_cache_lock:
+            _cost_validation_cache[entry_key] = _copy_validation_result(result)
+            while len(_cost_validation_cache) > COST_VALIDATION_CACHE_SIZE:
+                _cost_validation_cache.popitem(last=False)
+        return result
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached validation results."""
+        with _cost_validation_cache_lock:
+            _cost_validation_cache.clear()
+        _check_date_range.cache_clear()
+    
+    @staticmethod
+    def _compute_cost_validation(df: pl.DataFrame, exact: bool,
+                                 max_duplicate_check_rows: Optional[int],
+                                 unique_key: Tuple[str, ...]) -> Dict[str, Any]:
+        """Run the cost data quality checks behind validate_cost_data."""
         if df.is_empty():
             return {
                 "valid": False,
@@ -33,68 +154,112 @@ class DataValidator:
         warnings = []
         
         # Check for required columns
-        required_columns = ['line_item_unblended_cost']
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        columns = set(df.columns)
+        missing_columns = [col for col in _REQUIRED_COST_COLUMNS if col not in columns]
         
         if missing_columns:
             issues.append(f"Missing required columns: {missing_columns}")
             recommendations.append("Verify data export configuration")
         
+        # Collect every column statistic in a single aggregation pass
+        cost_column = 'line_item_unblended_cost'
+        date_column = 'line_item_usage_start_date'
+        critical_columns = [col for col in _CRITICAL_COST_COLUMNS if col in columns]
+        aggregations = [pl.len().alias('rows')]
+        if cost_column in columns:
+            aggregations.append(pl.col(cost_column).lt(0).sum().alias('negative_cost_count'))
+        aggregations.extend(pl.col(col).null_count().alias(f'null_{col}') for col in critical_columns)
+        if date_column in columns:
+            aggregations.append(pl.col(date_column).max().is_not_null().alias('has_latest_date'))
+            aggregations.append(
+                DataValidator._days_since_latest(date_column, df.schema[date_column]).alias('days_old')
+            )
+        stats = df.lazy().select(aggregations).collect().row(0, named=True)
+        total_rows = stats['rows']
+        
         # Check for negative costs (should be rare)
-        if 'line_item_unblended_cost' in df.columns:
-            negative_costs = df.filter(pl.col('line_item_unblended_cost') < 0).height
+        if cost_column in columns:
+            negative_costs = stats['negative_cost_count']
             if negative_costs > 0:
                 warnings.append(f"Found {negative_costs} rows with negative costs")
                 recommendations.append("Review negative cost entries - may indicate credits or refunds")
         
         # Check for null values in critical columns
-        critical_columns = ['line_item_unblended_cost', 'product_servicecode']
         for col in critical_columns:
-            if col in df.columns:
-                null_count = df.filter(pl.col(col).is_null()).height
-                total_rows = df.height
-                null_percentage = (null_count / total_rows) * 100 if total_rows > 0 else 0
-                
-                if null_percentage > 10:
-                    issues.append(f"High null percentage in {col}: {null_percentage:.1f}%")
-                    recommendations.append(f"Investigate data quality issues in {col}")
-                elif null_percentage > 0:
-                    warnings.append(f"Some null values in {col}: {null_percentage:.1f}%")
+            null_count = stats[f'null_{col}']
+            null_percentage = (null_count / total_rows) * 100 if total_rows > 0 else 0
+            
+            if null_percentage > 10:
+                issues.append(f"High null percentage in {col}: {null_percentage:.1f}%")
+                recommendations.append(f"Investigate data quality issues in {col}")
+            elif null_percentage > 0:
+                warnings.append(f"Some null values in {col}: {null_percentage:.1f}%")
         
         # Check for data freshness
-        if 'line_item_usage_start_date' in df.columns:
-            try:
-                latest_date = df.select(pl.col('line_item_usage_start_date').max()).item()
-                if latest_date:
-                    if isinstance(latest_date, str):
-                        latest_date = datetime.fromisoformat(latest_date.replace('Z', '+00:00'))
-                    
-                    days_old = (datetime.now() - latest_date).days
-                    if days_old > 7:
-                        warnings.append(f"Data may be stale - latest date is {days_old} days old")
-                        recommendations.append("Check if data refresh is needed")
-            except Exception:
+        if date_column in columns and stats['has_latest_date']:
+            days_old = stats['days_old']
+            if days_old is None:
                 warnings.append("Unable to validate data freshness")
-        
-        # Check for duplicate records
-        if df.height > 0:
-            unique_count = df.unique().height
-            duplicate_count = df.height - unique_count
+            elif days_old > 7:
+                warnings.append(f"Data may be stale - latest date is {days_old} days old")
+                recommendations.append("Check if data refresh is needed")
+        
+        # Check for duplicate records on the row key when it is present, else on
+        # whole rows; only the estimate hashes rows, since 64-bit row hashes can
+        # collide and undercount distinct rows
+        key_columns = list(unique_key) if unique_key and all(col in columns for col in unique_key) else None
+        if key_columns is None and max_duplicate_check_rows is not None and total_rows > max_duplicate_check_rows:
+            recommendations.append(
+                f"Duplicate check skipped for {total_rows:,} rows - "
+                f"pass max_duplicate_check_rows=None to run it"
+            )
+        elif total_rows > 0:
+            rows = df.select(key_columns) if key_columns else df
+            if exact:
+                duplicate_count = total_rows - rows.n_unique()
+            else:
+                duplicate_count = max(0, total_rows - rows.hash_rows().approx_n_unique())
             if duplicate_count > 0:
-                duplicate_percentage = (duplicate_count / df.height) * 100
-                warnings.append(f"Found {duplicate_count} duplicate rows ({duplicate_percentage:.1f}%)")
+                duplicate_percentage = (duplicate_count / total_rows) * 100
+                estimate_note = "" if exact else "an estimated "
+                warnings.append(f"Found {estimate_note}{duplicate_count} duplicate rows ({duplicate_percentage:.1f}%)")
                 recommendations.append("Consider deduplication if duplicates are unexpected")
         
         return {
             "valid": len(issues) == 0,
             "total_rows": df.height,
-            "total_columns": len(df.columns),
+            "total_columns": df.width,
             "issues": issues,
             "warnings": warnings,
             "recommendations": recommendations,
             "data_quality_score": DataValidator._calculate_quality_score(issues, warnings, df.height)
         }
     
+    @staticmethod
+    def _days_since_latest(column: str, dtype: pl.DataType) -> pl.Expr:
+        """
+        Build an expression for the age in whole days of the latest value in a column.
+        
+        Args:
+            column: Usage date column name
+            dtype: Polars dtype of the column
+            
+        Returns:
+            Expression evaluating to the age in days, or null when the latest
+            value cannot be interpreted as a timestamp
+        """
+        latest = pl.col(column).max()
+        if dtype == pl.String:
+            # Only the maximum (ISO-ordered) string is parsed; naive values are read as UTC
+            latest = latest.str.to_datetime(strict=False, time_zone='UTC')
+        elif isinstance(dtype, pl.Datetime) and dtype.time_zone is not None:
+            latest = latest.dt.convert_time_zone('UTC')
+        elif dtype == pl.Date or isinstance(dtype, pl.Datetime):
+            return (pl.lit(datetime.now()) - latest).dt.total_days()
+        else:
+            return pl.lit(None, dtype=pl.Int64)
+        return (pl.lit(datetime.now(timezone.utc)) - latest).dt.total_days()
+    
     @staticmethod
     def _calculate_quality_score(issues: List[str], warnings: List[str], total_rows: int) -> float:
         """Calculate a data quality score from 0-100."""
@@ -124,39 +289,10 @@ class DataValidator:
         Returns:
             Validation result
         """
-        issues = []
-        
-        # Expected date formats by export type
-        expected_formats = {
-            'CUR2.0': r'^\d{4}-\d{2}$',  # YYYY-MM
-            'FOCUS1.0': r'^\d{4}-\d{2}$',  # YYYY-MM
-            'COH': r'^\d{4}-\d{2}-\d{2}$',  # YYYY-MM-DD
-            'CARBON_EMISSION': r'^\d{4}-\d{2}$'  # YYYY-MM
-        }
-        
-        format_pattern = expected_formats.get(export_type, r'^\d{4}-\d{2}$')
-        format_description = {
-            'CUR2.0': 'YYYY-MM (e.g., 2025-01)',
-            'FOCUS1.0': 'YYYY-MM (e.g., 2025-01)', 
-            'COH': 'YYYY-MM-DD (e.g., 2025-01-15)',
-            'CARBON_EMISSION': 'YYYY-MM (e.g., 2025-01)'
-        }.get(export_type, 'YYYY-MM')
-        
-        # Validate start_date format
-        if start_date and not re.match(format_pattern, start_date):
-            issues.append(f"start_date format invalid. Expected: {format_description}")
-        
-        # Validate end_date format
-        if end_date and not re.match(format_pattern, end_date):
-            issues.append(f"end_date format invalid. Expected: {format_description}")
-        
-        # Validate date logic
-        if start_date and end_date and start_date > end_date:
-            issues.append("start_date cannot be after end_date")
-        
+        issues, format_description = _check_date_range(start_date, end_date, export_type)
         return {
             "valid": len(issues) == 0,
-            "issues": issues,
+            "issues": list(issues),
             "expected_format": format_description
         }
 
@@ -179,52 +315,39 @@ class ConfigValidator:
         Returns:
             Validation result
         """
-        issues = []
-        warnings = []
-        
-        # Validate bucket name
-        if not s3_bucket:
-            issues.append("S3 bucket name is required")
-        elif not ConfigValidator._is_valid_s3_bucket_name(s3_bucket):
-            issues.append("S3 bucket name format is invalid")
-        
-        # Validate prefix
-        if not s3_prefix:
-            warnings.append("S3 prefix is empty - will search entire bucket")
-        elif s3_prefix.startswith('/'):
-            warnings.append("S3 prefix should not start with '/'")
-        
-        # Validate export type
-        valid_export_types = ['CUR2.0', 'FOCUS1.0', 'COH', 'CARBON_EMISSION']
-        if data_export_type not in valid_export_types:
-            issues.append(f"Invalid data_export_type. Must be one of: {valid_export_types}")
-        
+        issues, warnings = _check_s3_config(s3_bucket, s3_prefix, data_export_type)
         return {
             "valid": len(issues) == 0,
-            "issues": issues,
-            "warnings": warnings
+            "issues": list(issues),
+            "warnings": list(warnings)
         }
     
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached S3 configuration validation results."""
+        _check_s3_config.cache_clear()
+    
     @staticmethod
     def _is_valid_s3_bucket_name(bucket_name: str) -> bool:
         """Validate S3 bucket name according to AWS rules."""
-        if len(bucket_name) < 3 or len(bucket_name) > 63:
+        if not 3 <= len(bucket_name) <= 63:
             return False
         
         # Must start and end with lowercase letter or number
-        if not re.match(r'^[a-z0-9].*[a-z0-9]$', bucket_name):
-            return False
-        
-        # Can contain lowercase letters, numbers, hyphens, and periods
-        if not re.match(r'^[a-z0-9.-]+$', bucket_name):
+        if bucket_name[0] not in _S3_BUCKET_EDGE_CHARS or bucket_name[-1] not in _S3_BUCKET_EDGE_CHARS:
             return False
         
         # Cannot contain consecutive periods
         if '..' in bucket_name:
             return False
         
-        # Cannot be formatted as IP address
-        if re.match(r'^\d+\.\d+\.\d+\.\d+$', bucket_name):
+        # Can contain lowercase letters, numbers, hyphens, and periods
+        # (lstrip leaves nothing behind only when every character is allowed)
+        if bucket_name.lstrip(_S3_BUCKET_CHARS):
+            return False
+        
+        # Cannot be formatted as IP address (only possible for digits and periods)
+        if not bucket_name.lstrip(_IP_ADDRESS_CHARS) and _S3_BUCKET_IP_RE.match(bucket_name):
             return False
         
         return True
@@ -247,25 +370,25 @@ class ConfigValidator:
             return {"valid": True, "issues": [], "warnings": ["No local path specified"]}
         
         # Check if path exists
-        import os
-        if not os.path.exists(local_path):
+        path_exists, path_writable = _probe_path(local_path)
+        if not path_exists:
             warnings.append(f"Local path does not exist: {local_path}")
             
             # Check if parent directory exists and is writable
             parent_dir = os.path.dirname(local_path)
-            if not os.path.exists(parent_dir):
+            parent_exists, parent_writable = _probe_path(parent_dir)
+            if not parent_exists:
                 issues.append(f"Parent directory does not exist: {parent_dir}")
-            elif not os.access(parent_dir, os.W_OK):
+            elif not parent_writable:
                 issues.append(f"Cannot write to parent directory: {parent_dir}")
         else:
             # Check if path is writable
-            if not os.access(local_path, os.W_OK):
+            if not path_writable:
                 issues.append(f"Local path is not writable: {local_path}")
             
             # Check available space (warning if < 1GB)
             try:
-                import shutil
-                free_space = shutil.disk_usage(local_path).free
+                free_space = _free_disk_space(local_path)
                 if free_space < 1_000_000_000:  # 1GB
                     warnings.append(f"Low disk space available: {free_space / 1_000_000_000:.1f}GB")
             except Exception:
@@ -275,4 +398,56 @@ class ConfigValidator:
             "valid": len(issues) == 0,
             "issues": issues,
             "warnings": warnings
-        }
\ No newline at end of file
+        }
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _check_date_range(start_date: Optional[str],
+                      end_date: Optional[str],
+                      export_type: str) -> Tuple[Tuple[str, ...], str]:
+    """Return the (issues, expected format) for a date range, cached per input."""
+    issues = []
+    
+    format_pattern = _DATE_FORMAT_PATTERNS.get(export_type, _MONTH_DATE_RE)
+    format_description = _DATE_FORMAT_DESCRIPTIONS.get(export_type, 'YYYY-MM')
+    
+    # Validate start_date format
+    if start_date and not format_pattern.match(start_date):
+        issues.append(f"start_date format invalid. Expected: {format_description}")
+    
+    # Validate end_date format
+    if end_date and not format_pattern.match(end_date):
+        issues.append(f"end_date format invalid. Expected: {format_description}")
+    
+    # Validate date logic
+    if start_date and end_date and start_date > end_date:
+        issues.append("start_date cannot be after end_date")
+    
+    return tuple(issues), format_description
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _check_s3_config(s3_bucket: str,
+                     s3_prefix: str,
+                     data_export_type: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Return the (issues, warnings) for an S3 configuration, cached per input."""
+    issues = []
+    warnings = []
+    
+    # Validate bucket name
+    if not s3_bucket:
+        issues.append("S3 bucket name is required")
+    elif not ConfigValidator._is_valid_s3_bucket_name(s3_bucket):
+        issues.append("S3 bucket name format is invalid")
+    
+    # Validate prefix
+    if not s3_prefix:
+        warnings.append("S3 prefix is empty - will search entire bucket")
+    elif s3_prefix.startswith('/'):
+        warnings.append("S3 prefix should not start with '/'")
+    
+    # Validate export type
+    if data_export_type not in _VALID_EXPORT_TYPES:
+        issues.append(f"Invalid data_export_type. Must be one of: {list(_VALID_EXPORT_TYPES)}")
+    
+    return tuple(issues), tuple(warnings)
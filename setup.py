@@ -13,7 +13,7 @@ setup(
         "s3fs>=2023.1.0",     # S3 filesystem
         
         # Optional engines
-        "polars>=0.18.0",     # Polars engine
+        "polars>=1.12.0",     # Polars engine
         
         # API framework
         "fastapi>=0.100.0",   # API framework
@@ -0,0 +1,261 @@
+"""
+Test 17: Data Partitioner
+=========================
+
+This test exercises DataPartitioner against a small local CUR dataset:
+parallel and sequential SQL file runs, the '.cache' result skip,
+Hive-partitioned analytics tables and source subset exports.
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path to import local infralyzer module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import polars as pl
+
+from infralyzer import DataConfig, DataExportType
+from infralyzer.data.data_partitioner import DataPartitioner
+
+
+ACCOUNTS = ["111111111111", "222222222222", "333333333333"]
+SERVICES = ["AmazonEC2", "AmazonS3", "AWSLambda"]
+
+
+def _write_local_cur_data(local_path: Path) -> int:
+    """Write two billing periods of synthetic CUR rows under the local data layout."""
+    total_rows = 0
+    for billing_period in ("2025-01", "2025-02"):
+        partition_dir = local_path / "test-bucket" / "cur2" / "data" / f"BILLING_PERIOD={billing_period}"
+        partition_dir.mkdir(parents=True)
+        rows = 90
+        pl.DataFrame({
+            "line_item_usage_account_id": [ACCOUNTS[i % len(ACCOUNTS)] for i in range(rows)],
+            "product_servicecode": [SERVICES[(i // 3) % len(SERVICES)] for i in range(rows)],
+            "line_item_unblended_cost": [float(i) for i in range(rows)],
+            "billing_period": [billing_period] * rows,
+        }).write_parquet(partition_dir / "part.parquet")
+        total_rows += rows
+    return total_rows
+
+
+def _write_query_library(library_path: Path) -> None:
+    """Write a two-category query library matching the partitioner's default strategies."""
+    (library_path / "analytics").mkdir(parents=True)
+    (library_path / "analytics" / "amazon_athena.sql").write_text(
+        "-- Description: Cost by account and billing period\n"
+        "-- Partitioning: billing_period\n"
+        "SELECT line_item_usage_account_id, billing_period,\n"
+        "       SUM(line_item_unblended_cost) AS cost\n"
+        "FROM CUR\n"
+        "GROUP BY line_item_usage_account_id, billing_period\n"
+    )
+    (library_path / "analytics" / "service_costs.sql").write_text(
+        "-- Description: Cost by service\n"
+        "SELECT product_servicecode, SUM(line_item_unblended_cost) AS cost\n"
+        "FROM CUR\n"
+        "GROUP BY product_servicecode\n"
+    )
+    (library_path / "analytics" / "row_count.sql").write_text(
+        "SELECT COUNT(*) AS row_count FROM CUR\n"
+    )
+
+
+def _create_partitioner(work_dir: Path, **config_options) -> DataPartitioner:
+    """Build a DuckDB-backed partitioner over local data in a scratch directory."""
+    _write_local_cur_data(work_dir / "local")
+    _write_query_library(work_dir / "library")
+
+    config = DataConfig(
+        s3_bucket='test-bucket',
+        s3_data_prefix='cur2/data',
+        data_export_type=DataExportType.CUR_2_0,
+        table_name='CUR',
+        local_data_path=str(work_dir / "local"),
+        prefer_local_data=True,
+        prefetch_on_init=False,
+        **config_options
+    )
+
+    return DataPartitioner(
+        config,
+        engine_name="duckdb",
+        query_library_path=str(work_dir / "library"),
+        output_path=str(work_dir / "output")
+    )
+
+
+def test_run_sql_files_parallel_and_sequential():
+    """Parallel and sequential runs write the same parquet results"""
+
+    print("Test 17: Data Partitioner")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        partitioner = _create_partitioner(Path(tmp_dir))
+        sql_files = partitioner.discover_sql_files()["analytics"]
+        assert len(sql_files) == 3
+
+        parallel_results = partitioner.run_sql_files(sql_files, max_workers=4, force=True)
+        parallel_outputs = {
+            sql_file: pl.read_parquet(result["output_path"]).sort(pl.all())
+            for sql_file, result in parallel_results.items()
+        }
+
+        sequential_results = partitioner.run_sql_files(sql_files, max_workers=1, force=True)
+
+        for sql_file in sql_files:
+            print(f"   {sql_file}: {sequential_results[sql_file]}")
+            assert parallel_results[sql_file]["status"] == "success"
+            assert sequential_results[sql_file]["status"] == "success"
+            assert "cached" not in sequential_results[sql_file]
+            sequential_output = pl.read_parquet(sequential_results[sql_file]["output_path"]).sort(pl.all())
+            assert sequential_output.equals(parallel_outputs[sql_file])
+
+        row_count = pl.read_parquet(sequential_results["analytics/row_count.sql"]["output_path"])
+        assert row_count["row_count"][0] == 180
+
+    print("Parallel and sequential runs match")
+
+
+def test_run_sql_file_cache_skip():
+    """A second run reuses the '.cache' sidecar until the SQL or source data changes"""
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        partitioner = _create_partitioner(Path(tmp_dir))
+        sql_file = "analytics/service_costs.sql"
+
+        first_run = partitioner.run_sql_file(sql_file)
+        assert first_run["status"] == "success"
+        assert "cached" not in first_run
+        assert Path(f"{first_run['output_path']}.cache").exists()
+
+        second_run = partitioner.run_sql_file(sql_file)
+        assert second_run["cached"] is True
+        assert second_run["rows"] == first_run["rows"] == len(SERVICES)
+        assert second_run["columns"] == first_run["columns"]
+
+        forced_run = partitioner.run_sql_file(sql_file, force=True)
+        assert "cached" not in forced_run
+
+        # Editing the query changes the cache key
+        (Path(tmp_dir) / "library" / sql_file).write_text(
+            "SELECT product_servicecode FROM CUR GROUP BY product_servicecode\n"
+        )
+        partitioner.refresh_sql_files()
+        edited_run = partitioner.run_sql_file(sql_file)
+        assert "cached" not in edited_run
+        assert edited_run["columns"] == 1
+
+    print("Result cache skip verified")
+
+
+def test_run_sql_file_cache_date_range():
+    """Changing the configured date range re-runs a query over the same source files"""
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        partitioner = _create_partitioner(Path(tmp_dir), date_start='2025-01', date_end='2025-02')
+        sql_file = "analytics/row_count.sql"
+
+        first_run = partitioner.run_sql_file(sql_file)
+        assert "cached" not in first_run
+        assert pl.read_parquet(first_run["output_path"])["row_count"][0] == 180
+
+        # The source fingerprint is reused within its TTL, so only the date range changes
+        partitioner.config.date_start = '2025-02'
+        second_run = partitioner.run_sql_file(sql_file)
+        assert "cached" not in second_run
+        assert pl.read_parquet(second_run["output_path"])["row_count"][0] == 90
+
+        assert partitioner.run_sql_file(sql_file)["cached"] is True
+
+    print("Date range cache invalidation verified")
+
+
+def test_create_analytics_table_partitioning():
+    """Library defaults and explicit partition columns produce Hive-style directories"""
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        partitioner = _create_partitioner(Path(tmp_dir))
+
+        # analytics/amazon_athena defaults to partitioning by account
+        result = partitioner.create_analytics_table("analytics/amazon_athena.sql")
+        print(f"   amazon_athena: {result}")
+        assert result["status"] == "success"
+        assert result["partitions"] == len(ACCOUNTS)
+        assert result["rows"] == len(ACCOUNTS) * 2
+
+        table_path = Path(result["output_path"])
+        partition_dirs = sorted(path.name for path in table_path.iterdir())
+        assert partition_dirs == [f"line_item_usage_account_id={account}" for account in ACCOUNTS]
+
+        table = pl.read_parquet(table_path, hive_partitioning=True)
+        assert table.height == result["rows"]
+        assert table["cost"].sum() == sum(range(90)) * 2
+
+        # Rows inside each partition follow the '-- Partitioning:' sort column
+        for partition_file in table_path.rglob("*.parquet"):
+            billing_periods = pl.read_parquet(partition_file)["billing_period"]
+            assert billing_periods.is_sorted()
+
+        # Explicit partition columns override the default and replace earlier output
+        result = partitioner.create_analytics_table(
+            "analytics/amazon_athena.sql", partition_columns=["billing_period"]
+        )
+        assert result["partitions"] == 2
+        assert sorted(path.name for path in table_path.iterdir()) == [
+            "billing_period=2025-01", "billing_period=2025-02"
+        ]
+
+        # Queries without a partition strategy fall back to a single parquet file
+        result = partitioner.create_analytics_table("analytics/service_costs.sql")
+        assert result["status"] == "success"
+        assert result["output_path"].endswith("service_costs.parquet")
+
+        # Unknown partition columns are reported as errors
+        result = partitioner.create_analytics_table(
+            "analytics/service_costs.sql", partition_columns=["missing_column"]
+        )
+        assert result["status"] == "error"
+
+    print("Partitioned analytics tables verified")
+
+
+def test_export_source_subset():
+    """Only rows matching the predicate are written"""
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        partitioner = _create_partitioner(Path(tmp_dir))
+
+        result = partitioner.export_source_subset(
+            "s3_rows", pl.col("product_servicecode") == "AmazonS3"
+        )
+        print(f"   export: {result}")
+        assert result["status"] == "success"
+        assert result["rows"] == 60
+
+        subset = pl.read_parquet(result["output_path"])
+        assert subset["product_servicecode"].unique().to_list() == ["AmazonS3"]
+
+        result = partitioner.export_source_subset("no_rows", pl.col("line_item_unblended_cost") < 0)
+        assert result["status"] == "success"
+        assert result["rows"] == 0
+
+    print("Source subset export verified")
+
+
+if __name__ == "__main__":
+    try:
+        test_run_sql_files_parallel_and_sequential()
+        test_run_sql_file_cache_skip()
+        test_run_sql_file_cache_date_range()
+        test_create_analytics_table_partitioning()
+        test_export_source_subset()
+        print("\n✅ Test 17: Data Partitioner - PASSED")
+    except Exception as e:
+        print(f"\n💥 Test 17: Data Partitioner - ERROR: {e}")
+        import traceback
+        traceback.print_exc()
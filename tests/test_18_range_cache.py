@@ -0,0 +1,147 @@
+"""
+Test 18: Byte-Range Cache
+=========================
+
+This test exercises the remote parquet byte-range cache: hits and misses,
+LRU eviction within the byte budget, and invalidation when an object is
+overwritten in place with the same size.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import local infralyzer module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pyarrow.fs as pa_fs
+
+from infralyzer.engine.range_cache import RangeCache, CachingFileSystemHandler
+
+
+def _cached_filesystem(cache: RangeCache) -> pa_fs.PyFileSystem:
+    """Local filesystem routed through the range cache."""
+    return pa_fs.PyFileSystem(CachingFileSystemHandler(pa_fs.LocalFileSystem(), cache))
+
+
+def test_range_cache_hit_and_miss():
+    """Repeated reads of the same range are served from the cache"""
+
+    print("Test 18: Byte-Range Cache")
+    print("=" * 50)
+
+    cache = RangeCache(max_bytes=1024)
+    key = ("bucket/data.parquet", 100, "v1", 0, 10)
+
+    assert cache.get(key) is None
+    assert cache.misses == 1
+
+    cache.put(key, b"0123456789")
+    assert cache.get(key) == b"0123456789"
+    assert cache.hits == 1
+    assert cache.current_bytes == 10
+
+    # Any change in the key, including the object version, is a miss
+    assert cache.get(("bucket/data.parquet", 100, "v2", 0, 10)) is None
+    assert cache.get(("bucket/data.parquet", 100, "v1", 10, 10)) is None
+    assert cache.misses == 3
+
+    print("Hit and miss accounting verified")
+
+
+def test_range_cache_lru_eviction():
+    """Least recently used ranges are evicted to stay within the byte budget"""
+
+    cache = RangeCache(max_bytes=30)
+    keys = [("data.parquet", 100, "v1", offset, 10) for offset in (0, 10, 20)]
+    for key in keys:
+        cache.put(key, b"x" * 10)
+    assert cache.current_bytes == 30
+
+    # Touch the oldest range so the second one becomes least recently used
+    assert cache.get(keys[0]) is not None
+
+    new_key = ("data.parquet", 100, "v1", 30, 10)
+    cache.put(new_key, b"y" * 10)
+    assert cache.current_bytes == 30
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+    assert cache.get(new_key) == b"y" * 10
+
+    # Ranges larger than the whole budget are never cached
+    cache.put(("data.parquet", 100, "v1", 40, 31), b"z" * 31)
+    assert cache.current_bytes == 30
+
+    cache.clear()
+    assert cache.current_bytes == 0
+    assert cache.get(new_key) is None
+
+    print("LRU eviction verified")
+
+
+def test_caching_filesystem_reads():
+    """Reads through the filesystem handler populate and reuse the cache"""
+
+    cache = RangeCache(max_bytes=1024 * 1024)
+    filesystem = _cached_filesystem(cache)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "data.bin")
+        with open(path, "wb") as file:
+            file.write(bytes(range(256)) * 4)
+
+        with filesystem.open_input_file(path) as handle:
+            handle.seek(100)
+            first_read = handle.read(50)
+        assert first_read == (bytes(range(256)) * 4)[100:150]
+        assert (cache.hits, cache.misses) == (0, 1)
+
+        with filesystem.open_input_file(path) as handle:
+            handle.seek(100)
+            assert handle.read(50) == first_read
+            # The position advances past a cached read as it would for a real one
+            assert handle.tell() == 150
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    print("Filesystem handler reads verified")
+
+
+def test_caching_filesystem_invalidation():
+    """Overwriting an object with the same size does not serve stale ranges"""
+
+    cache = RangeCache(max_bytes=1024 * 1024)
+    filesystem = _cached_filesystem(cache)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "data.bin")
+        with open(path, "wb") as file:
+            file.write(b"a" * 64)
+
+        with filesystem.open_input_file(path) as handle:
+            assert handle.read(64) == b"a" * 64
+
+        with open(path, "wb") as file:
+            file.write(b"b" * 64)
+        # Make the overwrite visible even on filesystems with coarse timestamps
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        with filesystem.open_input_file(path) as handle:
+            assert handle.read(64) == b"b" * 64
+        assert cache.hits == 0
+
+    print("Overwrite invalidation verified")
+
+
+if __name__ == "__main__":
+    try:
+        test_range_cache_hit_and_miss()
+        test_range_cache_lru_eviction()
+        test_caching_filesystem_reads()
+        test_caching_filesystem_invalidation()
+        print("\n✅ Test 18: Byte-Range Cache - PASSED")
+    except Exception as e:
+        print(f"\n💥 Test 18: Byte-Range Cache - ERROR: {e}")
+        import traceback
+        traceback.print_exc()